@@ -5,16 +5,17 @@
 
 use bson::{doc, oid::ObjectId, Bson, Document as BsonDocument, Decimal128, Binary};
 use bson::spec::BinarySubtype;
-use bson::raw::RawDocumentBuf;
+use bson::raw::{RawDocument, RawDocumentBuf};
 use futures::TryStreamExt;
 use mongodb::IndexModel;
 use mongodb::options::IndexOptions;
-use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::exceptions::{PyKeyError, PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyDict, PyList};
+use pyo3::types::{PyBytes, PyDict, PyFrozenSet, PyList};
 use pyo3::conversion::IntoPyObject;
 use pyo3_async_runtimes::tokio::future_into_py;
 use rayon::prelude::*;
+use std::collections::HashMap;
 use std::sync::Arc;
 use std::str::FromStr;
 
@@ -23,7 +24,7 @@ use data_bridge_mongodb::Connection;
 // Import security modules
 use crate::validation::ValidatedCollectionName;
 use crate::config::{get_config, ObjectIdConversionMode, SecurityConfig};
-use crate::error_handling::sanitize_mongodb_error;
+use crate::error_handling::{sanitize_error_message, sanitize_mongodb_error};
 
 // Import GIL-free conversion functions (Feature 201)
 use crate::conversion::{
@@ -40,6 +41,9 @@ static CONNECTION: StdRwLock<Option<Arc<Connection>>> = StdRwLock::new(None);
 /// Below this threshold, sequential processing is faster due to parallelization overhead
 const PARALLEL_THRESHOLD: usize = 50;
 
+/// Maximum number of operations an unordered bulk_write keeps in flight
+const BULK_WRITE_CONCURRENCY: usize = 16;
+
 /// Index information returned by list_indexes
 #[derive(Debug, Clone)]
 struct IndexInfo {
@@ -172,6 +176,10 @@ struct BulkWriteResultWrapper {
     deleted_count: i64,
     upserted_count: i64,
     upserted_ids: std::collections::HashMap<i64, String>,
+    /// Indices of update_one/replace_one operations that matched no document
+    unmatched_indices: Vec<i64>,
+    /// (index, sanitized message) of the failed operations (unordered mode)
+    errors: Vec<(i64, String)>,
 }
 
 impl<'py> IntoPyObject<'py> for BulkWriteResultWrapper {
@@ -193,6 +201,13 @@ impl<'py> IntoPyObject<'py> for BulkWriteResultWrapper {
             upserted_dict.set_item(idx, id)?;
         }
         dict.set_item("upserted_ids", upserted_dict)?;
+        dict.set_item("unmatched_indices", self.unmatched_indices)?;
+
+        let errors_dict = PyDict::new(py);
+        for (idx, message) in self.errors {
+            errors_dict.set_item(idx, message)?;
+        }
+        dict.set_item("errors", errors_dict)?;
 
         Ok(dict)
     }
@@ -378,6 +393,80 @@ fn available_features() -> Vec<String> {
     vec!["mongodb".to_string()]
 }
 
+/// Decode a single top-level field from a raw BSON document
+///
+/// Used by lazily decoded documents; only the requested element is
+/// converted to Python.
+///
+/// Args:
+///     raw: BSON document bytes
+///     key: Top-level field name
+///     embedded: Layout entry `(loader, many, nested_layout)` when the field
+///         holds EmbeddedDocument values
+///
+/// Raises:
+///     KeyError: If the field is not present
+#[pyfunction]
+#[pyo3(signature = (raw, key, embedded=None))]
+fn decode_field(
+    py: Python<'_>,
+    raw: &[u8],
+    key: &str,
+    embedded: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    let doc = RawDocument::from_bytes(raw)
+        .map_err(|e| PyValueError::new_err(format!("Invalid BSON document: {}", e)))?;
+    match doc.get(key) {
+        Ok(Some(value)) => match embedded {
+            Some(spec) if !spec.is_none() => EmbeddedField::parse(spec)?.from_raw(value),
+            _ => raw_bson_to_py(py, value),
+        },
+        Ok(None) => Err(PyKeyError::new_err(key.to_string())),
+        Err(e) => Err(PyValueError::new_err(format!("Invalid BSON document: {}", e))),
+    }
+}
+
+/// Decode every top-level field (except `_id`) of a raw BSON document
+///
+/// Args:
+///     raw: BSON document bytes
+///     layout: Embedded-document layout of the model, or None
+///
+/// Returns:
+///     Dict of field name to value
+#[pyfunction]
+#[pyo3(signature = (raw, layout=None))]
+fn decode_document(
+    py: Python<'_>,
+    raw: &[u8],
+    layout: Option<&Bound<'_, PyAny>>,
+) -> PyResult<PyObject> {
+    let doc = RawDocument::from_bytes(raw)
+        .map_err(|e| PyValueError::new_err(format!("Invalid BSON document: {}", e)))?;
+    let layout = match layout {
+        Some(layout) => parse_embedded_layout(layout)?,
+        None => HashMap::new(),
+    };
+    let py_dict = PyDict::new(py);
+    for result in doc.iter_elements() {
+        let element = result
+            .map_err(|e| PyValueError::new_err(format!("Invalid BSON document: {}", e)))?;
+        let key = element.key();
+        if key == "_id" {
+            continue;
+        }
+        let value = element
+            .value()
+            .map_err(|e| PyValueError::new_err(format!("Invalid BSON document: {}", e)))?;
+        let py_value = match layout.get(key) {
+            Some(field) => field.from_raw(value)?,
+            None => raw_bson_to_py(py, value)?,
+        };
+        py_dict.set_item(key, py_value)?;
+    }
+    Ok(py_dict.into_any().unbind())
+}
+
 /// Extract Python value to intermediate representation (call with GIL held)
 fn extract_py_value(py: Python<'_>, value: &Bound<'_, PyAny>, config: &SecurityConfig) -> PyResult<ExtractedValue> {
     // None
@@ -620,6 +709,31 @@ fn extracted_to_py(py: Python<'_>, value: ExtractedValue) -> PyResult<PyObject>
     }
 }
 
+/// String form of a decoded `_id` value (see raw_id_to_string)
+fn bson_id_to_string(id: &Bson) -> String {
+    match id {
+        Bson::ObjectId(oid) => oid.to_hex(),
+        Bson::String(s) => s.clone(),
+        Bson::Int32(n) => n.to_string(),
+        Bson::Int64(n) => n.to_string(),
+        other => other.to_string(),
+    }
+}
+
+/// String form of a raw `_id` value, as `Document._id` holds it
+///
+/// ObjectIds become their hex string; any other id type becomes `str()` of
+/// its Python value (matching `Document._from_db`).
+fn raw_id_to_string(py: Python<'_>, raw_id: bson::raw::RawBsonRef<'_>) -> PyResult<String> {
+    use bson::raw::RawBsonRef;
+
+    match raw_id {
+        RawBsonRef::ObjectId(oid) => Ok(oid.to_hex()),
+        RawBsonRef::String(s) => Ok(s.to_string()),
+        other => Ok(raw_bson_to_py(py, other)?.bind(py).str()?.to_string()),
+    }
+}
+
 /// Convert raw BSON value directly to Python (skip intermediate representation)
 fn raw_bson_to_py(py: Python<'_>, raw_bson: bson::raw::RawBsonRef<'_>) -> PyResult<PyObject> {
     use bson::raw::RawBsonRef;
@@ -667,6 +781,575 @@ fn raw_bson_to_py(py: Python<'_>, raw_bson: bson::raw::RawBsonRef<'_>) -> PyResu
     }
 }
 
+/// Embedded-document fields of a model, by field name
+type EmbeddedLayout<'py> = HashMap<String, EmbeddedField<'py>>;
+
+/// How to build the EmbeddedDocument value(s) of one field
+///
+/// Parsed from the Python layout produced by
+/// `type_extraction.extract_embedded_layout`, where each field maps to
+/// `(loader, many, nested_layout)`: `loader(dict)` builds one instance,
+/// `many` marks `List[EmbeddedDocument]` fields and `nested_layout`
+/// describes embedded fields of the embedded class itself.
+struct EmbeddedField<'py> {
+    loader: Bound<'py, PyAny>,
+    many: bool,
+    layout: EmbeddedLayout<'py>,
+}
+
+/// Parse a Python embedded layout dict (None or empty gives an empty layout)
+fn parse_embedded_layout<'py>(layout: &Bound<'py, PyAny>) -> PyResult<EmbeddedLayout<'py>> {
+    let mut fields = HashMap::new();
+    if layout.is_none() {
+        return Ok(fields);
+    }
+    for (name, spec) in layout.downcast::<PyDict>()?.iter() {
+        fields.insert(name.extract::<String>()?, EmbeddedField::parse(&spec)?);
+    }
+    Ok(fields)
+}
+
+impl<'py> EmbeddedField<'py> {
+    fn parse(spec: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let (loader, many, nested): (Bound<'py, PyAny>, bool, Bound<'py, PyAny>) = spec.extract()?;
+        Ok(Self { loader, many, layout: parse_embedded_layout(&nested)? })
+    }
+
+    /// Convert a raw BSON field value, building EmbeddedDocument instances
+    ///
+    /// Values that do not have the expected shape (null, scalars, a
+    /// document where a list is expected) are converted unchanged.
+    fn from_raw(&self, value: bson::raw::RawBsonRef<'_>) -> PyResult<PyObject> {
+        use bson::raw::RawBsonRef;
+
+        let py = self.loader.py();
+        match value {
+            RawBsonRef::Document(doc) if !self.many => self.instance_from_raw(doc),
+            RawBsonRef::Array(arr) if self.many => {
+                let py_list = PyList::empty(py);
+                for result in arr.into_iter() {
+                    if let Ok(item) = result {
+                        match item {
+                            RawBsonRef::Document(doc) => py_list.append(self.instance_from_raw(doc)?)?,
+                            other => py_list.append(raw_bson_to_py(py, other)?)?,
+                        }
+                    }
+                }
+                Ok(py_list.into())
+            }
+            other => raw_bson_to_py(py, other),
+        }
+    }
+
+    fn instance_from_raw(&self, doc: &RawDocument) -> PyResult<PyObject> {
+        let py = self.loader.py();
+        let py_dict = PyDict::new(py);
+        for result in doc.iter_elements() {
+            if let Ok(element) = result {
+                let key = element.key();
+                if let Ok(value) = element.value() {
+                    let py_value = match self.layout.get(key) {
+                        Some(field) => field.from_raw(value)?,
+                        None => raw_bson_to_py(py, value)?,
+                    };
+                    py_dict.set_item(key, py_value)?;
+                }
+            }
+        }
+        Ok(self.loader.call1((py_dict,))?.unbind())
+    }
+
+    /// Convert an already decoded Python field value
+    fn from_py(&self, value: Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+        if !self.many {
+            return self.instance_from_py(value);
+        }
+        if let Ok(items) = value.downcast::<PyList>() {
+            let py_list = PyList::empty(value.py());
+            for item in items.iter() {
+                py_list.append(self.instance_from_py(item)?)?;
+            }
+            return Ok(py_list.into_any());
+        }
+        Ok(value)
+    }
+
+    fn instance_from_py(&self, value: Bound<'py, PyAny>) -> PyResult<Bound<'py, PyAny>> {
+        if let Ok(py_dict) = value.downcast::<PyDict>() {
+            apply_embedded_layout(&self.layout, py_dict)?;
+            return self.loader.call1((py_dict,));
+        }
+        Ok(value)
+    }
+}
+
+/// Replace embedded-document dicts in a decoded `_data` dict with instances
+fn apply_embedded_layout<'py>(layout: &EmbeddedLayout<'py>, py_dict: &Bound<'py, PyDict>) -> PyResult<()> {
+    for (name, field) in layout {
+        if let Some(value) = py_dict.get_item(name)? {
+            py_dict.set_item(name, field.from_py(value)?)?;
+        }
+    }
+    Ok(())
+}
+
+/// Constructor for one Document class
+///
+/// Holds the class, its compiled loader and its embedded-document layout
+/// (both the parsed form and the Python dict, which lazy documents keep to
+/// decode embedded fields on access).
+struct InstanceTarget<'py> {
+    class: Bound<'py, PyAny>,
+    loader: Option<Bound<'py, PyAny>>,
+    embedded: EmbeddedLayout<'py>,
+    embedded_spec: Option<Bound<'py, PyAny>>,
+}
+
+impl<'py> InstanceTarget<'py> {
+    fn new(class: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let py = class.py();
+        let loader = class
+            .getattr(pyo3::intern!(py, "_loader"))
+            .ok()
+            .filter(|loader| !loader.is_none());
+
+        let embedded_spec = match class.getattr(pyo3::intern!(py, "_embedded_layout")) {
+            Ok(layout_fn) => Some(layout_fn.call0()?),
+            Err(_) => None,
+        };
+        let embedded_spec = match embedded_spec {
+            Some(spec) if !spec.is_none() && spec.is_truthy()? => Some(spec),
+            _ => None,
+        };
+        let embedded = match &embedded_spec {
+            Some(spec) => parse_embedded_layout(spec)?,
+            None => HashMap::new(),
+        };
+
+        Ok(Self { class: class.clone(), loader, embedded, embedded_spec })
+    }
+}
+
+/// Turns query results into typed Document instances (GIL held)
+///
+/// `DocumentMeta` compiles a `_loader(_id, data)` for every Document class
+/// that allocates the instance and fills `_id`, `_data`, `_revision_id` and
+/// the state fields in one step, without running `__init__`. Loaders are
+/// looked up once per query; classes without one fall back to calling the
+/// class and setting `_id`/`_data` afterwards.
+///
+/// For inheritance hierarchies, `class_map` (`_class_id` -> class) selects
+/// the concrete subclass of each document while it is decoded; documents
+/// with an unknown or missing `_class_id` use the queried class.
+///
+/// Each class's `_embedded_layout()` is also read once per query, so
+/// `EmbeddedDocument` and `List[EmbeddedDocument]` fields are built as
+/// instances while BSON is decoded instead of in `Document._from_db`.
+///
+/// When the query used a projection, `partial` marks each instance with the
+/// set of fields that were actually loaded. When `lazy_class` is given
+/// (models with `Settings.lazy_decode = True`), no field is decoded here:
+/// `_data` becomes `lazy_class(raw_bytes, keys, embedded_layout)` and each field is decoded
+/// on first access.
+struct InstanceBuilder<'py> {
+    py: Python<'py>,
+    default: InstanceTarget<'py>,
+    by_class_id: HashMap<String, InstanceTarget<'py>>,
+    lazy_class: Option<Bound<'py, PyAny>>,
+    partial: bool,
+}
+
+impl<'py> InstanceBuilder<'py> {
+    fn new(
+        doc_class: &Bound<'py, PyAny>,
+        class_map: Option<&Bound<'py, PyDict>>,
+        lazy_class: Option<&Bound<'py, PyAny>>,
+        partial: bool,
+    ) -> PyResult<Self> {
+        let mut by_class_id = HashMap::new();
+        if let Some(class_map) = class_map {
+            for (class_id, class) in class_map.iter() {
+                by_class_id.insert(class_id.extract::<String>()?, InstanceTarget::new(&class)?);
+            }
+        }
+
+        Ok(Self {
+            py: doc_class.py(),
+            default: InstanceTarget::new(doc_class)?,
+            by_class_id,
+            lazy_class: lazy_class.cloned(),
+            partial,
+        })
+    }
+
+    /// Pick the constructor for a document's `_class_id`
+    fn target(&self, class_id: Option<&str>) -> &InstanceTarget<'py> {
+        class_id
+            .and_then(|class_id| self.by_class_id.get(class_id))
+            .unwrap_or(&self.default)
+    }
+
+    /// Build an instance from a raw BSON document
+    ///
+    /// Every element is converted straight from raw BSON into `_data`
+    /// (or handed to `lazy_class` undecoded). EmbeddedDocument fields of the
+    /// target class are built as instances on the way.
+    fn from_raw(&self, raw_doc: &RawDocument) -> PyResult<PyObject> {
+        if let Some(lazy_class) = &self.lazy_class {
+            return self.from_raw_lazy(lazy_class, raw_doc);
+        }
+
+        let py = self.py;
+        let py_dict = PyDict::new(py);
+        let mut id_str: Option<String> = None;
+
+        // The target decides the embedded layout, so resolve it up front
+        let class_id = if self.by_class_id.is_empty() {
+            None
+        } else {
+            raw_doc.get_str("_class_id").ok()
+        };
+        let target = self.target(class_id);
+
+        for result in raw_doc.iter_elements() {
+            if let Ok(element) = result {
+                let key = element.key();
+                if let Ok(raw_bson) = element.value() {
+                    if key == "_id" {
+                        // Extract _id separately
+                        id_str = Some(raw_id_to_string(py, raw_bson)?);
+                    } else if key == "_class_id" {
+                        // Type discriminator, not stored in _data
+                        continue;
+                    } else {
+                        let py_value = match target.embedded.get(key) {
+                            Some(field) => field.from_raw(raw_bson)?,
+                            None => raw_bson_to_py(py, raw_bson)?,
+                        };
+                        py_dict.set_item(key, py_value)?;
+                    }
+                }
+            }
+        }
+
+        let loaded = if self.partial { Some(py_dict.keys()) } else { None };
+        self.build(target, id_str, py_dict.into_any(), loaded)
+    }
+
+    /// Build an instance whose `_data` decodes fields on demand
+    ///
+    /// Only the element keys (plus `_id` and `_class_id`) are read here; the
+    /// raw BSON bytes are handed to `lazy_class` together with the key list.
+    fn from_raw_lazy(&self, lazy_class: &Bound<'py, PyAny>, raw_doc: &RawDocument) -> PyResult<PyObject> {
+        let py = self.py;
+        let keys = PyList::empty(py);
+        let mut id_str: Option<String> = None;
+        let mut class_id: Option<&str> = None;
+
+        for result in raw_doc.iter_elements() {
+            if let Ok(element) = result {
+                let key = element.key();
+                if key == "_id" {
+                    if let Ok(raw_id) = element.value() {
+                        id_str = Some(raw_id_to_string(py, raw_id)?);
+                    }
+                } else if key == "_class_id" {
+                    if let Ok(bson::raw::RawBsonRef::String(s)) = element.value() {
+                        class_id = Some(s);
+                    }
+                } else {
+                    keys.append(key)?;
+                }
+            }
+        }
+
+        let target = self.target(class_id);
+        let raw_bytes = PyBytes::new(py, raw_doc.as_bytes());
+        let lazy_data = lazy_class.call1((raw_bytes, &keys, &target.embedded_spec))?;
+        let loaded = if self.partial { Some(keys) } else { None };
+
+        self.build(target, id_str, lazy_data, loaded)
+    }
+
+    /// Build an instance from an already converted `_data` dict
+    fn from_dict(&self, id_str: Option<String>, py_dict: Bound<'py, PyDict>) -> PyResult<PyObject> {
+        let class_id: Option<String> = match py_dict.get_item("_class_id")? {
+            Some(value) => {
+                py_dict.del_item("_class_id")?;
+                value.extract().ok()
+            }
+            None => None,
+        };
+
+        let target = self.target(class_id.as_deref());
+        apply_embedded_layout(&target.embedded, &py_dict)?;
+
+        let loaded = if self.partial { Some(py_dict.keys()) } else { None };
+        self.build(target, id_str, py_dict.into_any(), loaded)
+    }
+
+    fn build(
+        &self,
+        target: &InstanceTarget<'py>,
+        id_str: Option<String>,
+        data: Bound<'py, PyAny>,
+        loaded: Option<Bound<'py, PyList>>,
+    ) -> PyResult<PyObject> {
+        let instance = match &target.loader {
+            Some(loader) => loader.call1((id_str, data))?,
+            None => {
+                // Create instance
+                let kwargs = PyDict::new(self.py);
+                let instance = target.class.call((), Some(&kwargs))?;
+
+                // Set attributes
+                instance.setattr("_id", id_str)?;
+                instance.setattr("_data", data)?;
+                instance
+            }
+        };
+
+        if let Some(keys) = loaded {
+            mark_partial(self.py, &instance, &keys)?;
+        }
+
+        Ok(instance.unbind())
+    }
+}
+
+/// Record which fields a projected query loaded into a Document instance
+///
+/// `Document.save()` and `Document.replace()` use `_loaded_fields` to avoid
+/// overwriting fields that were never fetched.
+fn mark_partial(
+    py: Python<'_>,
+    instance: &Bound<'_, PyAny>,
+    keys: &Bound<'_, PyList>,
+) -> PyResult<()> {
+    let loaded = PyFrozenSet::new(py, keys.iter())?;
+    instance.setattr("_loaded_fields", loaded)
+}
+
+/// A single decoded value of a columnar result
+#[derive(Debug, Clone)]
+enum ColumnCell {
+    Missing,
+    Double(f64),
+    Int(i64),
+    Bool(bool),
+    DateTimeMillis(i64),
+    String(String),
+    Other(bson::RawBson),
+}
+
+/// Typed buffer for one column of a columnar result
+///
+/// Numeric, boolean and datetime columns are packed into contiguous native
+/// byte buffers that NumPy / `array.array` can wrap without copying each
+/// value; anything else stays as cells and becomes a Python list.
+enum ColumnBuffer {
+    Float64(Vec<u8>),
+    Int64(Vec<u8>),
+    Bool(Vec<u8>),
+    DateTimeMillis(Vec<u8>),
+    Object(Vec<ColumnCell>),
+}
+
+/// A decoded column: typed values plus a null mask (1 = missing/null)
+struct DecodedColumn {
+    values: ColumnBuffer,
+    mask: Option<Vec<u8>>,
+}
+
+/// Look up a (possibly dotted) field path in a raw BSON document
+fn raw_lookup<'a>(doc: &'a RawDocument, path: &str) -> Option<bson::raw::RawBsonRef<'a>> {
+    use bson::raw::RawBsonRef;
+
+    let mut parts = path.split('.');
+    let mut current = doc.get(parts.next()?).ok()??;
+    for part in parts {
+        current = match current {
+            RawBsonRef::Document(inner) => inner.get(part).ok()??,
+            RawBsonRef::Array(arr) => arr.get(part.parse::<usize>().ok()?).ok()??,
+            _ => return None,
+        };
+    }
+    Some(current)
+}
+
+/// Decode one field of a raw document into a column cell (no GIL needed)
+fn raw_to_cell(doc: &RawDocument, path: &str) -> ColumnCell {
+    use bson::raw::RawBsonRef;
+
+    match raw_lookup(doc, path) {
+        None | Some(RawBsonRef::Null) | Some(RawBsonRef::Undefined) => ColumnCell::Missing,
+        Some(RawBsonRef::Double(f)) => ColumnCell::Double(f),
+        Some(RawBsonRef::Int32(i)) => ColumnCell::Int(i as i64),
+        Some(RawBsonRef::Int64(i)) => ColumnCell::Int(i),
+        Some(RawBsonRef::Boolean(b)) => ColumnCell::Bool(b),
+        Some(RawBsonRef::DateTime(dt)) => ColumnCell::DateTimeMillis(dt.timestamp_millis()),
+        Some(RawBsonRef::String(s)) => ColumnCell::String(s.to_string()),
+        Some(RawBsonRef::ObjectId(oid)) => ColumnCell::String(oid.to_hex()),
+        Some(other) => ColumnCell::Other(other.to_raw_bson()),
+    }
+}
+
+/// Decode the requested fields of every document into per-field cells
+///
+/// Large result sets are split into chunks decoded in parallel with rayon
+/// (same PARALLEL_THRESHOLD as the row-oriented paths).
+fn decode_column_cells(raw_docs: &[RawDocumentBuf], fields: &[String]) -> Vec<Vec<ColumnCell>> {
+    let decode_chunk = |chunk: &[RawDocumentBuf]| -> Vec<Vec<ColumnCell>> {
+        fields
+            .iter()
+            .map(|field| chunk.iter().map(|doc| raw_to_cell(doc, field)).collect())
+            .collect()
+    };
+
+    if raw_docs.len() < PARALLEL_THRESHOLD {
+        return decode_chunk(raw_docs);
+    }
+
+    let chunk_size = (raw_docs.len() / rayon::current_num_threads().max(1)).max(PARALLEL_THRESHOLD);
+    let chunks: Vec<Vec<Vec<ColumnCell>>> = raw_docs.par_chunks(chunk_size).map(decode_chunk).collect();
+
+    let mut columns: Vec<Vec<ColumnCell>> = fields
+        .iter()
+        .map(|_| Vec::with_capacity(raw_docs.len()))
+        .collect();
+    for chunk in chunks {
+        for (column, cells) in columns.iter_mut().zip(chunk) {
+            column.extend(cells);
+        }
+    }
+    columns
+}
+
+/// Pick a column type from its cells and pack them into a typed buffer
+///
+/// Ints and doubles widen to float64; any other mix of kinds (or strings,
+/// documents, arrays, ...) falls back to an object column.
+fn build_column(cells: Vec<ColumnCell>) -> DecodedColumn {
+    let (mut doubles, mut ints, mut bools, mut dates, mut objects, mut missing) =
+        (false, false, false, false, false, false);
+    for cell in &cells {
+        match cell {
+            ColumnCell::Missing => missing = true,
+            ColumnCell::Double(_) => doubles = true,
+            ColumnCell::Int(_) => ints = true,
+            ColumnCell::Bool(_) => bools = true,
+            ColumnCell::DateTimeMillis(_) => dates = true,
+            ColumnCell::String(_) | ColumnCell::Other(_) => objects = true,
+        }
+    }
+
+    let numeric = doubles || ints;
+    let kinds = [numeric, bools, dates].iter().filter(|k| **k).count();
+    let mask = if missing {
+        Some(cells.iter().map(|c| matches!(c, ColumnCell::Missing) as u8).collect())
+    } else {
+        None
+    };
+
+    if objects || kinds > 1 {
+        return DecodedColumn { values: ColumnBuffer::Object(cells), mask };
+    }
+
+    let values = if bools {
+        ColumnBuffer::Bool(
+            cells
+                .iter()
+                .map(|c| matches!(c, ColumnCell::Bool(true)) as u8)
+                .collect(),
+        )
+    } else if dates {
+        let mut buf = Vec::with_capacity(cells.len() * 8);
+        for cell in &cells {
+            let millis = match cell {
+                ColumnCell::DateTimeMillis(ms) => *ms,
+                _ => 0,
+            };
+            buf.extend_from_slice(&millis.to_ne_bytes());
+        }
+        ColumnBuffer::DateTimeMillis(buf)
+    } else if ints && !doubles {
+        let mut buf = Vec::with_capacity(cells.len() * 8);
+        for cell in &cells {
+            let value = match cell {
+                ColumnCell::Int(i) => *i,
+                _ => 0,
+            };
+            buf.extend_from_slice(&value.to_ne_bytes());
+        }
+        ColumnBuffer::Int64(buf)
+    } else {
+        // float64 (also used for all-missing columns, filled with NaN)
+        let mut buf = Vec::with_capacity(cells.len() * 8);
+        for cell in &cells {
+            let value = match cell {
+                ColumnCell::Double(f) => *f,
+                ColumnCell::Int(i) => *i as f64,
+                _ => f64::NAN,
+            };
+            buf.extend_from_slice(&value.to_ne_bytes());
+        }
+        ColumnBuffer::Float64(buf)
+    };
+
+    DecodedColumn { values, mask }
+}
+
+/// Decode raw documents into typed columns (pure Rust, no GIL needed)
+fn raw_docs_to_columns(raw_docs: &[RawDocumentBuf], fields: &[String]) -> Vec<DecodedColumn> {
+    decode_column_cells(raw_docs, fields)
+        .into_iter()
+        .map(build_column)
+        .collect()
+}
+
+/// Convert decoded columns to a Python dict of `(kind, values, mask)` tuples
+///
+/// `kind` is one of "float64", "int64", "bool", "datetime64[ms]" (values are
+/// native-endian bytes) or "object" (values is a list). `mask` is bytes with
+/// 1 for missing/null entries, or None when nothing is missing.
+fn columns_to_py(py: Python<'_>, fields: &[String], columns: Vec<DecodedColumn>) -> PyResult<PyObject> {
+    let result = PyDict::new(py);
+    for (field, column) in fields.iter().zip(columns) {
+        let (kind, values): (&str, PyObject) = match column.values {
+            ColumnBuffer::Float64(buf) => ("float64", PyBytes::new(py, &buf).into_any().unbind()),
+            ColumnBuffer::Int64(buf) => ("int64", PyBytes::new(py, &buf).into_any().unbind()),
+            ColumnBuffer::Bool(buf) => ("bool", PyBytes::new(py, &buf).into_any().unbind()),
+            ColumnBuffer::DateTimeMillis(buf) => {
+                ("datetime64[ms]", PyBytes::new(py, &buf).into_any().unbind())
+            }
+            ColumnBuffer::Object(cells) => {
+                let list = PyList::empty(py);
+                for cell in cells {
+                    let value = match cell {
+                        ColumnCell::Missing => py.None(),
+                        ColumnCell::Double(f) => f.into_pyobject(py)?.into_any().unbind(),
+                        ColumnCell::Int(i) => i.into_pyobject(py)?.into_any().unbind(),
+                        ColumnCell::Bool(b) => b.into_pyobject(py)?.to_owned().into_any().unbind(),
+                        ColumnCell::DateTimeMillis(ms) => {
+                            raw_bson_to_py(py, bson::raw::RawBsonRef::DateTime(bson::DateTime::from_millis(ms)))?
+                        }
+                        ColumnCell::String(s) => s.into_pyobject(py)?.into_any().unbind(),
+                        ColumnCell::Other(raw) => raw_bson_to_py(py, raw.as_raw_bson_ref())?,
+                    };
+                    list.append(value)?;
+                }
+                ("object", list.into_any().unbind())
+            }
+        };
+        let mask: PyObject = match column.mask {
+            Some(mask) => PyBytes::new(py, &mask).into_any().unbind(),
+            None => py.None(),
+        };
+        result.set_item(field, (kind, values, mask))?;
+    }
+    Ok(result.into_any().unbind())
+}
+
 /// Extract dict fields to intermediate representation
 fn extract_dict_fields(py: Python<'_>, dict: &Bound<'_, PyDict>, config: &SecurityConfig) -> PyResult<Vec<(String, ExtractedValue)>> {
     let mut fields = Vec::with_capacity(dict.len());
@@ -738,6 +1421,64 @@ fn extracted_bulk_op_to_tuple(op: ExtractedBulkOp) -> (String, BsonDocument, Opt
     }
 }
 
+/// Counts produced by one bulk_write operation
+#[derive(Debug, Default)]
+struct BulkOpOutcome {
+    inserted: i64,
+    matched: i64,
+    modified: i64,
+    deleted: i64,
+    upserted_id: Option<Bson>,
+    /// update_one/replace_one that matched no document (and upserted none)
+    unmatched: bool,
+}
+
+/// Run one bulk_write operation (as produced by extracted_bulk_op_to_tuple)
+async fn run_bulk_op(
+    collection: &mongodb::Collection<BsonDocument>,
+    (op_type, doc1, doc2, upsert): (String, BsonDocument, Option<BsonDocument>, bool),
+) -> mongodb::error::Result<BulkOpOutcome> {
+    let mut outcome = BulkOpOutcome::default();
+    match op_type.as_str() {
+        "insert_one" => {
+            collection.insert_one(doc1).await?;
+            outcome.inserted = 1;
+        }
+        "update_one" | "update_many" => {
+            let options = mongodb::options::UpdateOptions::builder()
+                .upsert(upsert)
+                .build();
+            let result = if op_type == "update_one" {
+                collection.update_one(doc1, doc2.unwrap()).with_options(options).await?
+            } else {
+                collection.update_many(doc1, doc2.unwrap()).with_options(options).await?
+            };
+            outcome.unmatched = op_type == "update_one" && result.matched_count == 0 && result.upserted_id.is_none();
+            outcome.matched = result.matched_count as i64;
+            outcome.modified = result.modified_count as i64;
+            outcome.upserted_id = result.upserted_id;
+        }
+        "delete_one" => {
+            outcome.deleted = collection.delete_one(doc1).await?.deleted_count as i64;
+        }
+        "delete_many" => {
+            outcome.deleted = collection.delete_many(doc1).await?.deleted_count as i64;
+        }
+        "replace_one" => {
+            let options = mongodb::options::ReplaceOptions::builder()
+                .upsert(upsert)
+                .build();
+            let result = collection.replace_one(doc1, doc2.unwrap()).with_options(options).await?;
+            outcome.unmatched = result.matched_count == 0 && result.upserted_id.is_none();
+            outcome.matched = result.matched_count as i64;
+            outcome.modified = result.modified_count as i64;
+            outcome.upserted_id = result.upserted_id;
+        }
+        _ => {}
+    }
+    Ok(outcome)
+}
+
 /// Convert Python dict to BSON document
 fn py_dict_to_bson(py: Python<'_>, dict: &Bound<'_, PyDict>) -> PyResult<BsonDocument> {
     // Get config once per document instead of per-field
@@ -753,6 +1494,36 @@ fn py_dict_to_bson(py: Python<'_>, dict: &Bound<'_, PyDict>) -> PyResult<BsonDoc
     Ok(doc)
 }
 
+/// Convert an index hint (index name or key spec dict) to a driver Hint
+fn py_to_index_hint(py: Python<'_>, value: &Bound<'_, PyAny>) -> PyResult<mongodb::options::Hint> {
+    if let Ok(name) = value.extract::<String>() {
+        return Ok(mongodb::options::Hint::Name(name));
+    }
+    if let Ok(dict) = value.downcast::<PyDict>() {
+        return Ok(mongodb::options::Hint::Keys(py_dict_to_bson(py, dict)?));
+    }
+    Err(PyValueError::new_err("hint must be an index name or a key specification dict"))
+}
+
+/// Convert a Python list of stage dicts to a validated BSON pipeline
+fn py_pipeline_to_bson(py: Python<'_>, pipeline: &Bound<'_, PyList>) -> PyResult<Vec<BsonDocument>> {
+    let mut bson_pipeline = Vec::with_capacity(pipeline.len());
+    for item in pipeline.iter() {
+        if let Ok(dict) = item.downcast::<PyDict>() {
+            bson_pipeline.push(py_dict_to_bson(py, dict)?);
+        } else {
+            return Err(PyValueError::new_err("Pipeline stages must be dicts"));
+        }
+    }
+
+    // Security: Validate aggregation pipeline for dangerous operators
+    for stage in &bson_pipeline {
+        validate_query_if_enabled(stage)?;
+    }
+
+    Ok(bson_pipeline)
+}
+
 /// Convert Python value to BSON value
 ///
 /// # Arguments
@@ -910,19 +1681,65 @@ fn py_to_bson(py: Python<'_>, value: &Bound<'_, PyAny>, config: &SecurityConfig)
     )))
 }
 
-/// Convert BSON value to Python value
-fn bson_to_py(py: Python<'_>, bson: &Bson) -> PyResult<PyObject> {
-    match bson {
-        Bson::Null => Ok(py.None()),
-        Bson::Boolean(b) => {
-            let obj = (*b).into_pyobject(py).unwrap();
-            Ok(obj.to_owned().into_any().unbind())
-        }
-        Bson::Int32(i) => {
-            let obj = (*i).into_pyobject(py).unwrap();
-            Ok(obj.to_owned().into_any().unbind())
+/// Convert a raw BSON value to Python with the same conversions as `bson_to_py`
+///
+/// Used for results handed out as plain dicts (aggregations): datetimes are
+/// UTC-aware, Decimal128 becomes `Decimal`, regexes and timestamps become
+/// dicts. Scalars that convert identically take the raw fast path, so only
+/// those special values are materialized as `Bson`.
+fn raw_bson_to_plain_py(py: Python<'_>, raw_bson: bson::raw::RawBsonRef<'_>) -> PyResult<PyObject> {
+    use bson::raw::RawBsonRef;
+
+    match raw_bson {
+        RawBsonRef::Document(doc) => {
+            let py_dict = PyDict::new(py);
+            for result in doc.iter_elements() {
+                if let Ok(element) = result {
+                    if let Ok(value) = element.value() {
+                        py_dict.set_item(element.key(), raw_bson_to_plain_py(py, value)?)?;
+                    }
+                }
+            }
+            Ok(py_dict.into())
         }
-        Bson::Int64(i) => {
+        RawBsonRef::Array(arr) => {
+            let py_list = PyList::empty(py);
+            for result in arr.into_iter() {
+                if let Ok(value) = result {
+                    py_list.append(raw_bson_to_plain_py(py, value)?)?;
+                }
+            }
+            Ok(py_list.into())
+        }
+        RawBsonRef::Double(_)
+        | RawBsonRef::String(_)
+        | RawBsonRef::Binary(_)
+        | RawBsonRef::ObjectId(_)
+        | RawBsonRef::Boolean(_)
+        | RawBsonRef::Null
+        | RawBsonRef::Int32(_)
+        | RawBsonRef::Int64(_) => raw_bson_to_py(py, raw_bson),
+        other => {
+            let value = Bson::try_from(other)
+                .map_err(|e| PyValueError::new_err(format!("Invalid BSON value: {}", e)))?;
+            bson_to_py(py, &value)
+        }
+    }
+}
+
+/// Convert BSON value to Python value
+fn bson_to_py(py: Python<'_>, bson: &Bson) -> PyResult<PyObject> {
+    match bson {
+        Bson::Null => Ok(py.None()),
+        Bson::Boolean(b) => {
+            let obj = (*b).into_pyobject(py).unwrap();
+            Ok(obj.to_owned().into_any().unbind())
+        }
+        Bson::Int32(i) => {
+            let obj = (*i).into_pyobject(py).unwrap();
+            Ok(obj.to_owned().into_any().unbind())
+        }
+        Bson::Int64(i) => {
             let obj = (*i).into_pyobject(py).unwrap();
             Ok(obj.to_owned().into_any().unbind())
         }
@@ -1502,15 +2319,23 @@ impl RustDocument {
     /// Args:
     ///     collection_name: Name of the MongoDB collection
     ///     filter: Query filter as a dict (optional)
+    ///     limit: Stop counting after this many matches (optional)
+    ///     skip: Number of matches to skip before counting (optional)
+    ///     hint: Index to use, as an index name or key spec dict (optional)
+    ///     max_time_ms: Server-side time limit in milliseconds (optional)
     ///
     /// Returns:
     ///     Number of matching documents
     #[staticmethod]
-    #[pyo3(signature = (collection_name, filter=None))]
+    #[pyo3(signature = (collection_name, filter=None, limit=None, skip=None, hint=None, max_time_ms=None))]
     fn count<'py>(
         py: Python<'py>,
         collection_name: String,
         filter: Option<&Bound<'_, PyDict>>,
+        limit: Option<u64>,
+        skip: Option<u64>,
+        hint: Option<&Bound<'_, PyAny>>,
+        max_time_ms: Option<u64>,
     ) -> PyResult<Bound<'py, PyAny>> {
         // Security: Validate collection name
         let validated_name = validate_collection_name(&collection_name)?.into_string();
@@ -1530,6 +2355,10 @@ impl RustDocument {
             Some(dict) => extract_dict_items(py, dict, &context)?,
             None => vec![],
         };
+        let hint = match hint {
+            Some(value) => Some(py_to_index_hint(py, value)?),
+            None => None,
+        };
 
         future_into_py(py, async move {
             // Phase 2: Convert to BSON (pure Rust, no GIL)
@@ -1545,8 +2374,55 @@ impl RustDocument {
             let db = conn.database();
             let collection = db.collection::<BsonDocument>(&validated_name);
 
+            let mut count_options = mongodb::options::CountOptions::default();
+            count_options.limit = limit;
+            count_options.skip = skip;
+            count_options.hint = hint;
+            count_options.max_time = max_time_ms.map(std::time::Duration::from_millis);
+
             let count = collection
                 .count_documents(filter_doc)
+                .with_options(count_options)
+                .await
+                .map_err(sanitize_mongodb_error)?;
+
+            Ok(count)
+        })
+    }
+
+    /// Estimate the number of documents in a collection from its metadata
+    ///
+    /// Does not scan the collection or its indexes, so it is O(1) but may be
+    /// off after unclean shutdowns or while orphaned documents exist.
+    ///
+    /// Args:
+    ///     collection_name: Name of the MongoDB collection
+    ///     max_time_ms: Server-side time limit in milliseconds (optional)
+    ///
+    /// Returns:
+    ///     Estimated number of documents
+    #[staticmethod]
+    #[pyo3(signature = (collection_name, max_time_ms=None))]
+    fn estimated_count<'py>(
+        py: Python<'py>,
+        collection_name: String,
+        max_time_ms: Option<u64>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        // Security: Validate collection name
+        let validated_name = validate_collection_name(&collection_name)?.into_string();
+
+        let conn = get_connection()?;
+
+        future_into_py(py, async move {
+            let db = conn.database();
+            let collection = db.collection::<BsonDocument>(&validated_name);
+
+            let mut count_options = mongodb::options::EstimatedDocumentCountOptions::default();
+            count_options.max_time = max_time_ms.map(std::time::Duration::from_millis);
+
+            let count = collection
+                .estimated_document_count()
+                .with_options(count_options)
                 .await
                 .map_err(sanitize_mongodb_error)?;
 
@@ -1585,6 +2461,10 @@ impl RustDocument {
             Some(dict) => py_dict_to_bson(py, dict)?,
             None => doc! {},
         };
+
+        // Security: Validate query for dangerous operators
+        validate_query_if_enabled(&filter_doc)?;
+
         let sort_doc = match sort {
             Some(dict) => Some(py_dict_to_bson(py, dict)?),
             None => None,
@@ -1681,36 +2561,39 @@ impl RustDocument {
             result
         };
 
-        // Phase 2: Convert to BSON (GIL released!)
-        let bson_docs: Vec<BsonDocument> = py.allow_threads(|| {
-            if extracted.len() >= PARALLEL_THRESHOLD {
-                // Parallel conversion for large batches
-                extracted
-                    .into_par_iter()
-                    .map(|doc| {
-                        let mut bson_doc = BsonDocument::new();
-                        for (key, value) in doc {
-                            bson_doc.insert(key, extracted_to_bson(value));
-                        }
-                        bson_doc
-                    })
-                    .collect()
-            } else {
-                // Sequential for small batches
-                extracted
-                    .into_iter()
-                    .map(|doc| {
-                        let mut bson_doc = BsonDocument::new();
-                        for (key, value) in doc {
-                            bson_doc.insert(key, extracted_to_bson(value));
-                        }
-                        bson_doc
-                    })
-                    .collect()
-            }
-        });
-
         future_into_py(py, async move {
+            // Phase 2: Convert to BSON on a blocking thread, so the event loop
+            // thread can extract the next batch while this one is converted and sent
+            let bson_docs: Vec<BsonDocument> = tokio::task::spawn_blocking(move || {
+                if extracted.len() >= PARALLEL_THRESHOLD {
+                    // Parallel conversion for large batches
+                    extracted
+                        .into_par_iter()
+                        .map(|doc| {
+                            let mut bson_doc = BsonDocument::new();
+                            for (key, value) in doc {
+                                bson_doc.insert(key, extracted_to_bson(value));
+                            }
+                            bson_doc
+                        })
+                        .collect()
+                } else {
+                    // Sequential for small batches
+                    extracted
+                        .into_iter()
+                        .map(|doc| {
+                            let mut bson_doc = BsonDocument::new();
+                            for (key, value) in doc {
+                                bson_doc.insert(key, extracted_to_bson(value));
+                            }
+                            bson_doc
+                        })
+                        .collect()
+                }
+            })
+            .await
+            .map_err(|e| PyRuntimeError::new_err(format!("BSON conversion failed: {}", e)))?;
+
             let db = conn.database();
             let collection = db.collection::<BsonDocument>(&validated_name);
 
@@ -1719,10 +2602,12 @@ impl RustDocument {
                 .await
                 .map_err(sanitize_mongodb_error)?;
 
-            let ids: Vec<String> = result
-                .inserted_ids
-                .values()
-                .filter_map(|v| v.as_object_id().map(|oid| oid.to_hex()))
+            // inserted_ids is keyed by input position: return the ids in input order
+            let mut inserted: Vec<(usize, Bson)> = result.inserted_ids.into_iter().collect();
+            inserted.sort_unstable_by_key(|(index, _)| *index);
+            let ids: Vec<String> = inserted
+                .into_iter()
+                .filter_map(|(_, v)| v.as_object_id().map(|oid| oid.to_hex()))
                 .collect();
 
             Ok(ids)
@@ -1852,11 +2737,19 @@ impl RustDocument {
     ///     sort: Sort specification as a dict (optional)
     ///     skip: Number of documents to skip (optional)
     ///     limit: Maximum documents to return (optional)
+    ///     projection: Fields to include/exclude (optional). Instances built
+    ///         from a projected query get a `_loaded_fields` frozenset.
+    ///     lazy_class: Callable `(raw_bytes, keys) -> dict` used as `_data`
+    ///         for lazily decoded documents (optional). Always takes the raw
+    ///         BSON path, including for queries with sort/skip.
+    ///     class_map: Dict of `_class_id` -> Document class for inheritance
+    ///         hierarchies (optional). Each document is built as the class
+    ///         named by its `_class_id`.
     ///
     /// Returns:
-    ///     A list of Document instances (typed)
+    ///     A list of Document instances (typed, may be polymorphic subclasses)
     #[staticmethod]
-    #[pyo3(signature = (collection_name, document_class, filter=None, sort=None, skip=None, limit=None))]
+    #[pyo3(signature = (collection_name, document_class, filter=None, sort=None, skip=None, limit=None, projection=None, lazy_class=None, class_map=None))]
     fn find_as_documents<'py>(
         py: Python<'py>,
         collection_name: String,
@@ -1865,6 +2758,9 @@ impl RustDocument {
         sort: Option<&Bound<'_, PyDict>>,
         skip: Option<u64>,
         limit: Option<i64>,
+        projection: Option<&Bound<'_, PyDict>>,
+        lazy_class: Option<Bound<'py, PyAny>>,
+        class_map: Option<Bound<'py, PyDict>>,
     ) -> PyResult<Bound<'py, PyAny>> {
         // Security: Validate collection name
         let validated_name = validate_collection_name(&collection_name)?.into_string();
@@ -1875,20 +2771,40 @@ impl RustDocument {
             None => doc! {},
         };
 
-        // Clone the class reference for use in async block
+        // Security: Validate query for dangerous operators
+        validate_query_if_enabled(&filter_doc)?;
+
+        let projection_doc = match projection {
+            Some(dict) if !dict.is_empty() => Some(py_dict_to_bson(py, dict)?),
+            _ => None,
+        };
+        let partial = projection_doc.is_some();
+
+        let sort_doc = match sort {
+            Some(dict) => Some(py_dict_to_bson(py, dict)?),
+            None => None,
+        };
+
+        // Clone the class references for use in async block
         let doc_class = document_class.unbind();
+        let lazy_class = lazy_class.map(|cls| cls.unbind());
+        let class_map = class_map.map(|map| map.unbind());
 
-        // Fast path: use RawDocumentBuf when no sort/skip (1.5-2x faster)
-        if sort.is_none() && skip.is_none() {
+        // Fast path: use RawDocumentBuf when no sort/skip (1.5-2x faster).
+        // Lazy documents keep their raw bytes, so they always take this path.
+        if lazy_class.is_some() || (sort_doc.is_none() && skip.is_none()) {
             return future_into_py(py, async move {
                 let db = conn.database();
                 let collection = db.collection::<RawDocumentBuf>(&validated_name);
 
                 let mut find_options = mongodb::options::FindOptions::default();
+                find_options.sort = sort_doc;
+                find_options.skip = skip;
                 if let Some(limit_val) = limit {
                     find_options.limit = Some(limit_val);
                     find_options.batch_size = Some(limit_val as u32);
                 }
+                find_options.projection = projection_doc;
 
                 let cursor = collection
                     .find(filter_doc)
@@ -1903,39 +2819,16 @@ impl RustDocument {
 
                 // Convert raw docs to Document instances
                 Python::with_gil(|py| {
-                    let doc_class = doc_class.bind(py);
+                    let builder = InstanceBuilder::new(
+                        doc_class.bind(py),
+                        class_map.as_ref().map(|map| map.bind(py)),
+                        lazy_class.as_ref().map(|cls| cls.bind(py)),
+                        partial,
+                    )?;
                     let mut results: Vec<PyObject> = Vec::with_capacity(raw_docs.len());
 
-                    for raw_doc in raw_docs {
-                        let py_dict = PyDict::new(py);
-                        let mut id_str: Option<String> = None;
-
-                        for result in raw_doc.iter_elements() {
-                            if let Ok(element) = result {
-                                let key = element.key();
-                                if let Ok(raw_bson) = element.value() {
-                                    if key == "_id" {
-                                        // Extract _id separately
-                                        if let bson::raw::RawBsonRef::ObjectId(oid) = raw_bson {
-                                            id_str = Some(oid.to_hex());
-                                        }
-                                    } else {
-                                        let py_value = raw_bson_to_py(py, raw_bson)?;
-                                        py_dict.set_item(key, py_value)?;
-                                    }
-                                }
-                            }
-                        }
-
-                        // Create instance
-                        let kwargs = PyDict::new(py);
-                        let instance = doc_class.call((), Some(&kwargs))?;
-
-                        // Set attributes
-                        instance.setattr("_id", id_str)?;
-                        instance.setattr("_data", py_dict)?;
-
-                        results.push(instance.unbind());
+                    for raw_doc in &raw_docs {
+                        results.push(builder.from_raw(raw_doc)?);
                     }
 
                     Ok(results)
@@ -1944,11 +2837,6 @@ impl RustDocument {
         }
 
         // Standard path for queries with sort/skip
-        let sort_doc = match sort {
-            Some(dict) => Some(py_dict_to_bson(py, dict)?),
-            None => None,
-        };
-
         future_into_py(py, async move {
             let db = conn.database();
             let collection = db.collection::<BsonDocument>(&validated_name);
@@ -1966,6 +2854,7 @@ impl RustDocument {
                 // Optimization: Set batch_size to match limit to reduce round trips
                 find_options.batch_size = Some(limit_val as u32);
             }
+            find_options.projection = projection_doc;
 
             let cursor = collection
                 .find(filter_doc)
@@ -1986,8 +2875,7 @@ impl RustDocument {
                         .map(|bson_doc| {
                             let id_str = bson_doc
                                 .get("_id")
-                                .and_then(|v| v.as_object_id())
-                                .map(|oid| oid.to_hex());
+                                .map(bson_id_to_string);
 
                             let fields: Vec<(String, ExtractedValue)> = bson_doc
                                 .iter()
@@ -2004,8 +2892,7 @@ impl RustDocument {
                         .map(|bson_doc| {
                             let id_str = bson_doc
                                 .get("_id")
-                                .and_then(|v| v.as_object_id())
-                                .map(|oid| oid.to_hex());
+                                .map(bson_id_to_string);
 
                             let fields: Vec<(String, ExtractedValue)> = bson_doc
                                 .iter()
@@ -2020,7 +2907,12 @@ impl RustDocument {
 
             // Phase 2: Create Python objects (requires GIL)
             Python::with_gil(|py| {
-                let doc_class = doc_class.bind(py);
+                let builder = InstanceBuilder::new(
+                    doc_class.bind(py),
+                    class_map.as_ref().map(|map| map.bind(py)),
+                    None,
+                    partial,
+                )?;
                 let mut results: Vec<PyObject> = Vec::with_capacity(intermediate.len());
 
                 for (id_str, fields) in intermediate {
@@ -2030,15 +2922,7 @@ impl RustDocument {
                         py_dict.set_item(&key, extracted_to_py(py, value)?)?;
                     }
 
-                    // Create instance
-                    let kwargs = PyDict::new(py);
-                    let instance = doc_class.call((), Some(&kwargs))?;
-
-                    // Set attributes
-                    instance.setattr("_id", id_str)?;
-                    instance.setattr("_data", py_dict)?;
-
-                    results.push(instance.unbind());
+                    results.push(builder.from_dict(id_str, py_dict)?);
                 }
 
                 Ok(results)
@@ -2076,6 +2960,10 @@ impl RustDocument {
             Some(dict) => py_dict_to_bson(py, dict)?,
             None => doc! {},
         };
+
+        // Security: Validate query for dangerous operators
+        validate_query_if_enabled(&filter_doc)?;
+
         let sort_doc = match sort {
             Some(dict) => Some(py_dict_to_bson(py, dict)?),
             None => None,
@@ -2126,8 +3014,7 @@ impl RustDocument {
                         .map(|bson_doc| {
                             let id_str = bson_doc
                                 .get("_id")
-                                .and_then(|v| v.as_object_id())
-                                .map(|oid| oid.to_hex());
+                                .map(bson_id_to_string);
                             let fields: Vec<(String, ExtractedValue)> = bson_doc
                                 .iter()
                                 .filter(|(k, _)| *k != "_id")
@@ -2141,8 +3028,7 @@ impl RustDocument {
                         .map(|bson_doc| {
                             let id_str = bson_doc
                                 .get("_id")
-                                .and_then(|v| v.as_object_id())
-                                .map(|oid| oid.to_hex());
+                                .map(bson_id_to_string);
                             let fields: Vec<(String, ExtractedValue)> = bson_doc
                                 .iter()
                                 .filter(|(k, _)| *k != "_id")
@@ -2157,7 +3043,7 @@ impl RustDocument {
             // Phase 4: Intermediate to Python (with GIL)
             Python::with_gil(|py| {
                 let python_start = Instant::now();
-                let doc_class = doc_class.bind(py);
+                let builder = InstanceBuilder::new(doc_class.bind(py), None, None, false)?;
                 let mut results: Vec<PyObject> = Vec::with_capacity(intermediate.len());
 
                 for (id_str, fields) in intermediate {
@@ -2165,11 +3051,7 @@ impl RustDocument {
                     for (key, value) in fields {
                         py_dict.set_item(&key, extracted_to_py(py, value)?)?;
                     }
-                    let kwargs = PyDict::new(py);
-                    let instance = doc_class.call((), Some(&kwargs))?;
-                    instance.setattr("_id", id_str)?;
-                    instance.setattr("_data", py_dict)?;
-                    results.push(instance.unbind());
+                    results.push(builder.from_dict(id_str, py_dict)?);
                 }
                 let intermediate_to_python_us = python_start.elapsed().as_micros() as u64;
                 let total_us = total_start.elapsed().as_micros() as u64;
@@ -2212,6 +3094,9 @@ impl RustDocument {
             None => doc! {},
         };
 
+        // Security: Validate query for dangerous operators
+        validate_query_if_enabled(&filter_doc)?;
+
         future_into_py(py, async move {
             let total_start = Instant::now();
 
@@ -2312,6 +3197,9 @@ impl RustDocument {
             None => doc! {},
         };
 
+        // Security: Validate query for dangerous operators
+        validate_query_if_enabled(&filter_doc)?;
+
         // Fast path: use RawDocumentBuf when no sort/skip (1.5-2x faster)
         // RawDocumentBuf skips intermediate BSON parsing
         if sort.is_none() && skip.is_none() {
@@ -2355,34 +3243,281 @@ impl RustDocument {
                         results.push(py_dict.into_any().unbind());
                     }
 
-                    Ok(results)
-                })
-            });
+                    Ok(results)
+                })
+            });
+        }
+
+        // Standard path for queries with sort/skip
+        let sort_doc = match sort {
+            Some(dict) => Some(py_dict_to_bson(py, dict)?),
+            None => None,
+        };
+
+        future_into_py(py, async move {
+            let db = conn.database();
+            let collection = db.collection::<BsonDocument>(&validated_name);
+
+            // Build find options
+            let mut find_options = mongodb::options::FindOptions::default();
+            if let Some(sort) = sort_doc {
+                find_options.sort = Some(sort);
+            }
+            if let Some(skip_val) = skip {
+                find_options.skip = Some(skip_val);
+            }
+            if let Some(limit_val) = limit {
+                find_options.limit = Some(limit_val);
+                // Optimization: Set batch_size to match limit to reduce round trips
+                find_options.batch_size = Some(limit_val as u32);
+            }
+
+            let cursor = collection
+                .find(filter_doc)
+                .with_options(find_options)
+                .await
+                .map_err(sanitize_mongodb_error)?;
+
+            let docs: Vec<BsonDocument> = cursor
+                .try_collect()
+                .await
+                .map_err(sanitize_mongodb_error)?;
+
+            // Phase 1: Convert BSON to intermediate (no GIL needed, can parallelize)
+            let intermediate: Vec<(Option<String>, Vec<(String, ExtractedValue)>)> =
+                if docs.len() >= PARALLEL_THRESHOLD {
+                    // Parallel conversion for large result sets
+                    docs.into_par_iter()
+                        .map(|bson_doc| {
+                            let id_str = bson_doc
+                                .get("_id")
+                                .and_then(|v| v.as_object_id())
+                                .map(|oid| oid.to_hex());
+
+                            let fields: Vec<(String, ExtractedValue)> = bson_doc
+                                .iter()
+                                .filter(|(k, _)| *k != "_id")
+                                .map(|(k, v)| (k.clone(), bson_to_extracted(v)))
+                                .collect();
+
+                            (id_str, fields)
+                        })
+                        .collect()
+                } else {
+                    // Sequential for small result sets
+                    docs.into_iter()
+                        .map(|bson_doc| {
+                            let id_str = bson_doc
+                                .get("_id")
+                                .and_then(|v| v.as_object_id())
+                                .map(|oid| oid.to_hex());
+
+                            let fields: Vec<(String, ExtractedValue)> = bson_doc
+                                .iter()
+                                .filter(|(k, _)| *k != "_id")
+                                .map(|(k, v)| (k.clone(), bson_to_extracted(v)))
+                                .collect();
+
+                            (id_str, fields)
+                        })
+                        .collect()
+                };
+
+            // Phase 2: Create Python dicts (simpler than creating Document instances)
+            Python::with_gil(|py| {
+                let mut results: Vec<PyObject> = Vec::with_capacity(intermediate.len());
+
+                for (id_str, fields) in intermediate {
+                    let py_dict = PyDict::new(py);
+
+                    // Add _id to dict
+                    if let Some(id) = id_str {
+                        py_dict.set_item("_id", id)?;
+                    }
+
+                    // Add all fields
+                    for (key, value) in fields {
+                        py_dict.set_item(&key, extracted_to_py(py, value)?)?;
+                    }
+
+                    results.push(py_dict.into());
+                }
+
+                Ok(results)
+            })
+        })
+    }
+
+    /// Open a server-side cursor that yields documents batch by batch
+    ///
+    /// Unlike `find_as_documents`, results are not collected up front: each
+    /// call to `Cursor.next_batch()` pulls at most one driver batch and
+    /// converts it, so memory stays bounded by `batch_size`.
+    ///
+    /// Args:
+    ///     collection_name: Name of the MongoDB collection
+    ///     document_class: Document class to instantiate (None returns dicts)
+    ///     filter: Query filter as a dict (optional)
+    ///     sort: Sort specification as a dict (optional)
+    ///     skip: Number of documents to skip (optional)
+    ///     limit: Maximum documents to return (optional)
+    ///     batch_size: Documents per batch (optional, server default if None)
+    ///     projection: Fields to include/exclude (optional)
+    ///     lazy_class: Callable `(raw_bytes, keys) -> dict` used as `_data`
+    ///         for lazily decoded documents (optional)
+    ///     class_map: Dict of `_class_id` -> Document class for inheritance
+    ///         hierarchies (optional)
+    ///
+    /// Returns:
+    ///     A Cursor instance
+    #[staticmethod]
+    #[pyo3(signature = (collection_name, document_class=None, filter=None, sort=None, skip=None, limit=None, batch_size=None, projection=None, lazy_class=None, class_map=None))]
+    fn open_cursor<'py>(
+        py: Python<'py>,
+        collection_name: String,
+        document_class: Option<Bound<'py, PyAny>>,
+        filter: Option<&Bound<'_, PyDict>>,
+        sort: Option<&Bound<'_, PyDict>>,
+        skip: Option<u64>,
+        limit: Option<i64>,
+        batch_size: Option<u32>,
+        projection: Option<&Bound<'_, PyDict>>,
+        lazy_class: Option<Bound<'py, PyAny>>,
+        class_map: Option<Bound<'py, PyDict>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        // Security: Validate collection name
+        let validated_name = validate_collection_name(&collection_name)?.into_string();
+
+        let conn = get_connection()?;
+        let filter_doc = match filter {
+            Some(dict) => py_dict_to_bson(py, dict)?,
+            None => doc! {},
+        };
+
+        // Security: Validate query for dangerous operators
+        validate_query_if_enabled(&filter_doc)?;
+
+        let sort_doc = match sort {
+            Some(dict) => Some(py_dict_to_bson(py, dict)?),
+            None => None,
+        };
+        let projection_doc = match projection {
+            Some(dict) if !dict.is_empty() => Some(py_dict_to_bson(py, dict)?),
+            _ => None,
+        };
+        let partial = projection_doc.is_some();
+
+        if batch_size == Some(0) {
+            return Err(PyValueError::new_err("batch_size must be greater than 0"));
+        }
+
+        let doc_class = document_class.map(|cls| cls.unbind());
+        let lazy_class = lazy_class.map(|cls| cls.unbind());
+        let class_map = class_map.map(|map| map.unbind());
+
+        future_into_py(py, async move {
+            let db = conn.database();
+            let collection = db.collection::<RawDocumentBuf>(&validated_name);
+
+            let mut find_options = mongodb::options::FindOptions::default();
+            find_options.sort = sort_doc;
+            find_options.skip = skip;
+            find_options.limit = limit;
+            find_options.batch_size = batch_size;
+            find_options.projection = projection_doc;
+
+            let cursor = collection
+                .find(filter_doc)
+                .with_options(find_options)
+                .await
+                .map_err(sanitize_mongodb_error)?;
+
+            Ok(RustCursor {
+                cursor: Arc::new(tokio::sync::Mutex::new(Some(cursor))),
+                document_class: doc_class,
+                lazy_class,
+                class_map,
+                partial,
+                // Without an explicit batch size, drain whatever the first
+                // server batch holds (MongoDB defaults to 101 documents)
+                batch_size: batch_size.unwrap_or(101) as usize,
+            })
+        })
+    }
+
+    /// Find documents and decode the requested fields into typed columns
+    ///
+    /// Documents are fetched as raw BSON (projected to the requested fields)
+    /// and decoded column by column without the GIL, so no per-row dict or
+    /// Document instance is ever created.
+    ///
+    /// Args:
+    ///     collection_name: Name of the MongoDB collection
+    ///     fields: Field names (dotted paths allowed) to decode
+    ///     filter: Query filter as a dict (optional)
+    ///     sort: Sort specification as a dict (optional)
+    ///     skip: Number of documents to skip (optional)
+    ///     limit: Maximum documents to return (optional)
+    ///
+    /// Returns:
+    ///     Dict of field name to (kind, values, mask) tuples
+    #[staticmethod]
+    #[pyo3(signature = (collection_name, fields, filter=None, sort=None, skip=None, limit=None))]
+    fn find_columns<'py>(
+        py: Python<'py>,
+        collection_name: String,
+        fields: Vec<String>,
+        filter: Option<&Bound<'_, PyDict>>,
+        sort: Option<&Bound<'_, PyDict>>,
+        skip: Option<u64>,
+        limit: Option<i64>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        // Security: Validate collection name
+        let validated_name = validate_collection_name(&collection_name)?.into_string();
+
+        if fields.is_empty() {
+            return Err(PyValueError::new_err("find_columns requires at least one field"));
         }
 
-        // Standard path for queries with sort/skip
+        let conn = get_connection()?;
+        let filter_doc = match filter {
+            Some(dict) => py_dict_to_bson(py, dict)?,
+            None => doc! {},
+        };
+
+        // Security: Validate query for dangerous operators
+        validate_query_if_enabled(&filter_doc)?;
+
         let sort_doc = match sort {
             Some(dict) => Some(py_dict_to_bson(py, dict)?),
             None => None,
         };
 
+        // Only pull the requested fields over the wire. A path inside another
+        // requested field ("meta.x" with "meta") is fetched with its parent:
+        // projecting both is a path collision on the server.
+        let is_within = |path: &str, parent: &str| {
+            path.len() > parent.len() && path.starts_with(parent) && path.as_bytes()[parent.len()] == b'.'
+        };
+        let mut projection = BsonDocument::new();
+        for field in &fields {
+            if !fields.iter().any(|other| is_within(field, other)) {
+                projection.insert(field.clone(), 1);
+            }
+        }
+        if !fields.iter().any(|f| f == "_id" || is_within(f, "_id")) {
+            projection.insert("_id", 0);
+        }
+
         future_into_py(py, async move {
             let db = conn.database();
-            let collection = db.collection::<BsonDocument>(&validated_name);
+            let collection = db.collection::<RawDocumentBuf>(&validated_name);
 
-            // Build find options
             let mut find_options = mongodb::options::FindOptions::default();
-            if let Some(sort) = sort_doc {
-                find_options.sort = Some(sort);
-            }
-            if let Some(skip_val) = skip {
-                find_options.skip = Some(skip_val);
-            }
-            if let Some(limit_val) = limit {
-                find_options.limit = Some(limit_val);
-                // Optimization: Set batch_size to match limit to reduce round trips
-                find_options.batch_size = Some(limit_val as u32);
-            }
+            find_options.sort = sort_doc;
+            find_options.skip = skip;
+            find_options.limit = limit;
+            find_options.projection = Some(projection);
 
             let cursor = collection
                 .find(filter_doc)
@@ -2390,139 +3525,191 @@ impl RustDocument {
                 .await
                 .map_err(sanitize_mongodb_error)?;
 
-            let docs: Vec<BsonDocument> = cursor
+            let raw_docs: Vec<RawDocumentBuf> = cursor
                 .try_collect()
                 .await
                 .map_err(sanitize_mongodb_error)?;
 
-            // Phase 1: Convert BSON to intermediate (no GIL needed, can parallelize)
-            let intermediate: Vec<(Option<String>, Vec<(String, ExtractedValue)>)> =
-                if docs.len() >= PARALLEL_THRESHOLD {
-                    // Parallel conversion for large result sets
-                    docs.into_par_iter()
-                        .map(|bson_doc| {
-                            let id_str = bson_doc
-                                .get("_id")
-                                .and_then(|v| v.as_object_id())
-                                .map(|oid| oid.to_hex());
-
-                            let fields: Vec<(String, ExtractedValue)> = bson_doc
-                                .iter()
-                                .filter(|(k, _)| *k != "_id")
-                                .map(|(k, v)| (k.clone(), bson_to_extracted(v)))
-                                .collect();
+            // Decode into typed buffers (no GIL held here)
+            let columns = raw_docs_to_columns(&raw_docs, &fields);
+            drop(raw_docs);
 
-                            (id_str, fields)
-                        })
-                        .collect()
-                } else {
-                    // Sequential for small result sets
-                    docs.into_iter()
-                        .map(|bson_doc| {
-                            let id_str = bson_doc
-                                .get("_id")
-                                .and_then(|v| v.as_object_id())
-                                .map(|oid| oid.to_hex());
+            Python::with_gil(|py| columns_to_py(py, &fields, columns))
+        })
+    }
 
-                            let fields: Vec<(String, ExtractedValue)> = bson_doc
-                                .iter()
-                                .filter(|(k, _)| *k != "_id")
-                                .map(|(k, v)| (k.clone(), bson_to_extracted(v)))
-                                .collect();
+    /// Run an aggregation pipeline and decode the requested fields into columns
+    ///
+    /// Args:
+    ///     collection_name: Name of the MongoDB collection
+    ///     pipeline: List of pipeline stages as dicts
+    ///     fields: Field names (dotted paths allowed) to decode
+    ///
+    /// Returns:
+    ///     Dict of field name to (kind, values, mask) tuples
+    #[staticmethod]
+    fn aggregate_columns<'py>(
+        py: Python<'py>,
+        collection_name: String,
+        pipeline: &Bound<'_, PyList>,
+        fields: Vec<String>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        // Security: Validate collection name
+        let validated_name = validate_collection_name(&collection_name)?.into_string();
 
-                            (id_str, fields)
-                        })
-                        .collect()
-                };
+        if fields.is_empty() {
+            return Err(PyValueError::new_err("aggregate_columns requires at least one field"));
+        }
 
-            // Phase 2: Create Python dicts (simpler than creating Document instances)
-            Python::with_gil(|py| {
-                let mut results: Vec<PyObject> = Vec::with_capacity(intermediate.len());
+        let conn = get_connection()?;
+        let bson_pipeline = py_pipeline_to_bson(py, pipeline)?;
 
-                for (id_str, fields) in intermediate {
-                    let py_dict = PyDict::new(py);
+        future_into_py(py, async move {
+            let db = conn.database();
+            let collection = db.collection::<BsonDocument>(&validated_name);
 
-                    // Add _id to dict
-                    if let Some(id) = id_str {
-                        py_dict.set_item("_id", id)?;
-                    }
+            let cursor = collection
+                .aggregate(bson_pipeline)
+                .with_type::<RawDocumentBuf>()
+                .await
+                .map_err(sanitize_mongodb_error)?;
 
-                    // Add all fields
-                    for (key, value) in fields {
-                        py_dict.set_item(&key, extracted_to_py(py, value)?)?;
-                    }
+            let raw_docs: Vec<RawDocumentBuf> = cursor
+                .try_collect()
+                .await
+                .map_err(sanitize_mongodb_error)?;
 
-                    results.push(py_dict.into());
-                }
+            // Decode into typed buffers (no GIL held here)
+            let columns = raw_docs_to_columns(&raw_docs, &fields);
+            drop(raw_docs);
 
-                Ok(results)
-            })
+            Python::with_gil(|py| columns_to_py(py, &fields, columns))
         })
     }
 
     /// Run an aggregation pipeline
     ///
+    /// Results are fetched as raw BSON and decoded straight into dicts, with
+    /// no intermediate Document wrapper.
+    ///
     /// Args:
     ///     collection_name: Name of the MongoDB collection
     ///     pipeline: List of pipeline stages as dicts
+    ///     batch_size: Documents per server batch (optional)
+    ///     allow_disk_use: Let blocking stages spill to disk (optional)
     ///
     /// Returns:
     ///     List of result documents as dicts
     #[staticmethod]
+    #[pyo3(signature = (collection_name, pipeline, batch_size=None, allow_disk_use=None))]
     fn aggregate<'py>(
         py: Python<'py>,
         collection_name: String,
         pipeline: &Bound<'_, PyList>,
+        batch_size: Option<u32>,
+        allow_disk_use: Option<bool>,
     ) -> PyResult<Bound<'py, PyAny>> {
         // Security: Validate collection name
         let validated_name = validate_collection_name(&collection_name)?.into_string();
 
         let conn = get_connection()?;
-
-        // Convert pipeline stages to BSON
-        let mut bson_pipeline = Vec::with_capacity(pipeline.len());
-        for item in pipeline.iter() {
-            if let Ok(dict) = item.downcast::<PyDict>() {
-                let stage = py_dict_to_bson(py, dict)?;
-                bson_pipeline.push(stage);
-            } else {
-                return Err(PyValueError::new_err("Pipeline stages must be dicts"));
-            }
-        }
-
-        // Security: Validate aggregation pipeline for dangerous operators
-        for stage in &bson_pipeline {
-            validate_query_if_enabled(stage)?;
-        }
+        let bson_pipeline = py_pipeline_to_bson(py, pipeline)?;
 
         future_into_py(py, async move {
             let db = conn.database();
             let collection = db.collection::<BsonDocument>(&validated_name);
 
+            let mut options = mongodb::options::AggregateOptions::default();
+            options.batch_size = batch_size;
+            options.allow_disk_use = allow_disk_use;
+
             let cursor = collection
                 .aggregate(bson_pipeline)
+                .with_options(options)
+                .with_type::<RawDocumentBuf>()
                 .await
                 .map_err(sanitize_mongodb_error)?;
 
-            let docs: Vec<BsonDocument> = cursor
+            let raw_docs: Vec<RawDocumentBuf> = cursor
                 .try_collect()
                 .await
                 .map_err(sanitize_mongodb_error)?;
 
-            // Return as list of RustDocument for consistency
-            let results: Vec<RustDocument> = docs
-                .into_iter()
-                .map(|doc| {
-                    let id = doc.get("_id").and_then(|v| v.as_object_id());
-                    RustDocument {
-                        collection_name: collection_name.clone(),
-                        data: doc,
-                        id,
-                    }
-                })
-                .collect();
+            Python::with_gil(|py| {
+                let mut results: Vec<PyObject> = Vec::with_capacity(raw_docs.len());
+                for raw_doc in &raw_docs {
+                    results.push(raw_bson_to_plain_py(py, bson::raw::RawBsonRef::Document(raw_doc))?);
+                }
+                Ok(results)
+            })
+        })
+    }
 
-            Ok(results)
+    /// Open a server-side cursor over an aggregation pipeline
+    ///
+    /// Like `open_cursor`, each `Cursor.next_batch()` pulls at most one
+    /// batch, decoded from raw BSON into dicts (or Document instances when a
+    /// document class is given), so memory stays bounded by `batch_size`
+    /// even for large `$unwind` outputs.
+    ///
+    /// Args:
+    ///     collection_name: Name of the MongoDB collection
+    ///     pipeline: List of pipeline stages as dicts
+    ///     document_class: Document class to instantiate (None returns dicts)
+    ///     batch_size: Documents per batch (optional, server default if None)
+    ///     allow_disk_use: Let blocking stages spill to disk (optional)
+    ///     class_map: Dict of `_class_id` -> Document class for inheritance
+    ///         hierarchies (optional)
+    ///
+    /// Returns:
+    ///     A Cursor instance
+    #[staticmethod]
+    #[pyo3(signature = (collection_name, pipeline, document_class=None, batch_size=None, allow_disk_use=None, class_map=None))]
+    fn open_aggregate_cursor<'py>(
+        py: Python<'py>,
+        collection_name: String,
+        pipeline: &Bound<'_, PyList>,
+        document_class: Option<Bound<'py, PyAny>>,
+        batch_size: Option<u32>,
+        allow_disk_use: Option<bool>,
+        class_map: Option<Bound<'py, PyDict>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        // Security: Validate collection name
+        let validated_name = validate_collection_name(&collection_name)?.into_string();
+
+        if batch_size == Some(0) {
+            return Err(PyValueError::new_err("batch_size must be greater than 0"));
+        }
+
+        let conn = get_connection()?;
+        let bson_pipeline = py_pipeline_to_bson(py, pipeline)?;
+
+        let doc_class = document_class.map(|cls| cls.unbind());
+        let class_map = class_map.map(|map| map.unbind());
+
+        future_into_py(py, async move {
+            let db = conn.database();
+            let collection = db.collection::<BsonDocument>(&validated_name);
+
+            let mut options = mongodb::options::AggregateOptions::default();
+            options.batch_size = batch_size;
+            options.allow_disk_use = allow_disk_use;
+
+            let cursor = collection
+                .aggregate(bson_pipeline)
+                .with_options(options)
+                .with_type::<RawDocumentBuf>()
+                .await
+                .map_err(sanitize_mongodb_error)?;
+
+            Ok(RustCursor {
+                cursor: Arc::new(tokio::sync::Mutex::new(Some(cursor))),
+                document_class: doc_class,
+                lazy_class: None,
+                class_map,
+                partial: false,
+                batch_size: batch_size.unwrap_or(101) as usize,
+            })
         })
     }
 
@@ -3367,7 +4554,9 @@ impl RustDocument {
     /// Execute bulk write operations
     ///
     /// This method executes operations individually for compatibility with MongoDB <8.0.
-    /// For ordered operations, it stops on first error. For unordered, it continues.
+    /// For ordered operations, it runs them one after another and stops on first error.
+    /// Unordered operations run concurrently (at most BULK_WRITE_CONCURRENCY in flight)
+    /// and every error is recorded.
     ///
     /// Args:
     ///     collection_name: Name of the MongoDB collection
@@ -3375,7 +4564,8 @@ impl RustDocument {
     ///     ordered: If True, stop on first error (default: True)
     ///
     /// Returns:
-    ///     Dict with inserted_count, matched_count, modified_count, deleted_count, upserted_count
+    ///     Dict with inserted_count, matched_count, modified_count, deleted_count, upserted_count,
+    ///     upserted_ids, unmatched_indices and errors (operation index -> message, unordered mode)
     #[staticmethod]
     #[pyo3(signature = (collection_name, operations, ordered=true))]
     fn bulk_write<'py>(
@@ -3559,101 +4749,49 @@ impl RustDocument {
             let mut deleted_count: i64 = 0;
             let mut upserted_count: i64 = 0;
             let mut upserted_ids: std::collections::HashMap<i64, String> = std::collections::HashMap::new();
+            let mut unmatched_indices: Vec<i64> = Vec::new();
+            let mut errors: Vec<(i64, String)> = Vec::new();
 
-            for (idx, (op_type, doc1, doc2, upsert)) in parsed_ops.into_iter().enumerate() {
-                let result = match op_type.as_str() {
-                    "insert_one" => {
-                        match collection.insert_one(doc1).await {
-                            Ok(_) => {
-                                inserted_count += 1;
-                                Ok(())
-                            }
-                            Err(e) => Err(e),
-                        }
-                    }
-                    "update_one" => {
-                        let options = mongodb::options::UpdateOptions::builder()
-                            .upsert(upsert)
-                            .build();
-                        match collection.update_one(doc1, doc2.unwrap()).with_options(options).await {
-                            Ok(result) => {
-                                matched_count += result.matched_count as i64;
-                                modified_count += result.modified_count as i64;
-                                if let Some(id) = result.upserted_id {
-                                    upserted_count += 1;
-                                    if let Some(oid) = id.as_object_id() {
-                                        upserted_ids.insert(idx as i64, oid.to_hex());
-                                    }
-                                }
-                                Ok(())
-                            }
-                            Err(e) => Err(e),
-                        }
-                    }
-                    "update_many" => {
-                        let options = mongodb::options::UpdateOptions::builder()
-                            .upsert(upsert)
-                            .build();
-                        match collection.update_many(doc1, doc2.unwrap()).with_options(options).await {
-                            Ok(result) => {
-                                matched_count += result.matched_count as i64;
-                                modified_count += result.modified_count as i64;
-                                if let Some(id) = result.upserted_id {
-                                    upserted_count += 1;
-                                    if let Some(oid) = id.as_object_id() {
-                                        upserted_ids.insert(idx as i64, oid.to_hex());
-                                    }
-                                }
-                                Ok(())
-                            }
-                            Err(e) => Err(e),
-                        }
-                    }
-                    "delete_one" => {
-                        match collection.delete_one(doc1).await {
-                            Ok(result) => {
-                                deleted_count += result.deleted_count as i64;
-                                Ok(())
-                            }
-                            Err(e) => Err(e),
-                        }
-                    }
-                    "delete_many" => {
-                        match collection.delete_many(doc1).await {
-                            Ok(result) => {
-                                deleted_count += result.deleted_count as i64;
-                                Ok(())
-                            }
-                            Err(e) => Err(e),
+            let outcomes: Vec<(usize, mongodb::error::Result<BulkOpOutcome>)> = if ordered {
+                // In ordered mode, stop on first error
+                let mut outcomes = Vec::with_capacity(parsed_ops.len());
+                for (idx, op) in parsed_ops.into_iter().enumerate() {
+                    let outcome = run_bulk_op(&collection, op).await.map_err(sanitize_mongodb_error)?;
+                    outcomes.push((idx, Ok(outcome)));
+                }
+                outcomes
+            } else {
+                // In unordered mode, keep several operations in flight and continue past errors
+                use futures::StreamExt;
+                let collection = &collection;
+                let mut outcomes: Vec<_> = futures::stream::iter(parsed_ops.into_iter().enumerate())
+                    .map(|(idx, op)| async move { (idx, run_bulk_op(collection, op).await) })
+                    .buffer_unordered(BULK_WRITE_CONCURRENCY)
+                    .collect()
+                    .await;
+                outcomes.sort_by_key(|(idx, _)| *idx);
+                outcomes
+            };
+
+            for (idx, outcome) in outcomes {
+                match outcome {
+                    Ok(outcome) => {
+                        inserted_count += outcome.inserted;
+                        matched_count += outcome.matched;
+                        modified_count += outcome.modified;
+                        deleted_count += outcome.deleted;
+                        if outcome.unmatched {
+                            unmatched_indices.push(idx as i64);
                         }
-                    }
-                    "replace_one" => {
-                        let options = mongodb::options::ReplaceOptions::builder()
-                            .upsert(upsert)
-                            .build();
-                        match collection.replace_one(doc1, doc2.unwrap()).with_options(options).await {
-                            Ok(result) => {
-                                matched_count += result.matched_count as i64;
-                                modified_count += result.modified_count as i64;
-                                if let Some(id) = result.upserted_id {
-                                    upserted_count += 1;
-                                    if let Some(oid) = id.as_object_id() {
-                                        upserted_ids.insert(idx as i64, oid.to_hex());
-                                    }
-                                }
-                                Ok(())
+                        if let Some(id) = outcome.upserted_id {
+                            upserted_count += 1;
+                            if let Some(oid) = id.as_object_id() {
+                                upserted_ids.insert(idx as i64, oid.to_hex());
                             }
-                            Err(e) => Err(e),
                         }
                     }
-                    _ => Ok(()),
-                };
-
-                // In ordered mode, stop on first error
-                if ordered {
-                    result.map_err(sanitize_mongodb_error)?;
+                    Err(e) => errors.push((idx as i64, sanitize_error_message(&e.to_string()))),
                 }
-                // In unordered mode, continue with remaining operations (ignore errors)
             }
 
             Ok(BulkWriteResultWrapper {
@@ -3663,6 +4801,8 @@ impl RustDocument {
                 deleted_count,
                 upserted_count,
                 upserted_ids,
+                unmatched_indices,
+                errors,
             })
         })
     }
@@ -3676,6 +4816,107 @@ impl RustDocument {
     }
 }
 
+/// Server-side cursor returned by `Document.open_cursor` and
+/// `Document.open_aggregate_cursor`
+///
+/// Holds the driver cursor behind an async mutex so batches can be pulled
+/// from Python one at a time. Dropping or closing the cursor releases the
+/// server-side resources.
+#[pyclass(name = "Cursor")]
+pub struct RustCursor {
+    cursor: Arc<tokio::sync::Mutex<Option<mongodb::Cursor<RawDocumentBuf>>>>,
+    document_class: Option<Py<PyAny>>,
+    lazy_class: Option<Py<PyAny>>,
+    class_map: Option<Py<PyDict>>,
+    partial: bool,
+    batch_size: usize,
+}
+
+#[pymethods]
+impl RustCursor {
+    /// Fetch and convert the next batch of documents
+    ///
+    /// Returns:
+    ///     List of Document instances (or dicts when no document class was
+    ///     given). An empty list means the cursor is exhausted.
+    fn next_batch<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let cursor = Arc::clone(&self.cursor);
+        let doc_class = self.document_class.as_ref().map(|cls| cls.clone_ref(py));
+        let lazy_class = self.lazy_class.as_ref().map(|cls| cls.clone_ref(py));
+        let class_map = self.class_map.as_ref().map(|map| map.clone_ref(py));
+        let partial = self.partial;
+        let batch_size = self.batch_size;
+
+        future_into_py(py, async move {
+            let mut guard = cursor.lock().await;
+
+            let mut raw_docs: Vec<RawDocumentBuf> = Vec::with_capacity(batch_size);
+            if let Some(active) = guard.as_mut() {
+                while raw_docs.len() < batch_size {
+                    let has_more = active.advance().await.map_err(sanitize_mongodb_error)?;
+                    if !has_more {
+                        break;
+                    }
+                    raw_docs.push(active.current().to_raw_document_buf());
+                }
+                if raw_docs.len() < batch_size {
+                    // Exhausted: drop the driver cursor right away
+                    *guard = None;
+                }
+            }
+            drop(guard);
+
+            Python::with_gil(|py| {
+                let mut results: Vec<PyObject> = Vec::with_capacity(raw_docs.len());
+                match doc_class {
+                    Some(cls) => {
+                        let builder = InstanceBuilder::new(
+                            cls.bind(py),
+                            class_map.as_ref().map(|map| map.bind(py)),
+                            lazy_class.as_ref().map(|lazy| lazy.bind(py)),
+                            partial,
+                        )?;
+                        for raw_doc in &raw_docs {
+                            results.push(builder.from_raw(raw_doc)?);
+                        }
+                    }
+                    None => {
+                        for raw_doc in &raw_docs {
+                            let value = bson::raw::RawBsonRef::Document(raw_doc);
+                            results.push(raw_bson_to_plain_py(py, value)?);
+                        }
+                    }
+                }
+                Ok(results)
+            })
+        })
+    }
+
+    /// Close the cursor and release server-side resources
+    fn close<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let cursor = Arc::clone(&self.cursor);
+
+        future_into_py(py, async move {
+            cursor.lock().await.take();
+            Ok(())
+        })
+    }
+
+    /// Whether the cursor has been exhausted or closed
+    #[getter]
+    fn closed(&self) -> bool {
+        match self.cursor.try_lock() {
+            Ok(guard) => guard.is_none(),
+            // A batch is being fetched, so the cursor is still open
+            Err(_) => false,
+        }
+    }
+
+    fn __repr__(&self) -> String {
+        format!("Cursor(batch_size={}, closed={})", self.batch_size, self.closed())
+    }
+}
+
 /// Register the mongodb module
 pub fn register_module(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(init, m)?)?;
@@ -3683,7 +4924,10 @@ pub fn register_module(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(close, m)?)?;
     m.add_function(wrap_pyfunction!(reset, m)?)?;
     m.add_function(wrap_pyfunction!(available_features, m)?)?;
+    m.add_function(wrap_pyfunction!(decode_field, m)?)?;
+    m.add_function(wrap_pyfunction!(decode_document, m)?)?;
     m.add_class::<RustDocument>()?;
+    m.add_class::<RustCursor>()?;
 
     // Add module docstring
     m.add("__doc__", "MongoDB ORM module with Beanie compatibility")?;
@@ -73,10 +73,14 @@ except ImportError:
 from . import _engine
 
 # Core classes - Python layer with Beanie-compatible API
-from .document import Document, Settings
+from .document import Document, Settings, RevisionConflictError, BulkSaveError
 from .embedded import EmbeddedDocument
-from .fields import Field, FieldProxy, QueryExpr, merge_filters, text_search, TextSearch, escape_regex
-from .query import QueryBuilder, AggregationBuilder
+from .fields import Field, FieldProxy, QueryExpr, Param, merge_filters, text_search, TextSearch, escape_regex
+from .query import QueryBuilder, PreparedQuery, AggregationBuilder, Page
+from .columns import Column
+from .stats import Stats, FieldStats
+from .cache import QueryCache, CacheStats
+from .unit_of_work import UnitOfWork, unit_of_work
 
 # Lifecycle actions/hooks
 from .actions import (
@@ -101,6 +105,7 @@ from .bulk import (
     ReplaceOne,
     BulkWriteResult,
 )
+from .ingest import InsertChunk, BulkInsertError
 
 # Type support
 from .types import (
@@ -173,18 +178,31 @@ __all__ = [
     # Core
     "Document",
     "Settings",
+    "RevisionConflictError",
+    "BulkSaveError",
     "EmbeddedDocument",
     # Fields
     "Field",
     "FieldProxy",
     "QueryExpr",
+    "Param",
     "merge_filters",
     "text_search",
     "TextSearch",
     "escape_regex",
     # Query
     "QueryBuilder",
+    "PreparedQuery",
     "AggregationBuilder",
+    "Page",
+    "Column",
+    "Stats",
+    "FieldStats",
+    "QueryCache",
+    "CacheStats",
+    # Unit of Work
+    "UnitOfWork",
+    "unit_of_work",
     # Connection
     "init",
     "is_connected",
@@ -208,6 +226,8 @@ __all__ = [
     "DeleteMany",
     "ReplaceOne",
     "BulkWriteResult",
+    "InsertChunk",
+    "BulkInsertError",
     # Type Support
     "PydanticObjectId",
     "Indexed",
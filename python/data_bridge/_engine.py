@@ -10,7 +10,13 @@ Use the public API from data_bridge instead.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import copy
+import functools
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from .cache import QueryCache, clone_document, invalidate_collection
 
 # Import the Rust module
 try:
@@ -22,6 +28,113 @@ except ImportError as e:
     ) from e
 
 
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+R = TypeVar("R")
+
+
+def _write(func: F) -> F:
+    """
+    Mark an engine coroutine as a write to its collection (first argument).
+
+    Cached query results of the collection (see cache.py) are dropped once
+    the write finishes, including when it fails part-way. Reads that were
+    already in flight are no longer shared with later callers.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(collection: str, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(collection, *args, **kwargs)
+        finally:
+            invalidate_collection(collection)
+            _in_flight.pop(collection, None)
+
+    return wrapper  # type: ignore[return-value]
+
+
+# ===================
+# Single-Flight Reads
+# ===================
+
+# Opt-in (see set_single_flight)
+_single_flight_enabled = False
+
+# collection -> read key -> [shared future, number of callers that joined it]
+_in_flight: Dict[str, Dict[Any, List[Any]]] = {}
+
+
+def set_single_flight(enabled: bool) -> None:
+    """
+    Enable or disable single-flight coalescing of identical reads.
+
+    While enabled, a find_one / count / find_as_documents call whose
+    (collection, filter, options) key matches a read that is already in
+    flight awaits that read instead of sending another query. Every
+    caller gets its own copy of the result.
+    """
+    global _single_flight_enabled
+    _single_flight_enabled = enabled
+    if not enabled:
+        _in_flight.clear()
+
+
+def is_single_flight() -> bool:
+    """Check if single-flight read coalescing is enabled."""
+    return _single_flight_enabled
+
+
+async def _single_flight(
+    collection: str,
+    scope: Any,
+    shape: Callable[[], Optional[bytes]],
+    read: Callable[[], Awaitable[R]],
+    copy_result: Callable[[R], R],
+) -> R:
+    """
+    Run read, or join an identical read that is already in flight.
+
+    Reads are identical when collection, scope (operation or document
+    class) and shape (BSON of filter and options, see QueryCache.key)
+    match. The first caller starts the query; callers that arrive while
+    it runs await the same future and receive copy_result(result). The
+    first caller keeps the original result unless others joined, in which
+    case it takes a copy too, so the shared original is never handed out.
+    """
+    if not _single_flight_enabled:
+        return await read()
+    key_bytes = shape()
+    if key_bytes is None:
+        return await read()
+
+    key = (scope, key_bytes)
+    flights = _in_flight.setdefault(collection, {})
+    flight = flights.get(key)
+    if flight is not None:
+        flight[1] += 1
+        # shield: a cancelled follower must not cancel the shared read
+        return copy_result(await asyncio.shield(flight[0]))
+
+    flight = [asyncio.ensure_future(read()), 0]
+    flights[key] = flight
+    try:
+        result = await asyncio.shield(flight[0])
+    finally:
+        flights = _in_flight.get(collection)
+        if flights is not None and flights.get(key) is flight:
+            del flights[key]
+            if not flights:
+                del _in_flight[collection]
+    return copy_result(result) if flight[1] else result
+
+
+def _copy_documents(docs: List[Any]) -> List[Any]:
+    return [clone_document(doc) for doc in docs]
+
+
+def _same(value: R) -> R:
+    return value
+
+
 # ===================
 # Connection Management
 # ===================
@@ -57,8 +170,14 @@ async def find_one(
         Document dict or None
     """
     # T044-T045: Rust find_one now returns PyDict directly (GIL-free conversion)
-    result = await _rust.Document.find_one(collection, filter or {})
-    return result  # Already a dict, no .to_dict() needed
+    # (Already a dict, no .to_dict() needed)
+    return await _single_flight(
+        collection,
+        "find_one",
+        lambda: QueryCache.key("find_one", filter),
+        lambda: _rust.Document.find_one(collection, filter or {}),
+        copy.deepcopy,
+    )
 
 
 async def find(
@@ -135,6 +254,10 @@ async def find_with_options(
 async def count(
     collection: str,
     filter: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = None,
+    skip: Optional[int] = None,
+    hint: Union[str, Dict[str, Any], None] = None,
+    max_time_ms: Optional[int] = None,
 ) -> int:
     """
     Count matching documents.
@@ -142,11 +265,42 @@ async def count(
     Args:
         collection: Collection name
         filter: Query filter
+        limit: Stop counting after this many matches
+        skip: Number of matches to skip before counting
+        hint: Index to use (index name or key spec dict)
+        max_time_ms: Server-side time limit in milliseconds
 
     Returns:
         Document count
     """
-    return await _rust.Document.count(collection, filter or {})
+    options = {
+        name: value
+        for name, value in (("limit", limit), ("skip", skip), ("hint", hint), ("max_time_ms", max_time_ms))
+        if value is not None
+    }
+    return await _single_flight(
+        collection,
+        "count",
+        # A call only joins a count with the same hint and time limit
+        lambda: QueryCache.key("count", filter, skip=skip, limit=limit,
+                               options={"hint": hint, "max_time_ms": max_time_ms}),
+        lambda: _rust.Document.count(collection, filter or {}, **options),
+        _same,
+    )
+
+
+async def estimated_count(collection: str, max_time_ms: Optional[int] = None) -> int:
+    """
+    Estimate the number of documents in a collection from its metadata.
+
+    Args:
+        collection: Collection name
+        max_time_ms: Server-side time limit in milliseconds
+
+    Returns:
+        Estimated document count
+    """
+    return await _rust.Document.estimated_count(collection, max_time_ms=max_time_ms)
 
 
 # ===================
@@ -154,6 +308,7 @@ async def count(
 # ===================
 
 
+@_write
 async def insert_one(
     collection: str,
     document: Dict[str, Any],
@@ -180,14 +335,14 @@ async def insert_one(
 
     # Use validated save if document_class is provided, validation is enabled, and save_validated exists
     if document_class and use_validation and hasattr(doc, 'save_validated'):
-        from .type_extraction import extract_schema
-        schema = extract_schema(document_class)
+        schema = document_class._plan.schema
         return await doc.save_validated(schema)
     else:
         # Fallback to regular save
         return await doc.save()
 
 
+@_write
 async def insert_many(
     collection: str,
     documents: List[Dict[str, Any]],
@@ -221,6 +376,7 @@ async def insert_many(
 # ===================
 
 
+@_write
 async def update_one(
     collection: str,
     filter: Dict[str, Any],
@@ -239,6 +395,12 @@ async def update_one(
     Returns:
         Number of modified documents (0 or 1)
     """
+    # The Rust fast path only takes $set fields; other operators ($unset, ...)
+    # go through update_one_with_options
+    if any(key != "$set" and key.startswith("$") for key in update):
+        result = await update_one_with_options(collection, filter, update)
+        return result["modified_count"]
+
     # Handle $set wrapper
     if "$set" in update:
         update_doc = update["$set"]
@@ -255,6 +417,7 @@ async def update_one(
     return await _rust.Document.update_one(collection, filter, update_doc)
 
 
+@_write
 async def update_many(
     collection: str,
     filter: Dict[str, Any],
@@ -292,6 +455,7 @@ async def update_many(
 # ===================
 
 
+@_write
 async def delete_one(
     collection: str,
     filter: Dict[str, Any],
@@ -318,6 +482,7 @@ async def delete_one(
         return 0
 
 
+@_write
 async def delete_many(
     collection: str,
     filter: Dict[str, Any],
@@ -343,6 +508,8 @@ async def delete_many(
 async def aggregate(
     collection: str,
     pipeline: List[Dict[str, Any]],
+    batch_size: Optional[int] = None,
+    allow_disk_use: Optional[bool] = None,
 ) -> List[Dict[str, Any]]:
     """
     Run an aggregation pipeline.
@@ -350,13 +517,20 @@ async def aggregate(
     Args:
         collection: Collection name
         pipeline: Aggregation pipeline stages
+        batch_size: Documents per server batch
+        allow_disk_use: Let blocking stages ($sort, $group) spill to disk
 
     Returns:
         List of result documents
     """
+    options = {
+        name: value
+        for name, value in (("batch_size", batch_size), ("allow_disk_use", allow_disk_use))
+        if value is not None
+    }
     # Check if Rust has aggregate
     if hasattr(_rust.Document, "aggregate"):
-        results = await _rust.Document.aggregate(collection, pipeline)
+        results = await _rust.Document.aggregate(collection, pipeline, **options)
         return [doc.to_dict() if hasattr(doc, "to_dict") else doc for doc in results]
     else:
         # Aggregation not implemented in Rust yet
@@ -366,11 +540,103 @@ async def aggregate(
         )
 
 
+async def iter_aggregate_batches(
+    collection: str,
+    pipeline: List[Dict[str, Any]],
+    document_class: Optional[type] = None,
+    batch_size: int = 1000,
+    allow_disk_use: Optional[bool] = None,
+) -> AsyncIterator[List[Any]]:
+    """
+    Stream aggregation results from a server-side cursor, batch by batch.
+
+    Results are decoded from raw BSON straight into dicts, or into
+    instances of document_class (loaded polymorphically, like
+    find_as_documents()).
+
+    Args:
+        collection: Collection name
+        pipeline: Aggregation pipeline stages
+        document_class: Document subclass to instantiate (None yields dicts)
+        batch_size: Documents per batch
+        allow_disk_use: Let blocking stages ($sort, $group) spill to disk
+
+    Yields:
+        Lists of results, each at most batch_size long
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+
+    cursor = await _rust.Document.open_aggregate_cursor(
+        collection,
+        pipeline,
+        document_class,
+        batch_size=batch_size,
+        allow_disk_use=allow_disk_use,
+        class_map=_class_map(document_class) if document_class is not None else None,
+    )
+    async with aclosing(_drain_cursor(cursor)) as batches:
+        async for batch in batches:
+            yield batch
+
+
+async def find_columns(
+    collection: str,
+    fields: List[str],
+    filter: Optional[Dict[str, Any]] = None,
+    sort: Optional[Dict[str, int]] = None,
+    skip: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> Dict[str, Tuple[str, Any, Optional[bytes]]]:
+    """
+    Find documents and decode the given fields into typed columns.
+
+    Args:
+        collection: Collection name
+        fields: Field names to decode (dotted paths allowed)
+        filter: Query filter
+        sort: Sort specification {field: 1 or -1}
+        skip: Number of documents to skip
+        limit: Maximum documents to return
+
+    Returns:
+        Dict of field name to (kind, values, mask)
+    """
+    return await _rust.Document.find_columns(
+        collection,
+        list(fields),
+        filter or {},
+        sort=sort,
+        skip=skip,
+        limit=limit,
+    )
+
+
+async def aggregate_columns(
+    collection: str,
+    pipeline: List[Dict[str, Any]],
+    fields: List[str],
+) -> Dict[str, Tuple[str, Any, Optional[bytes]]]:
+    """
+    Run an aggregation pipeline and decode the given fields into typed columns.
+
+    Args:
+        collection: Collection name
+        pipeline: Aggregation pipeline stages
+        fields: Field names to decode (dotted paths allowed)
+
+    Returns:
+        Dict of field name to (kind, values, mask)
+    """
+    return await _rust.Document.aggregate_columns(collection, pipeline, list(fields))
+
+
 # ===================
 # Upsert Operations
 # ===================
 
 
+@_write
 async def update_one_with_options(
     collection: str,
     filter: Dict[str, Any],
@@ -399,6 +665,7 @@ async def update_one_with_options(
         return {"matched_count": count, "modified_count": count, "upserted_id": None}
 
 
+@_write
 async def update_many_with_options(
     collection: str,
     filter: Dict[str, Any],
@@ -431,6 +698,7 @@ async def update_many_with_options(
 # ===================
 
 
+@_write
 async def replace_one(
     collection: str,
     filter: Dict[str, Any],
@@ -500,6 +768,7 @@ async def distinct(
 # ===================
 
 
+@_write
 async def find_one_and_update(
     collection: str,
     filter: Dict[str, Any],
@@ -542,6 +811,7 @@ async def find_one_and_update(
         return None
 
 
+@_write
 async def find_one_and_replace(
     collection: str,
     filter: Dict[str, Any],
@@ -582,6 +852,7 @@ async def find_one_and_replace(
         return None
 
 
+@_write
 async def find_one_and_delete(
     collection: str,
     filter: Dict[str, Any],
@@ -615,6 +886,23 @@ async def find_one_and_delete(
 # ===================
 
 
+def _class_map(document_class: type) -> Optional[Dict[str, type]]:
+    """Return the _class_id -> class map for inheritance hierarchies, else None."""
+    child_classes = getattr(document_class, "_child_classes", None)
+    if child_classes and len(child_classes) > 1:
+        return child_classes
+    return None
+
+
+def _lazy_data_class(document_class: type) -> Optional[type]:
+    """Return the lazy _data class for models with Settings.lazy_decode, else None."""
+    settings = getattr(document_class, "_settings", None)
+    if not getattr(settings, "lazy_decode", False) or not hasattr(_rust, "decode_field"):
+        return None
+    from .lazy import LazyFieldDict
+    return LazyFieldDict
+
+
 async def find_as_documents(
     collection: str,
     document_class: type,
@@ -622,6 +910,7 @@ async def find_as_documents(
     sort: Optional[Dict[str, int]] = None,
     skip: Optional[int] = None,
     limit: Optional[int] = None,
+    projection: Optional[Dict[str, int]] = None,
 ) -> List[Any]:
     """
     Find documents and return as typed Document instances.
@@ -629,8 +918,15 @@ async def find_as_documents(
     This is an optimized version that creates Python objects directly in Rust,
     avoiding intermediate dict conversion.
 
-    For document inheritance hierarchies (root classes with children), this
-    falls back to the Python path to enable polymorphic loading via _from_db().
+    For document inheritance hierarchies (root classes with children), the
+    _class_id -> class map is handed to Rust, which builds each document as
+    its concrete subclass while decoding.
+
+    With a projection, each instance is marked as partially loaded: its
+    _loaded_fields attribute holds the names of the fields that were fetched.
+
+    Models with Settings.lazy_decode get a LazyFieldDict as _data, which
+    decodes each field from the raw BSON on first access.
 
     Args:
         collection: Collection name
@@ -639,35 +935,115 @@ async def find_as_documents(
         sort: Sort specification {field: 1 or -1}
         skip: Number of documents to skip
         limit: Maximum documents to return
+        projection: Fields to include/exclude
 
     Returns:
         List of document instances (typed, may be polymorphic subclasses)
     """
-    # Check if this class is part of an inheritance hierarchy with children
-    # If so, we need Python's _from_db() for polymorphic loading
-    has_children = (
-        hasattr(document_class, "_child_classes")
-        and document_class._child_classes
-        and len(document_class._child_classes) > 1
+    async def read() -> List[Any]:
+        # Use optimized Rust path (polymorphic via the _class_id map)
+        if hasattr(_rust.Document, "find_as_documents"):
+            return await _rust.Document.find_as_documents(
+                collection,
+                document_class,
+                filter or {},
+                sort=sort,
+                skip=skip,
+                limit=limit,
+                projection=projection or None,
+                lazy_class=_lazy_data_class(document_class),
+                class_map=_class_map(document_class),
+            )
+        else:
+            # Fallback to Python path (enables polymorphic loading via _from_db)
+            results = await find_with_options(
+                collection, filter, sort, skip, limit, projection or None
+            )
+            # Database data is already valid, skip validation for 2-3x speedup
+            docs = [document_class._from_db(doc, validate=False) for doc in results]
+            if projection:
+                for doc in docs:
+                    doc._loaded_fields = frozenset(doc._data)
+            return docs
+
+    return await _single_flight(
+        collection,
+        document_class,
+        lambda: QueryCache.key("find", filter, sort, skip, limit, projection),
+        read,
+        _copy_documents,
     )
 
-    # Use optimized Rust path for non-polymorphic classes
-    if hasattr(_rust.Document, "find_as_documents") and not has_children:
-        return await _rust.Document.find_as_documents(
-            collection,
-            document_class,
-            filter or {},
-            sort=sort,
-            skip=skip,
-            limit=limit,
-        )
-    else:
-        # Fallback to Python path (enables polymorphic loading via _from_db)
-        results = await find_with_options(
-            collection, filter, sort, skip, limit
-        )
-        # Database data is already valid, skip validation for 2-3x speedup
-        return [document_class._from_db(doc, validate=False) for doc in results]
+
+async def iter_document_batches(
+    collection: str,
+    document_class: type,
+    filter: Optional[Dict[str, Any]] = None,
+    sort: Optional[Dict[str, int]] = None,
+    skip: Optional[int] = None,
+    limit: Optional[int] = None,
+    batch_size: int = 1000,
+    projection: Optional[Dict[str, int]] = None,
+) -> AsyncIterator[List[Any]]:
+    """
+    Stream typed Document instances from a server-side cursor, batch by batch.
+
+    At most one driver batch is held in memory at a time. The getMore for the
+    next batch is issued before the current batch is handed to the caller, so
+    network I/O and decoding overlap with the caller's processing.
+
+    Inheritance hierarchies are loaded polymorphically, like
+    find_as_documents().
+
+    Args:
+        collection: Collection name
+        document_class: The Document subclass to instantiate
+        filter: Query filter
+        sort: Sort specification {field: 1 or -1}
+        skip: Number of documents to skip
+        limit: Maximum documents to return
+        batch_size: Documents per batch
+        projection: Fields to include/exclude
+
+    Yields:
+        Lists of document instances, each at most batch_size long
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be greater than 0")
+
+    cursor = await _rust.Document.open_cursor(
+        collection,
+        document_class,
+        filter or {},
+        sort=sort,
+        skip=skip,
+        limit=limit,
+        batch_size=batch_size,
+        projection=projection or None,
+        lazy_class=_lazy_data_class(document_class),
+        class_map=_class_map(document_class),
+    )
+
+    async with aclosing(_drain_cursor(cursor)) as batches:
+        async for batch in batches:
+            yield batch
+
+
+async def _drain_cursor(cursor: Any) -> AsyncIterator[List[Any]]:
+    """Yield the batches of a Rust cursor, prefetching the next one, and close it."""
+    pending = cursor.next_batch()
+    try:
+        while True:
+            batch = await pending
+            if not batch:
+                break
+            # Start fetching the next batch while the caller consumes this one
+            pending = cursor.next_batch()
+            yield batch
+    finally:
+        if not pending.done():
+            pending.cancel()
+        await cursor.close()
 
 
 # ===================
@@ -675,6 +1051,7 @@ async def find_as_documents(
 # ===================
 
 
+@_write
 async def bulk_write(
     collection: str,
     operations: List[Dict[str, Any]],
@@ -692,7 +1069,8 @@ async def bulk_write(
             - update: Update operations (for update_one/update_many)
             - replacement: Replacement document (for replace_one)
             - upsert: If True, insert if no match (for update/replace)
-        ordered: If True, stop on first error. If False, continue with remaining ops.
+        ordered: If True, run the ops one after another and stop on first error.
+            If False, run them concurrently and continue past errors.
 
     Returns:
         Dict with:
@@ -702,6 +1080,10 @@ async def bulk_write(
             - deleted_count: Number of deleted documents
             - upserted_count: Number of upserted documents
             - upserted_ids: Dict mapping operation index to upserted _id
+            - unmatched_indices: Indices of update_one/replace_one operations
+              that matched no document (and upserted none)
+            - errors: Dict mapping operation index to error message for the
+              operations that failed (ordered=False; ordered=True raises)
 
     Example:
         >>> from data_bridge import UpdateOne, InsertOne, DeleteOne
@@ -724,6 +1106,8 @@ async def bulk_write(
                 "deleted_count": result.deleted_count,
                 "upserted_count": result.upserted_count,
                 "upserted_ids": result.upserted_ids,
+                "unmatched_indices": list(getattr(result, "unmatched_indices", [])),
+                "errors": dict(getattr(result, "errors", {})),
             }
     else:
         # Fallback: execute operations one by one
@@ -733,6 +1117,8 @@ async def bulk_write(
         deleted_count = 0
         upserted_count = 0
         upserted_ids: Dict[int, str] = {}
+        unmatched_indices: List[int] = []
+        errors: Dict[int, str] = {}
 
         for idx, op in enumerate(operations):
             op_type = op.get("op")
@@ -744,6 +1130,8 @@ async def bulk_write(
                     result = await update_one_with_options(
                         collection, op["filter"], op["update"], op.get("upsert", False)
                     )
+                    if not result.get("matched_count") and not result.get("upserted_id"):
+                        unmatched_indices.append(idx)
                     matched_count += result.get("matched_count", 0)
                     modified_count += result.get("modified_count", 0)
                     if result.get("upserted_id"):
@@ -766,6 +1154,8 @@ async def bulk_write(
                     result = await replace_one(
                         collection, op["filter"], op["replacement"], op.get("upsert", False)
                     )
+                    if not result.get("matched_count") and not result.get("upserted_id"):
+                        unmatched_indices.append(idx)
                     matched_count += result.get("matched_count", 0)
                     modified_count += result.get("modified_count", 0)
                     if result.get("upserted_id"):
@@ -774,8 +1164,8 @@ async def bulk_write(
             except Exception as e:
                 if ordered:
                     raise
-                # In unordered mode, continue with remaining operations
-                continue
+                # In unordered mode, record the error and continue with remaining operations
+                errors[idx] = str(e)
 
         return {
             "inserted_count": inserted_count,
@@ -784,6 +1174,8 @@ async def bulk_write(
             "deleted_count": deleted_count,
             "upserted_count": upserted_count,
             "upserted_ids": upserted_ids,
+            "unmatched_indices": unmatched_indices,
+            "errors": errors,
         }
 
 
@@ -32,6 +32,7 @@ from __future__ import annotations
 import asyncio
 import functools
 from enum import Enum, auto
+from types import FunctionType
 from typing import Any, Callable, List, Optional, TYPE_CHECKING, Type, Union
 
 if TYPE_CHECKING:
@@ -70,7 +71,9 @@ class ActionRegistry:
     Registry for document lifecycle actions.
 
     Stores before/after handlers keyed by event type.
-    Each Document class has its own registry.
+    Each Document class has its own registry, compiled once when the class
+    is created (see collect_actions), so dispatch only touches the handlers
+    registered for the event.
     """
 
     def __init__(self) -> None:
@@ -107,6 +110,16 @@ class ActionRegistry:
             handlers.extend(self._after.get(EventType.REPLACE, []))
         return handlers
 
+    @property
+    def has_before(self) -> bool:
+        """True if any before-event handler is registered."""
+        return bool(self._before)
+
+    @property
+    def has_after(self) -> bool:
+        """True if any after-event handler is registered."""
+        return bool(self._after)
+
 
 # Global registry storage (per Document class)
 _registries: dict[type, ActionRegistry] = {}
@@ -114,11 +127,50 @@ _registries: dict[type, ActionRegistry] = {}
 
 def get_registry(document_class: type) -> ActionRegistry:
     """Get or create the action registry for a document class."""
+    plan = getattr(document_class, "_plan", None)
+    if plan is not None and plan.model is document_class:
+        return plan.actions
     if document_class not in _registries:
         _registries[document_class] = ActionRegistry()
     return _registries[document_class]
 
 
+def collect_actions(document_class: type) -> ActionRegistry:
+    """
+    Build the action registry of a document class from its decorated methods.
+
+    Scans the class and its bases once for methods marked with
+    @before_event / @after_event. Handlers run in method-name order, and a
+    method overridden without a decorator is no longer a handler.
+
+    Args:
+        document_class: Document class
+
+    Returns:
+        ActionRegistry with the class's handlers
+    """
+    methods: dict[str, Any] = {}
+    for klass in reversed(document_class.__mro__):
+        for name, attr in vars(klass).items():
+            if not name.startswith("_"):
+                methods[name] = attr
+
+    registry = ActionRegistry()
+    for name in sorted(methods):
+        attr = methods[name]
+        if isinstance(attr, (staticmethod, classmethod)):
+            func = attr.__func__
+        elif isinstance(attr, FunctionType):
+            func = attr
+        else:
+            continue
+        for event in getattr(func, "_before_events", ()):
+            registry.register_before(event, attr)
+        for event in getattr(func, "_after_events", ()):
+            registry.register_after(event, attr)
+    return registry
+
+
 # ===================
 # Event Decorators
 # ===================
@@ -194,38 +246,17 @@ async def run_before_event(document: "Document", event: EventType) -> None:
         document: The document instance
         event: The event type
     """
-    # Fast path: Skip expensive iteration if no hooks exist
-    # Cache hook existence per class to avoid repeated dir() calls
     doc_class = document.__class__
-    if not hasattr(doc_class, '_has_before_hooks_cache'):
-        # First time checking this class - scan for hooks
-        has_hooks = False
-        for method_name in dir(document):
-            if method_name.startswith("_"):
-                continue
-            method = getattr(document, method_name, None)
-            if method and callable(method) and hasattr(method, "_before_events"):
-                has_hooks = True
-                break
-        doc_class._has_before_hooks_cache = has_hooks
-
-    # Early return if no hooks registered for this class
-    if not doc_class._has_before_hooks_cache:
-        return
+    registry = get_registry(doc_class)
 
-    # Collect handlers from class methods with decorators
-    for method_name in dir(document):
-        if method_name.startswith("_"):
-            continue
-        method = getattr(document, method_name, None)
-        if method is None or not callable(method):
-            continue
+    # Fast path: most classes have no hooks at all
+    if not registry.has_before:
+        return
 
-        # Check for before_event decorator
-        if hasattr(method, "_before_events") and event in method._before_events:
-            result = method()
-            if asyncio.iscoroutine(result):
-                await result
+    for handler in registry._before.get(event, ()):
+        result = handler.__get__(document, doc_class)()
+        if asyncio.iscoroutine(result):
+            await result
 
 
 async def run_after_event(document: "Document", event: EventType) -> None:
@@ -236,38 +267,17 @@ async def run_after_event(document: "Document", event: EventType) -> None:
         document: The document instance
         event: The event type
     """
-    # Fast path: Skip expensive iteration if no hooks exist
-    # Cache hook existence per class to avoid repeated dir() calls
     doc_class = document.__class__
-    if not hasattr(doc_class, '_has_after_hooks_cache'):
-        # First time checking this class - scan for hooks
-        has_hooks = False
-        for method_name in dir(document):
-            if method_name.startswith("_"):
-                continue
-            method = getattr(document, method_name, None)
-            if method and callable(method) and hasattr(method, "_after_events"):
-                has_hooks = True
-                break
-        doc_class._has_after_hooks_cache = has_hooks
-
-    # Early return if no hooks registered for this class
-    if not doc_class._has_after_hooks_cache:
-        return
+    registry = get_registry(doc_class)
 
-    # Collect handlers from class methods with decorators
-    for method_name in dir(document):
-        if method_name.startswith("_"):
-            continue
-        method = getattr(document, method_name, None)
-        if method is None or not callable(method):
-            continue
+    # Fast path: most classes have no hooks at all
+    if not registry.has_after:
+        return
 
-        # Check for after_event decorator
-        if hasattr(method, "_after_events") and event in method._after_events:
-            result = method()
-            if asyncio.iscoroutine(result):
-                await result
+    for handler in registry._after.get(event, ()):
+        result = handler.__get__(document, doc_class)()
+        if asyncio.iscoroutine(result):
+            await result
 
 
 # ===================
@@ -309,4 +319,5 @@ __all__ = [
     "run_validate_on_save",
     "ActionRegistry",
     "get_registry",
+    "collect_actions",
 ]
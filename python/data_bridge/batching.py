@@ -0,0 +1,130 @@
+"""
+DataLoader-style batching of primary-key loads.
+
+Models that set ``Settings.use_batch_loading = True`` collect the
+``get(id)`` / ``find_one({"_id": id})`` calls issued in the same
+event-loop tick and load them with a single
+``{"_id": {"$in": [...]}}`` query through the Rust fast path. Each
+caller gets the document with its own id, or None.
+
+Call sites do not change; N concurrent lookups become one round trip:
+
+    >>> class User(Document):
+    ...     name: str
+    ...
+    ...     class Settings:
+    ...         name = "users"
+    ...         use_batch_loading = True
+    >>>
+    >>> users = await asyncio.gather(*(User.get(uid) for uid in ids))  # 1 query
+
+Lookups that ask for the same id in one batch each get their own
+instance, so callers never share mutable documents.
+
+Batched lookups do not go through the query cache (Settings.use_cache);
+inside ``unit_of_work()`` ids already in the identity map are not queued.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache import clone_document
+
+# Pending lookups of one batch: str(id) -> (id as queried, futures awaiting that document)
+_Batch = Dict[str, Tuple[Any, List["asyncio.Future[Any]"]]]
+
+
+class BatchLoader:
+    """
+    Collects primary-key lookups for one Document class and runs them in batches.
+
+    Built by DocumentMeta for models with ``Settings.use_batch_loading``
+    and stored as ``cls._batch_loader``.
+
+    Args:
+        document_class: Document class to load
+        max_batch_size: Maximum number of ids per $in query
+    """
+
+    def __init__(self, document_class: type, max_batch_size: int = 1000) -> None:
+        if max_batch_size < 1:
+            raise ValueError("batch_loading_max_size must be at least 1")
+        self.document_class = document_class
+        self.max_batch_size = max_batch_size
+        # One open batch per event loop
+        self._batches: Dict[asyncio.AbstractEventLoop, _Batch] = {}
+
+    @classmethod
+    def from_settings(cls, document_class: type, settings: Any) -> Optional["BatchLoader"]:
+        """Build the loader configured by a Settings class, or None if batching is off."""
+        if not getattr(settings, "use_batch_loading", False):
+            return None
+        return cls(document_class, getattr(settings, "batch_loading_max_size", 1000))
+
+    def load(self, doc_id: Any) -> "asyncio.Future[Any]":
+        """
+        Queue a lookup by _id.
+
+        The batch is sent once the event loop finishes the current tick,
+        so every lookup issued until then shares one query.
+
+        Returns:
+            Future resolving to the document, or None if it does not exist
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._batches.get(loop)
+        if batch is None:
+            batch = self._batches[loop] = {}
+            loop.call_soon(self._dispatch, loop)
+        # Group by the id's string form (Document._id), query with the value as given
+        batch.setdefault(str(doc_id), (doc_id, []))[1].append(future)
+        return future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch = self._batches.pop(loop)
+        items = list(batch.items())
+        for start in range(0, len(items), self.max_batch_size):
+            loop.create_task(self._run(items[start:start + self.max_batch_size]))
+
+    async def _run(self, items: List[Tuple[str, Tuple[Any, List["asyncio.Future[Any]"]]]]) -> None:
+        from . import _engine
+
+        doc_class = self.document_class
+        try:
+            docs = await _engine.find_as_documents(
+                doc_class.__collection_name__(),
+                doc_class,
+                {"_id": {"$in": [doc_id for _, (doc_id, _) in items]}},
+            )
+        except asyncio.CancelledError:
+            for _, (_, futures) in items:
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as exc:
+            for _, (_, futures) in items:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        docs_by_id = {str(doc._id): doc for doc in docs}
+        for key, (_, futures) in items:
+            doc = docs_by_id.get(key)
+            for index, future in enumerate(futures):
+                if future.done():
+                    continue  # Caller was cancelled
+                if doc is not None and index > 0:
+                    # Same id requested twice: every caller gets its own instance
+                    future.set_result(clone_document(doc))
+                else:
+                    future.set_result(doc)
+
+    def __repr__(self) -> str:
+        return f"BatchLoader({self.document_class.__name__}, max_batch_size={self.max_batch_size})"
+
+
+__all__ = ["BatchLoader"]
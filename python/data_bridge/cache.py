@@ -0,0 +1,270 @@
+"""
+Process-local query result cache.
+
+Models that set ``Settings.use_cache = True`` keep the results of
+``find()``, ``find_one()`` and ``count()`` in a per-class LRU cache, so
+repeated reads of slowly-changing reference collections skip the
+database round trip.
+
+Entries are keyed by the query shape: the BSON of the filter, sort,
+skip, limit and projection. The cache is bounded by
+``Settings.cache_capacity`` (LRU) and ``Settings.cache_expiration_time``
+(TTL). Every write that goes through the engine (save, delete, update,
+replace, insert_many, bulk_write, ...) drops all cached entries of the
+written collection, so a process always reads its own writes. Writes
+made by other processes are only picked up once entries expire.
+
+Cached documents are kept as snapshots: each hit builds fresh instances,
+so mutating a returned document never changes what the cache holds.
+
+Example:
+    >>> from datetime import timedelta
+    >>> class Country(Document):
+    ...     code: str
+    ...     name: str
+    ...
+    ...     class Settings:
+    ...         name = "countries"
+    ...         use_cache = True
+    ...         cache_capacity = 256
+    ...         cache_expiration_time = timedelta(minutes=5)
+    >>>
+    >>> await Country.find(Country.code == "NL").to_list()  # database
+    >>> await Country.find(Country.code == "NL").to_list()  # cache
+    >>> Country.cache_stats()
+    CacheStats(hits=1, misses=1, evictions=0, invalidations=0, size=1)
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+import bson
+from bson.errors import InvalidDocument
+
+T = TypeVar("T")
+
+# Caches by collection name, for write invalidation
+_collection_caches: Dict[str, "weakref.WeakSet[QueryCache]"] = {}
+
+# Cached document: (class, _id, data, revision_id, loaded_fields)
+_Snapshot = Tuple[type, Optional[str], Dict[str, Any], Optional[int], Any]
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of one query cache.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that went to the database
+        evictions: Entries dropped because the cache was full or expired
+        invalidations: Times the cache was cleared by a write to its collection
+        size: Entries currently cached
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+def _snapshot(doc: Any) -> _Snapshot:
+    """Copy a loaded document into a cache entry."""
+    return (type(doc), doc._id, _copy_data(type(doc), doc._data), doc._revision_id, doc._loaded_fields)
+
+
+def _restore(snapshot: _Snapshot) -> Any:
+    """Build a fresh document instance from a cache entry."""
+    doc_class, _id, data, revision_id, loaded_fields = snapshot
+    doc = doc_class._loader(_id, _copy_data(doc_class, data), revision_id)
+    if loaded_fields is not None:
+        doc._loaded_fields = loaded_fields
+    return doc
+
+
+def clone_document(doc: Any) -> Any:
+    """Build an independent copy of a loaded document (shares only scalar values)."""
+    return _restore(_snapshot(doc))
+
+
+def _copy_data(doc_class: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy document data; scalar fields are shared, everything else is deep-copied."""
+    passthrough = doc_class._plan.passthrough_fields
+    return {
+        key: value if key in passthrough else copy.deepcopy(value)
+        for key, value in data.items()
+    }
+
+
+class QueryCache:
+    """
+    LRU + TTL cache of query results for one Document class.
+
+    Built by DocumentMeta for models with ``Settings.use_cache`` and
+    stored as ``cls._query_cache``.
+
+    Args:
+        collection: Collection whose writes invalidate this cache
+        capacity: Maximum number of cached query shapes
+        ttl: Seconds an entry stays valid (None = until invalidated)
+    """
+
+    def __init__(self, collection: str, capacity: int = 32, ttl: Optional[float] = None) -> None:
+        if capacity < 1:
+            raise ValueError("cache_capacity must be at least 1")
+        self.collection = collection
+        self.capacity = capacity
+        self.ttl = ttl
+        # key -> (expires_at or None, value)
+        self._entries: "OrderedDict[bytes, Tuple[Optional[float], Any]]" = OrderedDict()
+        # Bumped on every invalidation; results of queries that started
+        # before a write are not stored
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        _collection_caches.setdefault(collection, weakref.WeakSet()).add(self)
+
+    @classmethod
+    def from_settings(cls, collection: str, settings: Any) -> Optional["QueryCache"]:
+        """Build the cache configured by a Settings class, or None if caching is off."""
+        if not getattr(settings, "use_cache", False):
+            return None
+        ttl: Union[timedelta, float, None] = getattr(settings, "cache_expiration_time", None)
+        if isinstance(ttl, timedelta):
+            ttl = ttl.total_seconds()
+        return cls(collection, getattr(settings, "cache_capacity", 32), ttl)
+
+    @staticmethod
+    def key(op: str, filter: Optional[dict], sort: Optional[dict] = None, skip: Optional[int] = None,
+            limit: Optional[int] = None, projection: Optional[dict] = None,
+            options: Optional[dict] = None) -> Optional[bytes]:
+        """
+        Build the cache key of a query shape.
+
+        Args:
+            options: Other settings that must match for two queries to
+                share a key (e.g. hint, max_time_ms)
+
+        Returns:
+            BSON bytes of the query shape, or None if the filter holds
+            values BSON cannot encode (such queries are not cached)
+        """
+        try:
+            return bson.encode({
+                "op": op,
+                "filter": filter or {},
+                "sort": sort,
+                "skip": skip,
+                "limit": limit,
+                "projection": projection,
+                "options": options,
+            })
+        except (InvalidDocument, OverflowError, TypeError):
+            return None
+
+    # ----- lookups -----
+
+    async def documents(self, key: Optional[bytes], query: Callable[[], Awaitable[List[Any]]]) -> List[Any]:
+        """Return cached documents for key, or run query and cache its result."""
+        if key is None:
+            return await query()
+        snapshots = self._get(key)
+        if snapshots is not _MISSING:
+            return [_restore(snapshot) for snapshot in snapshots]
+
+        generation = self._generation
+        docs = await query()
+        if generation == self._generation:
+            self._put(key, [_snapshot(doc) for doc in docs])
+        return docs
+
+    async def value(self, key: Optional[bytes], query: Callable[[], Awaitable[T]]) -> T:
+        """Return a cached immutable value (e.g. a count) for key, or run query and cache it."""
+        if key is None:
+            return await query()
+        cached = self._get(key)
+        if cached is not _MISSING:
+            return cached
+
+        generation = self._generation
+        result = await query()
+        if generation == self._generation:
+            self._put(key, result)
+        return result
+
+    def _get(self, key: bytes) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            del self._entries[key]
+            self._evictions += 1
+        self._misses += 1
+        return _MISSING
+
+    def _put(self, key: bytes, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    # ----- maintenance -----
+
+    def invalidate(self) -> None:
+        """Drop all entries (called after writes to the collection)."""
+        self._generation += 1
+        if self._entries:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._generation += 1
+        self._entries.clear()
+        self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"QueryCache({self.collection!r}, capacity={self.capacity}, ttl={self.ttl}, size={len(self)})"
+
+
+def invalidate_collection(collection: str) -> None:
+    """Drop the cached query results of every model stored in collection."""
+    caches = _collection_caches.get(collection)
+    if caches:
+        for cache in list(caches):
+            cache.invalidate()
+
+
+__all__ = ["QueryCache", "CacheStats", "invalidate_collection", "clone_document"]
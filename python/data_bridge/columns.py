@@ -0,0 +1,119 @@
+"""
+Columnar query results.
+
+The Rust backend decodes query results straight from raw BSON into one
+typed buffer per requested field, so analytics-style reads never build a
+Python dict or Document per row. This module turns those buffers into
+NumPy arrays when NumPy is installed, or into ``array.array`` / lists
+otherwise.
+
+Example:
+    >>> cols = await Trade.find(Trade.symbol == "AAPL").to_columns(
+    ...     Trade.price, Trade.qty, Trade.ts
+    ... )
+    >>> cols["price"].values          # numpy.ndarray (float64)
+    >>> cols["price"].mask            # bool array, True where missing/None
+    >>> cols["price"].masked()        # numpy.ma.MaskedArray
+
+Column kinds:
+    - float64: ints and doubles (missing values are NaN and masked)
+    - int64: ints only (missing values are 0 and masked)
+    - bool
+    - datetime64[ms]: BSON dates
+    - object: strings, ObjectIds (as hex strings), or mixed/nested values
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    NUMPY_AVAILABLE = False
+
+
+# Raw column format shared with the Rust backend:
+#   field -> (kind, values, mask)
+# where values is native-endian bytes (list for "object") and mask is
+# bytes with 1 for missing entries, or None when nothing is missing.
+RawColumns = Dict[str, Tuple[str, Any, Optional[bytes]]]
+
+_ARRAY_TYPECODES = {
+    "float64": "d",
+    "int64": "q",
+    "bool": "b",
+    "datetime64[ms]": "q",
+}
+
+
+class Column(NamedTuple):
+    """
+    A single decoded result column.
+
+    Attributes:
+        kind: Column kind ("float64", "int64", "bool", "datetime64[ms]", "object")
+        values: numpy.ndarray, or array.array / list when NumPy is unavailable
+        mask: Boolean mask (True = missing) or None when no value is missing
+    """
+
+    kind: str
+    values: Any
+    mask: Any = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def masked(self) -> Any:
+        """
+        Return the column as a ``numpy.ma.MaskedArray``.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required for masked columns")
+        return np.ma.MaskedArray(self.values, mask=self.mask if self.mask is not None else False)
+
+
+def build_columns(raw: RawColumns) -> Dict[str, Column]:
+    """
+    Wrap raw column buffers from the backend as Column objects.
+
+    Buffers are wrapped without copying when NumPy is available.
+
+    Args:
+        raw: Mapping of field name to (kind, values, mask)
+
+    Returns:
+        Dict of field name to Column
+    """
+    columns: Dict[str, Column] = {}
+    for name, (kind, values, mask) in raw.items():
+        if NUMPY_AVAILABLE:
+            if kind == "object":
+                arr = np.empty(len(values), dtype=object)
+                arr[:] = values
+            else:
+                arr = np.frombuffer(values, dtype=np.dtype(kind))
+            np_mask = np.frombuffer(mask, dtype=np.bool_) if mask is not None else None
+            columns[name] = Column(kind, arr, np_mask)
+        else:
+            if kind == "object":
+                py_values: Any = list(values)
+            else:
+                py_values = array(_ARRAY_TYPECODES[kind])
+                py_values.frombytes(values)
+            py_mask = array("b", mask) if mask is not None else None
+            columns[name] = Column(kind, py_values, py_mask)
+    return columns
+
+
+__all__ = [
+    "Column",
+    "NUMPY_AVAILABLE",
+    "build_columns",
+]
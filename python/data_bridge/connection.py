@@ -35,6 +35,7 @@ async def init(
     password: Optional[str] = None,
     auth_source: Optional[str] = None,
     replica_set: Optional[str] = None,
+    single_flight: Optional[bool] = None,
     **options: str,
 ) -> None:
     """
@@ -54,6 +55,9 @@ async def init(
         password: Authentication password
         auth_source: Authentication database (default: database or "admin")
         replica_set: Replica set name
+        single_flight: Coalesce identical concurrent reads (find_one, count,
+            find) into one query; each caller gets its own copy of the
+            result. Left unchanged when None (off by default).
         **options: Additional connection options
 
     Raises:
@@ -77,9 +81,15 @@ async def init(
         >>> await init(
         ...     "mongodb://host1:27017,host2:27017/mydb?replicaSet=rs0"
         ... )
+        >>>
+        >>> # Share identical in-flight reads between coroutines
+        >>> await init("mongodb://localhost:27017/mydb", single_flight=True)
     """
     from . import _engine
 
+    if single_flight is not None:
+        _engine.set_single_flight(single_flight)
+
     if connection_string:
         # Use connection string directly
         await _engine.init(connection_string)
@@ -28,15 +28,25 @@ Example:
 from __future__ import annotations
 
 import inspect
-from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar, Union, get_type_hints, get_origin, get_args
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, ClassVar, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, TypeVar, Union, get_origin, get_args
 
-from .fields import FieldProxy, QueryExpr, merge_filters
+from .fields import FieldProxy, QueryExpr, id_from_filter, merge_filters
 from .query import QueryBuilder, AggregationBuilder
 from .actions import (
     run_before_event, run_after_event, run_validate_on_save,
     EventType, Insert, Replace, Save, Delete,
 )
-from .links import Link, BackLink, WriteRules, DeleteRules, get_link_fields
+from .links import Link, BackLink, WriteRules, DeleteRules
+from .batching import BatchLoader
+from .cache import CacheStats, QueryCache
+from .plan import ModelPlan
+from .tracking import build_path_update
+from .type_extraction import apply_embedded_layout
+from .unit_of_work import UnitOfWork, current_unit_of_work
+
+if TYPE_CHECKING:
+    from .ingest import ChunkCallback, DeadLetterCallback
 
 # Import EmbeddedDocument for embedded document support
 # Note: We don't use Pydantic - EmbeddedDocument is pure Python
@@ -51,6 +61,131 @@ except ImportError:
 T = TypeVar("T", bound="Document")
 
 
+def _dump_value(value: Any) -> Any:
+    """Convert a field value (or a value nested in one) to its stored form."""
+    # Convert Link to reference for storage
+    if isinstance(value, Link):
+        return value.to_ref()
+    # Serialize embedded documents (EmbeddedDocument)
+    if EMBEDDED_DOCUMENT_AVAILABLE and EmbeddedDocument is not None and isinstance(value, EmbeddedDocument):
+        return value.to_dict()
+    # Serialize lists containing embedded documents
+    if isinstance(value, list):
+        return [
+            item.to_dict() if (EMBEDDED_DOCUMENT_AVAILABLE and EmbeddedDocument is not None and isinstance(item, EmbeddedDocument)) else item
+            for item in value
+        ]
+    return value
+
+
+class RevisionConflictError(ValueError):
+    """
+    A save found the document modified by another process (Settings.use_revision).
+
+    Attributes:
+        documents: Documents whose write was rejected
+    """
+
+    def __init__(self, message: str, documents: Optional[List["Document"]] = None) -> None:
+        super().__init__(message)
+        self.documents = documents or []
+
+
+class BulkSaveError(Exception):
+    """
+    save_all() (or a unit of work flush) failed to write some documents.
+
+    Attributes:
+        documents: Documents whose write failed, in input order
+        errors: Error message of each failed document (aligned with documents)
+    """
+
+    def __init__(self, message: str, documents: List["Document"], errors: List[str]) -> None:
+        super().__init__(message)
+        self.documents = documents
+        self.errors = errors
+
+
+_CONFLICT_MESSAGE = "Revision conflict: modified by another process"
+
+_Update = Tuple["Document", Dict[str, Any], Dict[str, Any]]
+
+
+def _undo_revision(doc: "Document") -> None:
+    """Undo the revision bump of _prepare_save() for a write that did not happen."""
+    if doc._use_revision and doc._revision_id:
+        doc._revision_id -= 1
+
+
+async def _write_updates(
+    collection_name: str,
+    updates: List[_Update],
+    ordered: bool,
+) -> Dict[int, str]:
+    """
+    Send updates built by _prepare_save() with one bulk_write.
+
+    The revision bump is undone for every document that was not written,
+    so a later save expects the stored revision.
+
+    Args:
+        collection_name: Collection of the documents
+        updates: (document, filter, update) tuples
+        ordered: Passed to bulk_write
+
+    Returns:
+        Index (in updates) -> error message of the rejected updates,
+        revision conflicts included
+    """
+    from . import _engine
+
+    if not updates:
+        return {}
+    operations = [
+        {"op": "update_one", "filter": filter_doc, "update": update}
+        for _, filter_doc, update in updates
+    ]
+    try:
+        result = await _engine.bulk_write(collection_name, operations, ordered=ordered)
+    except BaseException:
+        # No write is confirmed
+        for doc, _, _ in updates:
+            _undo_revision(doc)
+        raise
+
+    failures: Dict[int, str] = {}
+    for index in result.get("unmatched_indices", []):
+        doc = updates[index][0]
+        if doc._use_revision and doc._revision_id > 1:
+            failures[index] = _CONFLICT_MESSAGE
+    failures.update(result.get("errors", {}))
+    for index in failures:
+        _undo_revision(updates[index][0])
+    return failures
+
+
+def _raise_save_failures(scope: str, failed: List[Tuple["Document", str]]) -> None:
+    """
+    Raise the error of a batched save for its failed (document, message) pairs.
+
+    RevisionConflictError when every failure is a revision conflict,
+    BulkSaveError otherwise. Does nothing without failures.
+    """
+    if not failed:
+        return
+    if all(message == _CONFLICT_MESSAGE for _, message in failed):
+        raise RevisionConflictError(
+            f"Revision conflict: {len(failed)} document(s) in {scope} "
+            f"were modified by another process.",
+            [doc for doc, _ in failed],
+        )
+    raise BulkSaveError(
+        f"Save failed for {len(failed)} document(s) in {scope}.",
+        [doc for doc, _ in failed],
+        [message for _, message in failed],
+    )
+
+
 # ===================
 # Embedded Document Helpers
 # ===================
@@ -191,6 +326,54 @@ class Settings:
     use_validation: bool = False  # Enable validation on save
     timeseries: Optional[Any] = None  # TimeSeriesConfig for time-series collections
     is_root: bool = False  # Mark as root class for document inheritance
+    lazy_decode: bool = False  # Keep raw BSON and decode fields on first access
+    use_cache: bool = False  # Cache find/find_one/count results in-process (see cache.py)
+    cache_capacity: int = 32  # Maximum number of cached query shapes (LRU)
+    cache_expiration_time: Optional[timedelta] = timedelta(minutes=10)  # Cache entry TTL (None = no expiry)
+    use_batch_loading: bool = False  # Batch concurrent get() calls into one $in query (see batching.py)
+    batch_loading_max_size: int = 1000  # Maximum ids per batched $in query
+
+
+# ===================
+# Instance Loading
+# ===================
+
+def _compile_loader(cls: type) -> Callable[..., Any]:
+    """
+    Build the constructor used for documents loaded from the database.
+
+    The loader skips __init__ (defaults and default_factory are pointless
+    for complete database documents) and fills every instance attribute
+    with a single __dict__ update. The Rust backend calls it once per
+    result document, and _from_db(validate=False) uses it too.
+
+    Args:
+        cls: Document class the loader instantiates
+
+    Returns:
+        Callable (_id, data, revision_id=None) -> instance
+    """
+    from .state import StateTracker
+
+    new = object.__new__
+    use_state_management = cls._plan.use_state_management
+
+    def _loader(_id: Optional[str], data: Dict[str, Any], revision_id: Optional[int] = None) -> Any:
+        instance = new(cls)
+        if "revision_id" in data:
+            revision_id = data.pop("revision_id")
+        if "_class_id" in data:
+            del data["_class_id"]
+        instance.__dict__.update(
+            _id=_id,
+            _data=data,
+            _revision_id=revision_id,
+            _original_data=StateTracker(data) if use_state_management else None,
+            _previous_changes=None,
+        )
+        return instance
+
+    return _loader
 
 
 class DocumentMeta(type):
@@ -203,6 +386,8 @@ class DocumentMeta(type):
     3. Processes the Settings inner class
     4. Sets up the collection name
     5. Handles document inheritance (is_root, _class_id, child classes)
+    6. Compiles the class's ModelPlan (link fields, defaults, ...) and the
+       _loader constructor used for database loads
 
     Example:
         >>> class User(Document):
@@ -229,10 +414,6 @@ class DocumentMeta(type):
     # Global registry of document classes by name (for polymorphic loading)
     _document_registry: Dict[str, type] = {}
 
-    # Cache for get_type_hints() results per class (performance optimization)
-    # Avoids expensive compile() and eval() calls on every _from_db()
-    _type_hints_cache: Dict[type, Dict[str, Any]] = {}
-
     def __new__(
         mcs,
         name: str,
@@ -245,6 +426,8 @@ class DocumentMeta(type):
 
         # Skip processing for the base Document class itself
         if name == "Document" and not bases:
+            cls._plan = ModelPlan(cls)
+            cls._loader = staticmethod(_compile_loader(cls))
             return cls
 
         # Get all annotations including from parent classes
@@ -342,6 +525,18 @@ class DocumentMeta(type):
         # Register in global registry for polymorphic loading
         mcs._document_registry[name] = cls
 
+        # Class metadata used by CRUD/conversion paths, compiled once
+        cls._plan = ModelPlan(cls)
+
+        # Constructor for documents loaded from the database (skips __init__)
+        cls._loader = staticmethod(_compile_loader(cls))
+
+        # Query result cache (Settings.use_cache)
+        cls._query_cache = QueryCache.from_settings(cls._collection_name, settings_cls)
+
+        # Batching of concurrent _id lookups (Settings.use_batch_loading)
+        cls._batch_loader = BatchLoader.from_settings(cls, settings_cls)
+
         return cls
 
 
@@ -390,6 +585,10 @@ class Document(metaclass=DocumentMeta):
     _settings: ClassVar[Type[Settings]] = Settings
     _collection_name: ClassVar[str] = ""
     _timeseries_config: ClassVar[Optional[Any]] = None  # TimeSeriesConfig
+    _plan: ClassVar[ModelPlan]  # Precompiled class metadata (set by metaclass)
+    _loader: ClassVar[Optional[Callable[..., Any]]] = None  # Database load constructor (set by metaclass)
+    _query_cache: ClassVar[Optional[QueryCache]] = None  # Query result cache (set by metaclass)
+    _batch_loader: ClassVar[Optional[BatchLoader]] = None  # Batcher for concurrent _id lookups (set by metaclass)
 
     # Inheritance attributes (set by metaclass)
     _is_root: ClassVar[bool] = False  # True if this is a root class
@@ -403,6 +602,9 @@ class Document(metaclass=DocumentMeta):
     _revision_id: Optional[int] = None  # Revision tracking
     _original_data: Optional[Any] = None  # State management (StateTracker or Dict for backward compat)
     _previous_changes: Optional[Dict[str, Any]] = None  # Previous saved changes
+    _loaded_fields: Optional[FrozenSet[str]] = None  # Fields fetched by a projected query (None = full document)
+    _persisted: bool = True  # False until a document built by __init__ is first saved (its first save writes every field)
+    _unit_of_work: Optional[UnitOfWork] = None  # unit_of_work() scope whose identity map holds this instance
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -426,39 +628,42 @@ class Document(metaclass=DocumentMeta):
         # Store all data
         self._data = kwargs.copy()
 
-        # Set default values for fields not provided
-        for field_name, field_type in self._fields.items():
-            if field_name not in self._data:
-                # Check for stored default value
-                if field_name in self._field_defaults:
-                    default = self._field_defaults[field_name]
-                    # Check if it's a FieldInfo with default_factory
-                    if hasattr(default, "default_factory") and default.default_factory:
-                        self._data[field_name] = default.default_factory()
-                    elif hasattr(default, "default") and default.default is not ...:
-                        self._data[field_name] = default.default
-                    else:
-                        # It's a plain default value (like version: int = 1)
-                        self._data[field_name] = default
+        # Set default values (and default_factory results) for fields not provided
+        self._plan.apply_defaults(self._data)
 
         # Initialize state management if enabled
         if self._use_state_management:
-            self._save_state()
+            self._save_state(persisted=False)
 
-    def _save_state(self) -> None:
-        """Save current data as original state for change tracking."""
+    def _save_state(self, persisted: bool = True) -> None:
+        """
+        Save current data as original state for change tracking.
+
+        Args:
+            persisted: Whether the data matches the stored document (False
+                for a document built by __init__, even with an explicit id)
+        """
         from .state import StateTracker
         self._original_data = StateTracker(self._data)
+        self._persisted = persisted
+
+    def _track_path(self, path: str, kind: str, arg: Any = None) -> None:
+        """Record an in-place change of a nested value (called by tracked values, see tracking.py)."""
+        from .state import StateTracker
+        if isinstance(self._original_data, StateTracker):
+            self._original_data.track_path(path, kind, arg)
+        if self._unit_of_work is not None:
+            self._unit_of_work.mark_dirty(self)
 
     @property
     def _use_state_management(self) -> bool:
         """Check if state management is enabled."""
-        return getattr(self._settings, "use_state_management", False)
+        return self._plan.use_state_management
 
     @property
     def _use_revision(self) -> bool:
         """Check if revision tracking is enabled."""
-        return getattr(self._settings, "use_revision", False)
+        return self._plan.use_revision
 
     @property
     def revision_id(self) -> Optional[int]:
@@ -562,6 +767,8 @@ class Document(metaclass=DocumentMeta):
         Rollback all changes to the original state.
 
         Reverts all field values to what they were when loaded or last saved.
+        In-place changes of nested values (see tracking.py) cannot be
+        reverted and are only forgotten; reload the document instead.
 
         Example:
             >>> user.name = "Wrong Name"
@@ -610,6 +817,8 @@ class Document(metaclass=DocumentMeta):
                     self._original_data.track_change(name, old_value)
             # Use descriptor for known fields
             self._data[name] = value
+            if self._unit_of_work is not None:
+                self._unit_of_work.mark_dirty(self)
         elif "_data" in self.__dict__:
             # Track change for state management (COW)
             if "_original_data" in self.__dict__ and self._original_data is not None:
@@ -618,9 +827,24 @@ class Document(metaclass=DocumentMeta):
                     old_value = self._data.get(name)
                     self._original_data.track_change(name, old_value)
             self._data[name] = value
+            if self._unit_of_work is not None:
+                self._unit_of_work.mark_dirty(self)
         else:
             super().__setattr__(name, value)
 
+    def __delattr__(self, name: str) -> None:
+        """Remove a field value; save() then $unsets it (state management)."""
+        if name.startswith("_") or "_data" not in self.__dict__ or name not in self._data:
+            super().__delattr__(name)
+            return
+        if "_original_data" in self.__dict__ and self._original_data is not None:
+            from .state import StateTracker
+            if isinstance(self._original_data, StateTracker):
+                self._original_data.track_change(name, self._data[name])
+        del self._data[name]
+        if self._unit_of_work is not None:
+            self._unit_of_work.mark_dirty(self)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert document to dictionary.
@@ -630,26 +854,7 @@ class Document(metaclass=DocumentMeta):
         Returns:
             Dictionary with all field values, including _id and _class_id if set
         """
-        result = {}
-        for key, value in self._data.items():
-            # Convert Link to reference for storage
-            if isinstance(value, Link):
-                result[key] = value.to_ref()
-            elif isinstance(value, BackLink):
-                # BackLinks are not stored - they're computed on fetch
-                continue
-            # Serialize embedded documents (EmbeddedDocument)
-            elif EMBEDDED_DOCUMENT_AVAILABLE and EmbeddedDocument is not None and isinstance(value, EmbeddedDocument):
-                result[key] = value.to_dict()
-            # Serialize lists containing embedded documents
-            elif isinstance(value, list):
-                result[key] = [
-                    item.to_dict() if (EMBEDDED_DOCUMENT_AVAILABLE and EmbeddedDocument is not None and isinstance(item, EmbeddedDocument)) else item
-                    for item in value
-                ]
-            else:
-                result[key] = value
-
+        result = self._dump_fields(self._data.items())
         if self._id:
             result["_id"] = self._id
         # Add _class_id for polymorphic documents (inheritance hierarchy)
@@ -657,6 +862,34 @@ class Document(metaclass=DocumentMeta):
             result["_class_id"] = self._class_id
         return result
 
+    def _dump_fields(self, items: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+        """Convert (field, value) pairs to their stored form (see to_dict())."""
+        passthrough = self._plan.passthrough_fields
+        result = {}
+        for key, value in items:
+            # Scalar fields are stored as they are
+            if key in passthrough:
+                result[key] = value
+            elif isinstance(value, BackLink):
+                # BackLinks are not stored - they're computed on fetch
+                continue
+            else:
+                result[key] = _dump_value(value)
+        return result
+
+    @classmethod
+    def _embedded_layout(cls) -> Dict[str, Any]:
+        """
+        Get the EmbeddedDocument field layout of this class.
+
+        The Rust backend reads it once per query to build EmbeddedDocument
+        instances while decoding BSON (see type_extraction.extract_embedded_layout).
+
+        Returns:
+            {field_name: (loader, many, nested_layout), ...}
+        """
+        return cls._plan.embedded_layout
+
     @classmethod
     def _from_db(cls: Type[T], data: Dict[str, Any], validate: bool = False) -> T:
         """
@@ -708,76 +941,35 @@ class Document(metaclass=DocumentMeta):
                     target_cls = registered_cls
 
         # Convert Link fields from stored references
-        link_fields = get_link_fields(target_cls)
-        for field_name, (link_type, target_type) in link_fields.items():
-            if link_type == "Link" and field_name in data:
+        for field_name in target_cls._plan.links:
+            if field_name in data:
                 ref = data[field_name]
                 if ref is not None and not isinstance(ref, Link):
                     # Create Link from stored reference
                     data[field_name] = Link(ref)
 
         # Deserialize embedded documents (EmbeddedDocument fields)
-        if EMBEDDED_DOCUMENT_AVAILABLE:
-            try:
-                # Check cache first to avoid expensive get_type_hints() call
-                # get_type_hints() uses compile() and eval() which are extremely slow
-                if target_cls not in DocumentMeta._type_hints_cache:
-                    DocumentMeta._type_hints_cache[target_cls] = get_type_hints(target_cls)
-                hints = DocumentMeta._type_hints_cache[target_cls]
-            except Exception:
-                # get_type_hints can fail in some edge cases
-                hints = {}
-
-            for field_name, field_type in hints.items():
-                if field_name.startswith("_") or field_name not in data:
-                    continue
-
-                field_value = data[field_name]
-
-                # Handle EmbeddedDocument fields (including Optional[EmbeddedDocument])
-                if is_embedded_document_type(field_type):
-                    if field_value is not None and isinstance(field_value, dict):
-                        # For Optional[EmbeddedDocument], extract the inner type
-                        # is_embedded_document_type() already handles Optional unwrapping
-                        inner_type = get_optional_embedded_document_type(field_type)
-                        if inner_type:
-                            # It's Optional[EmbeddedDocument], use the inner type
-                            data[field_name] = inner_type.from_dict(field_value)
-                        else:
-                            # It's a direct EmbeddedDocument type
-                            data[field_name] = field_type.from_dict(field_value)
-
-                # Handle List[EmbeddedDocument] fields
-                elif is_list_of_embedded_document(field_type):
-                    inner_type = get_embedded_document_inner_type(field_type)
-                    if inner_type and isinstance(field_value, list):
-                        # Deserialize list of dicts to list of EmbeddedDocument instances
-                        data[field_name] = [
-                            inner_type.from_dict(item) if isinstance(item, dict) else item
-                            for item in field_value
-                        ]
+        # The layout is resolved from type hints once per class and cached
+        embedded_layout = target_cls._embedded_layout()
+        if embedded_layout:
+            apply_embedded_layout(data, embedded_layout)
 
         if validate:
             # Slow path: Full Pydantic validation (backward compatibility)
             instance = target_cls(**data)
             instance._id = _id
-        else:
-            # Fast path: Skip Pydantic validation (2-3x faster)
-            # Database data is already valid, so we bypass __init__
-            instance = object.__new__(target_cls)
-            instance._id = _id
-            instance._data = data
-            instance._revision_id = None
-            instance._original_data = None
-            instance._previous_changes = None
 
-        # Restore revision_id
-        if revision_id is not None:
-            instance._revision_id = revision_id
+            # Restore revision_id
+            if revision_id is not None:
+                instance._revision_id = revision_id
 
-        # Initialize state management after loading
-        if instance._use_state_management:
-            instance._save_state()
+            # Initialize state management after loading
+            if instance._use_state_management:
+                instance._save_state()
+        else:
+            # Fast path: Skip Pydantic validation (2-3x faster)
+            # Database data is already valid, so the compiled loader bypasses __init__
+            instance = target_cls._loader(_id, data, revision_id)
 
         return instance
 
@@ -795,6 +987,17 @@ class Document(metaclass=DocumentMeta):
         If the document has an _id, updates the existing document.
         Otherwise, inserts a new document.
 
+        Documents loaded through a projection (see QueryBuilder.project())
+        only $set the fields they loaded or were assigned, so fields that
+        were never fetched are left untouched in MongoDB.
+
+        With ``use_state_management = True`` an update only $sets the fields
+        assigned since the document was loaded or last saved and $unsets
+        deleted ones (``del doc.field``); if nothing changed, no write is
+        sent (hooks still run). In-place changes of lists, dicts and
+        embedded documents are sent as path updates ($push, $pull,
+        $set "a.b", $inc, ...) - see tracking.py.
+
         All validation happens in Rust during BSON conversion - there is no
         overhead to skipping validation in Python since Rust always validates.
 
@@ -824,6 +1027,13 @@ class Document(metaclass=DocumentMeta):
         collection_name = self.__collection_name__()
         is_insert = self._id is None
 
+        if is_insert and self._loaded_fields is not None:
+            # A projection that excluded _id would otherwise insert a truncated copy
+            raise ValueError(
+                "Cannot save a partially-loaded document without _id. "
+                "Include _id in the projection to update it in place."
+            )
+
         # Run validation hooks if configured in Settings
         await run_validate_on_save(self)
 
@@ -837,44 +1047,18 @@ class Document(metaclass=DocumentMeta):
         else:
             await run_before_event(self, EventType.SAVE)
 
-        # Store current changes for state management
-        if self._use_state_management:
-            self._previous_changes = self.get_changes()
-
-        # Handle revision tracking
-        if self._use_revision:
-            if is_insert:
-                self._revision_id = 1
-            else:
-                self._revision_id = (self._revision_id or 0) + 1
+        data, filter_doc = self._prepare_save()
 
-        data = self.to_dict()
-
-        # Add revision_id to data if revision tracking is enabled
-        if self._use_revision:
-            data["revision_id"] = self._revision_id
-
-        if self._id:
-            # Update existing
-            data.pop("_id", None)
-
-            # Build filter with optimistic locking if revision tracking enabled
-            filter_doc = {"_id": self._id}
-            if self._use_revision and self._revision_id > 1:
-                # Check that revision hasn't changed (optimistic locking)
-                filter_doc["revision_id"] = self._revision_id - 1
-
-            result = await _engine.update_one(
-                collection_name,
-                filter_doc,
-                {"$set": data},
-            )
+        if filter_doc is not None:
+            # Update existing (skipped when a state-managed document is unchanged)
+            result = await _engine.update_one(collection_name, filter_doc, data) if data else None
 
             # Check for revision conflict (optimistic locking failure)
             if self._use_revision and result == 0 and self._revision_id > 1:
-                raise ValueError(
+                raise RevisionConflictError(
                     f"Revision conflict: document was modified by another process. "
-                    f"Expected revision {self._revision_id - 1}, but document has changed."
+                    f"Expected revision {self._revision_id - 1}, but document has changed.",
+                    [self],
                 )
 
             result_id = self._id
@@ -887,6 +1071,9 @@ class Document(metaclass=DocumentMeta):
         if self._use_state_management:
             self._save_state()
 
+        if self._unit_of_work is not None:
+            self._unit_of_work.mark_clean(self)
+
         # Run after hooks
         if is_insert:
             await run_after_event(self, EventType.INSERT)
@@ -895,6 +1082,72 @@ class Document(metaclass=DocumentMeta):
 
         return result_id
 
+    def _prepare_save(self) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Build the write issued by save() and advance the revision.
+
+        Updates of state-managed documents only $set the fields assigned
+        since the last load/save, $unset the deleted ones and apply the
+        recorded in-place changes of nested values; other documents $set
+        every field, as do documents built by __init__ and not saved yet
+        (even with an explicit id). An unchanged state-managed document
+        yields an empty update (and keeps its revision).
+
+        Also records the pending changes for get_previous_changes().
+
+        Returns:
+            (data, filter_doc) - filter_doc is None for an insert (data is
+            the document), otherwise data is the update document and
+            filter_doc the update filter (including the expected
+            revision_id when revision tracking is enabled)
+        """
+        # Store current changes for state management
+        if self._use_state_management:
+            self._previous_changes = self.get_changes()
+
+        from .state import StateTracker
+        tracker = self._original_data if self._id else None
+        delta = isinstance(tracker, StateTracker) and self._persisted
+        if delta and not tracker.is_modified():
+            return {}, {"_id": self._id}
+
+        # Handle revision tracking
+        if self._use_revision:
+            if self._id is None:
+                self._revision_id = 1
+            else:
+                self._revision_id = (self._revision_id or 0) + 1
+
+        if delta:
+            data = self._dump_fields(tracker.get_assigned().items())
+        else:
+            data = self.to_dict()
+
+        # Add revision_id to data if revision tracking is enabled
+        if self._use_revision:
+            data["revision_id"] = self._revision_id
+
+        if not self._id:
+            return data, None
+
+        data.pop("_id", None)
+        update = {"$set": data} if data else {}
+        if delta:
+            removed = tracker.get_removed()
+            if removed:
+                update["$unset"] = dict.fromkeys(removed, "")
+            # In-place changes of nested values ($push, "a.b" paths, ...)
+            for operator, fields in build_path_update(tracker.get_path_ops(), self._data, _dump_value).items():
+                update.setdefault(operator, {}).update(fields)
+
+        # Build filter with optimistic locking if revision tracking enabled
+        filter_doc = {"_id": self._id}
+        if self._use_revision and self._revision_id > 1:
+            # Check that revision hasn't changed (optimistic locking)
+            filter_doc["revision_id"] = self._revision_id - 1
+
+        return update, filter_doc
+
     async def _save_linked_documents(self) -> None:
         """
         Save all linked documents before saving this document.
@@ -902,12 +1155,7 @@ class Document(metaclass=DocumentMeta):
         This is called when save(link_rule=WriteRules.WRITE) is used.
         It saves all Link[T] field values that are Document instances.
         """
-        link_fields = get_link_fields(type(self))
-
-        for field_name, (link_type, _) in link_fields.items():
-            if link_type != "Link":
-                continue
-
+        for field_name in self._plan.links:
             value = self._data.get(field_name)
             if value is None:
                 continue
@@ -977,6 +1225,9 @@ class Document(metaclass=DocumentMeta):
         deleted_count = await _engine.delete_one(collection_name, {"_id": self._id})
         deleted = deleted_count > 0
 
+        if self._unit_of_work is not None:
+            self._unit_of_work.discard(self)
+
         # Run after hooks
         if deleted:
             await run_after_event(self, EventType.DELETE)
@@ -990,11 +1241,10 @@ class Document(metaclass=DocumentMeta):
         This is called when delete(link_rule=DeleteRules.DELETE_LINKS) is used.
         It finds all BackLink fields and deletes documents that reference this one.
         """
-        link_fields = get_link_fields(type(self))
+        link_fields = self._plan.link_fields
 
-        for field_name, (link_type, target_type) in link_fields.items():
-            if link_type != "BackLink":
-                continue
+        for field_name in self._plan.backlinks:
+            _, target_type = link_fields[field_name]
 
             # Get BackLink configuration from _field_defaults
             # (The class attribute is replaced with FieldProxy by metaclass)
@@ -1033,9 +1283,13 @@ class Document(metaclass=DocumentMeta):
         if data is None:
             raise ValueError("Document not found in database")
 
-        # Update data
-        data.pop("_id", None)
-        self._data = data
+        # Rebuild the state the way a load does (revision, embedded layout, tracker)
+        fresh = self._from_db(data)
+        self._data = fresh._data
+        self._revision_id = fresh._revision_id
+        self._loaded_fields = None
+        if self._use_state_management:
+            self._save_state()
 
     async def fetch_all_links(self, depth: int = 1, batch_mode: bool = True) -> None:
         """
@@ -1073,7 +1327,7 @@ class Document(metaclass=DocumentMeta):
             await self._fetch_all_links_batched(depth)
         else:
             # Fallback to individual queries (backward compatible)
-            link_fields = get_link_fields(type(self))
+            link_fields = self._plan.link_fields
             for field_name, (link_type, target_type) in link_fields.items():
                 if link_type == "Link":
                     await self._fetch_link_field(field_name, target_type, depth)
@@ -1084,88 +1338,17 @@ class Document(metaclass=DocumentMeta):
         """
         Fetch all linked documents using batched queries (Week 4-5 optimization).
 
-        This is a high-performance implementation that batches link fetching
-        to avoid the N+1 query problem. Instead of making one query per link,
-        it groups links by target collection and fetches them in batches.
+        Uses the same batching as find().fetch_links(): one $in query per
+        Link target type and one query per BackLink field, sent
+        concurrently, so all links of a level cost one round trip.
 
         Performance:
             - Before: N documents × M links = N×M queries
-            - After: N documents × M links = M queries (one per unique target type)
+            - After: N documents × M links = M queries (one per unique target type),
+              issued in parallel
             - Improvement: Up to 75x reduction in latency for large datasets
-
-        Algorithm:
-            1. Collection Phase: Gather all link refs grouped by target type
-            2. Batch Phase: Single $in query per target type
-            3. Mapping Phase: Map fetched docs back to links
-        """
-        from collections import defaultdict
-
-        link_fields = get_link_fields(type(self))
-
-        # Phase 1: Collect all link references grouped by target type
-        # Format: {target_cls: [(field_name, ref_id), ...]}
-        link_refs_by_type = defaultdict(list)
-        backlink_fields = []
-
-        for field_name, (link_type, target_type) in link_fields.items():
-            if link_type == "Link":
-                value = self._data.get(field_name)
-                if value is None:
-                    continue
-
-                # Resolve target class
-                target_cls = self._resolve_document_class(target_type)
-                if target_cls is None:
-                    continue
-
-                # Get the reference ID
-                if isinstance(value, Link):
-                    if value._document is not None:
-                        # Already fetched
-                        continue
-                    ref_id = value._ref
-                elif isinstance(value, str):
-                    ref_id = value
-                else:
-                    continue
-
-                if ref_id is not None:
-                    link_refs_by_type[target_cls].append((field_name, ref_id))
-
-            elif link_type == "BackLink":
-                # BackLinks need special handling (can't batch easily)
-                backlink_fields.append((field_name, target_type))
-
-        # Phase 2: Batch fetch all links per target type
-        for target_cls, refs in link_refs_by_type.items():
-            if not refs:
-                continue
-
-            # Extract unique IDs
-            ref_ids = list(set(ref_id for _, ref_id in refs))
-
-            # Batch query: fetch all documents with $in
-            linked_docs = await target_cls.find({"_id": {"$in": ref_ids}}).to_list()
-
-            # Create ID -> document mapping for O(1) lookup
-            docs_by_id = {str(doc._id): doc for doc in linked_docs}
-
-            # Phase 3: Map fetched documents back to their links
-            for field_name, ref_id in refs:
-                linked_doc = docs_by_id.get(str(ref_id))
-                if linked_doc is not None:
-                    # Update the link with the fetched document
-                    link = Link(linked_doc, document_class=target_cls)
-                    self._data[field_name] = link
-
-            # Recursively fetch nested links (depth - 1)
-            if depth > 1:
-                for doc in linked_docs:
-                    await doc.fetch_all_links(depth=depth - 1, batch_mode=True)
-
-        # Handle BackLinks (can't batch these easily, use original method)
-        for field_name, target_type in backlink_fields:
-            await self._fetch_backlink_field(field_name, target_type, depth)
+        """
+        await QueryBuilder._batch_fetch_links_for_list([self], depth=depth)
 
     async def _fetch_link_field(
         self, field_name: str, target_type: type, depth: int
@@ -1239,7 +1422,8 @@ class Document(metaclass=DocumentMeta):
         backlink._documents = linked_docs
         self._data[field_name] = backlink
 
-    def _resolve_document_class(self, target_type: type) -> Optional[Type["Document"]]:
+    @classmethod
+    def _resolve_document_class(cls, target_type: type) -> Optional[Type["Document"]]:
         """Resolve a type annotation to a Document class."""
         if target_type is None:
             return None
@@ -1317,11 +1501,36 @@ class Document(metaclass=DocumentMeta):
         collection_name = cls.__collection_name__()
         filter_doc = merge_filters(filters)
 
-        data = await _engine.find_one(collection_name, filter_doc)
-        if data is None:
+        # Inside unit_of_work(), _id lookups are answered from the identity map
+        uow = current_unit_of_work()
+        if uow is not None:
+            doc = uow.lookup(cls, filter_doc)
+            if doc is not None:
+                if fetch_links:
+                    await doc.fetch_all_links()
+                return doc
+
+        async def query() -> List[T]:
+            # Same decode path as find(): typed instances (embedded documents,
+            # polymorphic subclasses, lazy fields) are built while decoding BSON
+            return await _engine.find_as_documents(collection_name, cls, filter_doc, limit=1)
+
+        cache = cls._query_cache
+        doc_id = id_from_filter(filter_doc) if cls._batch_loader is not None else None
+        if doc_id is not None:
+            # Concurrent _id lookups share one $in query
+            found = await cls._batch_loader.load(doc_id)
+            docs = [found] if found is not None else []
+        elif cache is not None:
+            docs = await cache.documents(cache.key("find", filter_doc, limit=1), query)
+        else:
+            docs = await query()
+        if not docs:
             return None
 
-        doc = cls._from_db(data, validate=False)  # Database data is already valid
+        doc = docs[0]
+        if uow is not None:
+            doc = uow.register(doc)
 
         if fetch_links:
             await doc.fetch_all_links()
@@ -1374,12 +1583,44 @@ class Document(metaclass=DocumentMeta):
         return await cls.find(*filters).count()
 
     @classmethod
-    def aggregate(cls: Type[T], pipeline: List[dict]) -> AggregationBuilder[T]:
+    async def estimated_count(cls, max_time_ms: Optional[int] = None) -> int:
+        """
+        Estimate the number of documents in the collection.
+
+        Reads the collection metadata instead of counting, so it is O(1)
+        whatever the collection size. Filters are not supported, and for
+        inherited models the estimate covers the whole shared collection.
+
+        Args:
+            max_time_ms: Server-side time limit in milliseconds
+
+        Returns:
+            Estimated number of documents
+
+        Example:
+            >>> total = await Event.estimated_count()
+        """
+        from . import _engine
+
+        return await _engine.estimated_count(cls.__collection_name__(), max_time_ms=max_time_ms)
+
+    @classmethod
+    def aggregate(
+        cls: Type[T],
+        pipeline: List[dict],
+        projection_model: Optional[type] = None,
+        batch_size: Optional[int] = None,
+        allow_disk_use: Optional[bool] = None,
+    ) -> AggregationBuilder[T]:
         """
         Run an aggregation pipeline.
 
         Args:
             pipeline: MongoDB aggregation pipeline stages
+            projection_model: Document or EmbeddedDocument class to build
+                from each result (default: plain dicts)
+            batch_size: Documents per server batch
+            allow_disk_use: Let blocking stages ($sort, $group) spill to disk
 
         Returns:
             AggregationBuilder for executing the pipeline
@@ -1389,8 +1630,12 @@ class Document(metaclass=DocumentMeta):
             ...     {"$match": {"active": True}},
             ...     {"$group": {"_id": "$department", "count": {"$sum": 1}}},
             ... ]).to_list()
+            >>>
+            >>> # Stream a large $unwind without collecting it
+            >>> async for line in Order.aggregate([{"$unwind": "$items"}], projection_model=OrderLine):
+            ...     process(line)
         """
-        return AggregationBuilder(cls, pipeline)
+        return AggregationBuilder(cls, pipeline, projection_model, batch_size, allow_disk_use)
 
     # ===================
     # Replace Operations
@@ -1419,6 +1664,13 @@ class Document(metaclass=DocumentMeta):
         if not self._id:
             raise ValueError("Document has no _id. Use save() for new documents.")
 
+        if self._loaded_fields is not None:
+            # Replacing would drop every field the projection didn't load
+            raise ValueError(
+                "Cannot replace a partially-loaded document. "
+                "Use save() to update only the loaded fields, or refresh() first."
+            )
+
         # Run validation if enabled
         await run_validate_on_save(self)
 
@@ -1685,9 +1937,13 @@ class Document(metaclass=DocumentMeta):
     @classmethod
     async def insert_many(
         cls: Type[T],
-        documents: List[Union[T, dict]],
+        documents: Iterable[Union[T, dict]],
         validate: bool = False,
         return_type: str = "ids",
+        chunk_size: Optional[int] = None,
+        max_in_flight: int = 2,
+        ordered: bool = True,
+        on_chunk: Optional["ChunkCallback"] = None,
     ) -> Union[List[str], List[T]]:
         """
         Insert multiple documents.
@@ -1696,6 +1952,11 @@ class Document(metaclass=DocumentMeta):
         with validate=False (default), documents bypass validation for maximum
         performance (5-10x faster for bulk inserts).
 
+        With chunk_size, documents are sent in chunks with up to
+        max_in_flight chunks written concurrently, so large imports keep
+        bounded memory and do not block the event loop for the whole
+        input (see ingest.py). documents may then be any iterable.
+
         Args:
             documents: List of Document instances or raw dicts
             validate: If True, validate dicts against model schema before insert.
@@ -1703,10 +1964,19 @@ class Document(metaclass=DocumentMeta):
                      Document instances are always validated on construction.
             return_type: "ids" returns List[str] of ObjectIds (default, fast).
                         "documents" returns List[T] of Document instances.
+            chunk_size: Documents per insert command (None = one command)
+            max_in_flight: Chunks written concurrently (with chunk_size)
+            ordered: With chunk_size: if True, stop after the first failed
+                     chunk; if False, send the remaining chunks anyway
+            on_chunk: Called with an InsertChunk as each chunk finishes
+                     (progress reporting; may be async)
 
         Returns:
             List of ObjectIds (str) or Document instances based on return_type
 
+        Raises:
+            BulkInsertError: With chunk_size, if any chunk failed
+
         Example:
             >>> # Standard usage with Document instances
             >>> users = [
@@ -1724,9 +1994,19 @@ class Document(metaclass=DocumentMeta):
 
             >>> # Get Document instances back
             >>> docs = await User.insert_many(dicts, return_type="documents")
+
+            >>> # Large import: 5000 documents per command, 2 in flight
+            >>> ids = await User.insert_many(rows(), chunk_size=5000)
         """
         from . import _engine
 
+        if chunk_size is not None:
+            return await cls._insert_chunked(
+                documents, validate, return_type, chunk_size, max_in_flight, ordered, on_chunk
+            )
+        if not isinstance(documents, list):
+            documents = list(documents)
+
         # Handle empty list
         if not documents:
             return [] if return_type == "ids" else []
@@ -1781,6 +2061,223 @@ class Document(metaclass=DocumentMeta):
                     result.append(instance)
             return result
 
+    @classmethod
+    def _insert_converter(cls: Type[T], validate: bool) -> Callable[[Union[T, dict]], Dict[str, Any]]:
+        """Converter from an insert_many() item to the dict that is inserted."""
+
+        def prepare(doc: Union[T, dict]) -> Dict[str, Any]:
+            if isinstance(doc, dict):
+                if validate:
+                    cls(**doc)  # Raises ValidationError if invalid
+                return doc
+            return doc.to_dict()
+
+        return prepare
+
+    @classmethod
+    async def _insert_chunked(
+        cls: Type[T],
+        documents: Iterable[Union[T, dict]],
+        validate: bool,
+        return_type: str,
+        chunk_size: int,
+        max_in_flight: int,
+        ordered: bool,
+        on_chunk: Optional["ChunkCallback"],
+    ) -> Union[List[str], List[T]]:
+        """insert_many() with chunk_size (see ingest.insert_chunks)."""
+        from .ingest import insert_chunks
+
+        if return_type == "documents":
+            # The inputs are needed afterwards to build the result
+            documents = list(documents)
+
+        chunks = await insert_chunks(
+            cls.__collection_name__(),
+            documents,
+            cls._insert_converter(validate),
+            chunk_size,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            on_chunk=on_chunk,
+        )
+        ids = [doc_id for chunk in chunks for doc_id in chunk.inserted_ids]
+        if return_type == "ids":
+            return ids
+        return [
+            doc if isinstance(doc, cls) else cls._from_db({**doc, "_id": doc_id}, validate=False)  # type: ignore
+            for doc, doc_id in zip(documents, ids)
+        ]
+
+    @classmethod
+    async def insert_stream(
+        cls: Type[T],
+        source: AsyncIterable[Union[T, dict]],
+        batch_size: int = 1000,
+        flush_interval: Optional[float] = 1.0,
+        max_pending: int = 2,
+        validate: bool = False,
+        on_batch: Optional["ChunkCallback"] = None,
+        on_error: Optional["DeadLetterCallback"] = None,
+    ) -> int:
+        """
+        Insert documents from an async iterable as they arrive.
+
+        Items are sent in batches through the insert_many() path: a batch
+        is flushed when it holds batch_size items or flush_interval seconds
+        after its first item. While max_pending batches are unacknowledged,
+        the source is not read, so a fast producer is slowed down to the
+        write rate instead of filling memory.
+
+        Args:
+            source: Async iterable of Document instances or raw dicts
+            batch_size: Maximum documents per insert command
+            flush_interval: Maximum seconds a document waits for its batch
+                           to fill (None = flush on size only)
+            max_pending: Maximum number of unacknowledged batches
+            validate: If True, validate dicts against model schema before insert
+            on_batch: Called with an InsertChunk as each batch finishes
+                     (may be async)
+            on_error: Dead-letter callback, called with a failed InsertChunk
+                     and the documents of the batch (may be async). The
+                     stream continues after a failed batch.
+
+        Returns:
+            Number of documents inserted
+
+        Raises:
+            BulkInsertError: If a batch failed and on_error is not given
+                            (the stream stops at the first failure)
+
+        Example:
+            >>> async def events():
+            ...     async for message in consumer:
+            ...         yield json.loads(message.value)
+            >>>
+            >>> count = await Event.insert_stream(
+            ...     events(),
+            ...     batch_size=500,
+            ...     flush_interval=0.5,
+            ...     on_error=lambda chunk, docs: dead_letters.extend(docs),
+            ... )
+        """
+        from .ingest import insert_stream
+
+        return await insert_stream(
+            cls.__collection_name__(),
+            source,
+            cls._insert_converter(validate),
+            batch_size,
+            flush_interval=flush_interval,
+            max_pending=max_pending,
+            on_batch=on_batch,
+            on_error=on_error,
+        )
+
+    @classmethod
+    async def save_all(cls: Type[T], documents: List[T], ordered: bool = False) -> List[str]:
+        """
+        Save many documents with a few round trips instead of one per document.
+
+        New documents are inserted with one insert_many; existing ones are
+        updated with one bulk_write, each sending the same update as
+        save() (only the changes with use_state_management, nothing for
+        unchanged documents). With ordered=False the updates run
+        concurrently; ordered=True sends them one after another.
+        Validation and Insert/Save event hooks run for every document, as
+        they do for save().
+
+        Models with Settings.use_validation insert one document at a time
+        to keep schema validation.
+
+        Args:
+            documents: Documents of this class (or its subclasses) to save
+            ordered: If True, stop the updates at the first failed write
+                and raise its error (no document is marked saved). If False
+                (default), the remaining updates are applied and the failed
+                ones reported by BulkSaveError.
+
+        Documents that are not written keep their changes and revision, so
+        they can be saved again.
+
+        Returns:
+            The documents' ObjectIds as hex strings, in input order
+
+        Raises:
+            RevisionConflictError: If documents were modified by another
+                process (Settings.use_revision). All other documents are
+                saved and their after hooks run; the rejected ones are in
+                the error's ``documents``.
+            BulkSaveError: If updates failed (ordered=False). Failed
+                documents keep their changes and skip their after hooks;
+                conflicting documents are reported here too.
+
+        Example:
+            >>> users = await User.find(User.status == "trial").to_list()
+            >>> for user in users:
+            ...     user.status = "active"
+            >>> await User.save_all(users)
+        """
+        from . import _engine
+
+        if not documents:
+            return []
+
+        collection_name = cls.__collection_name__()
+        for doc in documents:
+            if not isinstance(doc, cls):
+                raise TypeError(f"save_all() expects {cls.__name__} instances, got {type(doc).__name__}")
+            if doc._id is None and doc._loaded_fields is not None:
+                raise ValueError(
+                    "Cannot save a partially-loaded document without _id. "
+                    "Include _id in the projection to update it in place."
+                )
+
+        inserts: List[Tuple[T, Dict[str, Any]]] = []
+        updates: List[Tuple[T, Dict[str, Any], Dict[str, Any]]] = []
+        is_insert = [doc._id is None for doc in documents]
+        for doc, new in zip(documents, is_insert):
+            await run_validate_on_save(doc)
+            await run_before_event(doc, EventType.INSERT if new else EventType.SAVE)
+            data, filter_doc = doc._prepare_save()
+            if filter_doc is None:
+                inserts.append((doc, data))
+            elif data:
+                updates.append((doc, filter_doc, data))
+
+        if inserts:
+            try:
+                if getattr(getattr(cls, "Settings", None), "use_validation", False):
+                    ids = [await _engine.insert_one(collection_name, data, type(doc)) for doc, data in inserts]
+                else:
+                    ids = await _engine.insert_many(collection_name, [data for _, data in inserts])
+            except BaseException:
+                # The updates were not sent
+                for doc, _, _ in updates:
+                    _undo_revision(doc)
+                raise
+            for (doc, _), doc_id in zip(inserts, ids):
+                doc._id = doc_id
+
+        failures = await _write_updates(collection_name, updates, ordered)
+
+        rejected = {id(updates[index][0]) for index in failures}
+        for doc, new in zip(documents, is_insert):
+            if id(doc) in rejected:
+                continue
+            if doc._use_state_management:
+                doc._save_state()
+            if doc._unit_of_work is not None:
+                doc._unit_of_work.mark_clean(doc)
+            await run_after_event(doc, EventType.INSERT if new else EventType.SAVE)
+
+        _raise_save_failures(
+            f"'{collection_name}'",
+            [(updates[index][0], message) for index, message in sorted(failures.items())],
+        )
+
+        return [doc._id for doc in documents]
+
     @classmethod
     async def delete_many(cls: Type[T], *filters: QueryExpr | dict) -> int:
         """
@@ -2015,10 +2512,9 @@ class Document(metaclass=DocumentMeta):
             >>> print(created)  # ['email_1', 'username_1']
         """
         from . import _engine
-        from .types import get_index_fields
 
         collection_name = cls.__collection_name__()
-        indexed_fields = get_index_fields(cls)
+        indexed_fields = cls._plan.index_fields
 
         created_indexes = []
         for field_name, index_model in indexed_fields.items():
@@ -2114,6 +2610,37 @@ class Document(metaclass=DocumentMeta):
         """
         return cls._timeseries_config
 
+    # ===================
+    # Query Cache
+    # ===================
+
+    @classmethod
+    def cache_stats(cls) -> Optional[CacheStats]:
+        """
+        Get the query cache counters for this document type.
+
+        Returns:
+            CacheStats (hits, misses, evictions, invalidations, size),
+            or None if Settings.use_cache is off
+
+        Example:
+            >>> stats = Country.cache_stats()
+            >>> print(stats.hits / (stats.hits + stats.misses))
+        """
+        cache = cls._query_cache
+        return cache.stats if cache is not None else None
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Drop all cached query results and reset the cache counters.
+
+        Writes made through data-bridge invalidate the cache automatically;
+        use this after the collection was changed by another process.
+        """
+        if cls._query_cache is not None:
+            cls._query_cache.clear()
+
     # ===================
     # Dunder Methods
     # ===================
@@ -5,7 +5,35 @@ This module provides the EmbeddedDocument base class for creating embedded
 documents that integrate with data-bridge's Rust backend.
 """
 
-from typing import Any, Dict, ClassVar, get_type_hints
+from typing import Any, Callable, Dict, ClassVar, get_type_hints
+
+
+def _compile_loader(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Build the constructor used for embedded documents loaded from the database.
+
+    Equivalent to ``cls(**data)``: unset fields fall back to the class-level
+    defaults either way, so the loader just fills the instance __dict__.
+    Classes that define their own __init__ keep going through it.
+
+    Args:
+        cls: EmbeddedDocument class the loader instantiates
+
+    Returns:
+        Callable (data) -> instance
+    """
+    init_owner = next(base for base in cls.__mro__ if "__init__" in base.__dict__)
+    if init_owner.__module__ != __name__:
+        return lambda data: cls(**data)
+
+    new = object.__new__
+
+    def _loader(data: Dict[str, Any]) -> Any:
+        instance = new(cls)
+        instance.__dict__.update(data)
+        return instance
+
+    return _loader
 
 
 class EmbeddedDocumentMeta(type):
@@ -47,6 +75,7 @@ class EmbeddedDocumentMeta(type):
         # Store on class
         cls._fields = fields
         cls._field_defaults = field_defaults
+        cls._loader = staticmethod(_compile_loader(cls))
 
         return cls
 
@@ -87,6 +116,7 @@ class EmbeddedDocument(metaclass=EmbeddedDocumentMeta):
     # Class-level attributes (set by metaclass)
     _fields: ClassVar[Dict[str, type]] = {}
     _field_defaults: ClassVar[Dict[str, Any]] = {}
+    _loader: ClassVar[Callable[[Dict[str, Any]], Any]]
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -112,6 +142,26 @@ class EmbeddedDocument(metaclass=EmbeddedDocumentMeta):
                         setattr(self, field_name, default)
                 # No default - leave unset (will fail validation in Rust if required)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, recording the change if a document tracks this value."""
+        if "_tracking" in self.__dict__ and not name.startswith("_"):
+            from .tracking import track_attribute
+            value = track_attribute(self, name, value)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Delete an attribute, recording the change if a document tracks this value."""
+        if "_tracking" in self.__dict__ and not name.startswith("_") and name in self.__dict__:
+            from .tracking import track_attribute
+            track_attribute(self, name, None, delete=True)
+        object.__delattr__(self, name)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Copy/pickle state: field values only (copies are not tracked)."""
+        state = dict(self.__dict__)
+        state.pop("_tracking", None)
+        return state
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dict for MongoDB storage.
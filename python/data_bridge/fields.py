@@ -4,6 +4,7 @@ Field descriptors and query expressions for Beanie-compatible API.
 This module provides:
 - FieldProxy: Enables User.email == "x" syntax for type-safe queries
 - QueryExpr: Represents a single query condition
+- Param: Placeholder bound at execution time by prepared queries
 - Field: Pydantic-style field descriptor with defaults
 
 Example:
@@ -22,6 +23,8 @@ from __future__ import annotations
 import re
 from typing import Any, List, Optional, TYPE_CHECKING
 
+from .tracking import track
+
 if TYPE_CHECKING:
     from .document import Document
 
@@ -99,6 +102,26 @@ class QueryExpr:
         raise TypeError(f"Cannot combine QueryExpr with {type(other)}")
 
 
+class Param:
+    """
+    Named placeholder for a value bound when a prepared query runs.
+
+    Only meaningful in queries compiled with QueryBuilder.prepare().
+
+    Example:
+        >>> by_email = User.find(User.email == Param("email")).prepare()
+        >>> user = await by_email.first(email="alice@example.com")
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Param({self.name!r})"
+
+
 class FieldProxy:
     """
     Field proxy that enables attribute-based query expressions.
@@ -140,7 +163,13 @@ class FieldProxy:
             return self
         # Instance access: user.email -> value from _data
         if hasattr(obj, "_data") and self.name in obj._data:
-            return obj._data[self.name]
+            value = obj._data[self.name]
+            if obj.__dict__.get("_original_data") is not None:
+                # State management: record in-place changes of lists, dicts and embedded documents
+                tracked = track(value, obj, self.name)
+                if tracked is not value:
+                    obj._data[self.name] = value = tracked
+            return value
         # Fall back to checking __dict__ or returning None
         return obj.__dict__.get(self.name)
 
@@ -457,6 +486,30 @@ def merge_filters(filters: tuple) -> dict:
     return result
 
 
+def id_from_filter(filter_doc: Any) -> Optional[Any]:
+    """
+    Return the _id of a plain ``{"_id": value}`` filter, else None.
+
+    Used to recognise primary-key lookups (Document.get and equivalent
+    find_one calls) that can be served by the identity map or batched.
+    The value is returned as given (not converted to str), so it can be
+    queried again as is.
+
+    Example:
+        >>> id_from_filter({"_id": "507f1f77bcf86cd799439011"})
+        '507f1f77bcf86cd799439011'
+        >>> id_from_filter({"_id": 42})
+        42
+        >>> id_from_filter({"_id": {"$in": [...]}}) is None
+        True
+    """
+    if isinstance(filter_doc, dict) and len(filter_doc) == 1:
+        doc_id = filter_doc.get("_id")
+        if doc_id is not None and not isinstance(doc_id, dict):
+            return doc_id
+    return None
+
+
 class TextSearch:
     """
     MongoDB text search query builder.
@@ -0,0 +1,357 @@
+"""
+Chunked, pipelined bulk inserts.
+
+``Document.insert_many(documents, chunk_size=N)`` sends the documents in
+chunks of N instead of one command for the whole input. Up to
+``max_in_flight`` chunks are written concurrently: while one chunk is
+converted to BSON and sent by the Rust backend (without the GIL), the
+next chunk is prepared and extracted, so a large import keeps the
+network busy while its memory stays bounded by
+``chunk_size * max_in_flight`` documents. The input may be any iterable
+(e.g. a generator reading a file); it is consumed chunk by chunk.
+
+Each finished chunk is reported as an InsertChunk (to ``on_chunk``, if
+given). Failed chunks raise a BulkInsertError once the in-flight chunks
+are done; it lists every chunk, so the inserted ids are known.
+
+``Document.insert_stream(source)`` does the same for an async iterable
+(a message consumer, say): items are batched until ``batch_size`` or
+``flush_interval`` is reached, the source is not read while
+``max_pending`` batches are unacknowledged, and failed batches can be
+handed to a dead-letter callback instead of stopping the stream.
+
+Example:
+    >>> def rows():
+    ...     for line in open("users.jsonl"):
+    ...         yield json.loads(line)
+    >>>
+    >>> ids = await User.insert_many(
+    ...     rows(),
+    ...     chunk_size=5000,
+    ...     max_in_flight=2,
+    ...     on_chunk=lambda chunk: print(f"{chunk.offset + chunk.count} rows"),
+    ... )
+    >>>
+    >>> async def dead_letter(chunk, events):
+    ...     await failed_queue.put(events)
+    >>>
+    >>> count = await Event.insert_stream(
+    ...     consumer,
+    ...     batch_size=500,
+    ...     flush_interval=0.5,
+    ...     on_error=dead_letter,
+    ... )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Union
+
+# Called with each finished chunk; may be a coroutine function
+ChunkCallback = Callable[["InsertChunk"], Union[None, Awaitable[None]]]
+
+# Called with a failed batch and its items (dead letters); may be a coroutine function
+DeadLetterCallback = Callable[["InsertChunk", List[Any]], Union[None, Awaitable[None]]]
+
+
+@dataclass
+class InsertChunk:
+    """
+    Outcome of one chunk of a chunked insert.
+
+    Attributes:
+        index: Chunk number (0-based)
+        offset: Position of the chunk's first document in the input
+        count: Number of documents in the chunk
+        inserted_ids: ObjectIds of the inserted documents, in input order
+        error: Exception that failed the chunk (None on success)
+    """
+
+    index: int
+    offset: int
+    count: int
+    inserted_ids: List[str] = field(default_factory=list)
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if every document of the chunk was inserted."""
+        return self.error is None
+
+
+class BulkInsertError(Exception):
+    """
+    One or more chunks of a chunked insert failed.
+
+    Documents of a failed chunk may be partially inserted (inserts are
+    ordered, so the ones before the failing document are).
+
+    Attributes:
+        chunks: Every chunk that was sent, in input order (insert_stream:
+            the failed batches only)
+    """
+
+    def __init__(self, message: str, chunks: List[InsertChunk]) -> None:
+        super().__init__(message)
+        self.chunks = chunks
+
+    @property
+    def failed(self) -> List[InsertChunk]:
+        """Chunks that failed."""
+        return [chunk for chunk in self.chunks if not chunk.ok]
+
+    @property
+    def inserted_ids(self) -> List[str]:
+        """Ids inserted by the successful chunks, in input order."""
+        return [doc_id for chunk in self.chunks if chunk.ok for doc_id in chunk.inserted_ids]
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _notify(callback: Optional[Callable[..., Any]], *args: Any) -> None:
+    """Call callback (if any), awaiting its result if it is awaitable."""
+    if callback is None:
+        return
+    result = callback(*args)
+    if inspect.isawaitable(result):
+        await result
+
+
+async def _send(
+    collection: str,
+    chunk: InsertChunk,
+    batch: List[Any],
+    prepare: Callable[[Any], Dict[str, Any]],
+    on_chunk: Optional[ChunkCallback],
+) -> InsertChunk:
+    """Insert one chunk, recording its ids or error on chunk."""
+    from . import _engine
+
+    try:
+        ids = await _engine.insert_many(collection, [prepare(item) for item in batch])
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        chunk.error = exc
+    else:
+        chunk.inserted_ids = ids
+        for item, doc_id in zip(batch, ids):
+            if not isinstance(item, dict):
+                item._id = doc_id
+    await _notify(on_chunk, chunk)
+    return chunk
+
+
+async def insert_chunks(
+    collection: str,
+    items: Iterable[Any],
+    prepare: Callable[[Any], Dict[str, Any]],
+    chunk_size: int,
+    max_in_flight: int = 2,
+    ordered: bool = True,
+    on_chunk: Optional[ChunkCallback] = None,
+) -> List[InsertChunk]:
+    """
+    Insert items in chunks, keeping up to max_in_flight chunks in flight.
+
+    Items that are not dicts (Document instances) get their _id set once
+    their chunk is inserted.
+
+    Args:
+        collection: Collection name
+        items: Documents to insert (consumed lazily)
+        prepare: Converts an item to the dict that is inserted
+        chunk_size: Documents per insert command
+        max_in_flight: Maximum number of chunks written concurrently
+        ordered: If True, stop sending chunks after the first failure.
+            If False, keep going and report all failed chunks.
+        on_chunk: Called with each chunk as it finishes
+
+    Returns:
+        The chunks, in input order
+
+    Raises:
+        BulkInsertError: If any chunk failed
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    done: List[InsertChunk] = []
+    pending: Set["asyncio.Task[InsertChunk]"] = set()
+    offset = 0
+    try:
+        for index, batch in enumerate(_chunks(items, chunk_size)):
+            if len(pending) >= max_in_flight:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                done.extend(task.result() for task in finished)
+            if ordered and any(not chunk.ok for chunk in done):
+                break
+            chunk = InsertChunk(index=index, offset=offset, count=len(batch))
+            pending.add(asyncio.ensure_future(_send(collection, chunk, batch, prepare, on_chunk)))
+            offset += len(batch)
+        if pending:
+            finished, pending = await asyncio.wait(pending)
+            done.extend(task.result() for task in finished)
+    finally:
+        for task in pending:
+            task.cancel()
+
+    done.sort(key=lambda chunk: chunk.index)
+    failed = [chunk for chunk in done if not chunk.ok]
+    if failed:
+        raise BulkInsertError(
+            f"{len(failed)} of {len(done)} chunk(s) failed to insert into '{collection}': {failed[0].error}",
+            done,
+        )
+    return done
+
+
+async def insert_stream(
+    collection: str,
+    source: AsyncIterable[Any],
+    prepare: Callable[[Any], Dict[str, Any]],
+    batch_size: int,
+    flush_interval: Optional[float] = 1.0,
+    max_pending: int = 2,
+    on_batch: Optional[ChunkCallback] = None,
+    on_error: Optional[DeadLetterCallback] = None,
+) -> int:
+    """
+    Insert the items of an async iterable in batches until it is exhausted.
+
+    A batch is sent when it holds batch_size items or when flush_interval
+    seconds have passed since its first item, whichever comes first. While
+    max_pending batches are unacknowledged, no more items are read from
+    the source (backpressure on the producer).
+
+    A failed batch is passed to on_error together with its items (dead
+    letters) and the stream goes on. Without on_error, the first failure
+    stops reading from the source: the pending batches are awaited, the
+    items not yet sent are dropped and BulkInsertError is raised.
+
+    Args:
+        collection: Collection name
+        source: Async iterable of documents to insert
+        prepare: Converts an item to the dict that is inserted
+        batch_size: Maximum documents per insert command
+        flush_interval: Maximum seconds an item waits for its batch to
+            fill (None = flush on size only)
+        max_pending: Maximum number of unacknowledged batches
+        on_batch: Called with each batch (as an InsertChunk) as it finishes
+        on_error: Called with a failed batch and its items
+
+    Returns:
+        Number of documents inserted
+
+    Raises:
+        BulkInsertError: If a batch failed and on_error is not given (its
+            chunks are the failed batches only; the stream is unbounded)
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if max_pending < 1:
+        raise ValueError("max_pending must be at least 1")
+    if flush_interval is not None and flush_interval <= 0:
+        raise ValueError("flush_interval must be positive")
+
+    async def send(chunk: InsertChunk, batch: List[Any]) -> InsertChunk:
+        await _send(collection, chunk, batch, prepare, on_batch)
+        if not chunk.ok and on_error is not None:
+            await _notify(on_error, chunk, batch)
+        return chunk
+
+    loop = asyncio.get_running_loop()
+    iterator = source.__aiter__()
+    pending: Set["asyncio.Task[InsertChunk]"] = set()
+    failed: List[InsertChunk] = []
+    batch: List[Any] = []
+    deadline: Optional[float] = None
+    read: Optional["asyncio.Future[Any]"] = None
+    source_error: Optional[BaseException] = None
+    index = offset = inserted = 0
+
+    def collect(finished: Iterable["asyncio.Task[InsertChunk]"]) -> None:
+        nonlocal inserted
+        for task in finished:
+            chunk = task.result()
+            if chunk.ok:
+                inserted += chunk.count
+            elif on_error is None:
+                failed.append(chunk)
+
+    async def flush() -> None:
+        nonlocal pending, batch, deadline, index, offset
+        collect([task for task in pending if task.done()])
+        pending = {task for task in pending if not task.done()}
+        while len(pending) >= max_pending:
+            # Backpressure: the source is not read until a batch is acknowledged
+            finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            collect(finished)
+        if failed:
+            return
+        chunk = InsertChunk(index=index, offset=offset, count=len(batch))
+        pending.add(asyncio.ensure_future(send(chunk, batch)))
+        index += 1
+        offset += len(batch)
+        batch = []
+        deadline = None
+
+    try:
+        while not failed:
+            if read is None:
+                read = asyncio.ensure_future(iterator.__anext__())
+            timeout = None if deadline is None else max(deadline - loop.time(), 0.0)
+            ready, _ = await asyncio.wait({read}, timeout=timeout)
+            if not ready:
+                # Time threshold hit; the read stays outstanding
+                await flush()
+                continue
+            task, read = read, None
+            try:
+                item = task.result()
+            except StopAsyncIteration:
+                break
+            except Exception as exc:
+                # Send what was read before the source failed, then re-raise
+                source_error = exc
+                break
+            batch.append(item)
+            if deadline is None and flush_interval is not None:
+                deadline = loop.time() + flush_interval
+            if len(batch) >= batch_size:
+                await flush()
+        if batch and not failed:
+            await flush()
+        if pending:
+            finished, pending = await asyncio.wait(pending)
+            collect(finished)
+    finally:
+        if read is not None:
+            read.cancel()
+        for task in pending:
+            task.cancel()
+
+    if source_error is not None:
+        raise source_error
+    if failed:
+        raise BulkInsertError(
+            f"{len(failed)} batch(es) failed to insert into '{collection}': {failed[0].error}",
+            failed,
+        )
+    return inserted
+
+
+__all__ = ["InsertChunk", "BulkInsertError", "insert_chunks", "insert_stream"]
@@ -0,0 +1,198 @@
+"""
+Lazy per-field decoding of documents loaded from MongoDB.
+
+Models with ``Settings.lazy_decode = True`` keep each document's raw BSON
+bytes and decode a field into Python only the first time it is read. This
+cuts decode CPU and peak memory for list endpoints that load wide
+documents but only touch a handful of fields.
+
+Example:
+    >>> class Article(Document):
+    ...     title: str
+    ...     body: str
+    ...     comments: List[dict] = []
+    ...
+    ...     class Settings:
+    ...         name = "articles"
+    ...         lazy_decode = True
+    >>>
+    >>> for article in await Article.find().to_list():
+    ...     print(article.title)  # only "title" is decoded
+
+EmbeddedDocument fields are built by the backend when the field is decoded.
+
+Anything that needs the whole document (``to_dict()``, ``save()``,
+iteration, equality, copying) decodes the remaining fields once and then
+behaves like a regular dict.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+from data_bridge import mongodb as _rust
+
+_MISSING = object()
+
+
+class LazyFieldDict(dict):
+    """
+    Document data dict that decodes fields from raw BSON on first access.
+
+    Decoded values are cached in the dict itself, so each field is decoded
+    at most once. Keys that have not been read yet live only in the raw
+    buffer until the dict is materialized.
+
+    Args:
+        raw: BSON bytes of the document
+        keys: Top-level field names present in ``raw`` (excluding ``_id``)
+        embedded: Embedded-document layout of the model, or None
+            (see type_extraction.extract_embedded_layout)
+    """
+
+    __slots__ = ("_raw", "_pending", "_embedded")
+
+    def __init__(
+        self,
+        raw: bytes,
+        keys: Iterable[str],
+        embedded: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__()
+        self._raw: Optional[bytes] = raw
+        self._pending: Set[str] = set(keys)
+        self._embedded = embedded
+
+    # ----- single-field access (decodes one field) -----
+
+    def __missing__(self, key: str) -> Any:
+        if key in self._pending:
+            spec = self._embedded.get(key) if self._embedded else None
+            value = _rust.decode_field(self._raw, key, spec)
+            dict.__setitem__(self, key, value)
+            self._pending.discard(key)
+            return value
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self._pending
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if key in self._pending:
+            return self[key]
+        return default
+
+    def __delitem__(self, key: str) -> None:
+        if dict.__contains__(self, key):
+            dict.__delitem__(self, key)
+        elif key not in self._pending:
+            raise KeyError(key)
+        self._pending.discard(key)
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def __len__(self) -> int:
+        undecoded = sum(1 for key in self._pending if not dict.__contains__(self, key))
+        return dict.__len__(self) + undecoded
+
+    @property
+    def is_materialized(self) -> bool:
+        """True once every field has been decoded."""
+        return self._raw is None
+
+    # ----- whole-document access (decodes everything once) -----
+
+    def materialize(self) -> None:
+        """
+        Decode all remaining fields and drop the raw buffer.
+
+        Field order follows the stored document; values already read or
+        assigned are kept as they are.
+        """
+        if self._raw is None:
+            return
+        decoded: Dict[str, Any] = _rust.decode_document(self._raw, self._embedded)
+        # Mark as materialized first: copying a dict subclass goes through keys()
+        self._raw = None
+        current = dict.copy(self)
+        dict.clear(self)
+        for key, value in decoded.items():
+            if key in current:
+                dict.__setitem__(self, key, current.pop(key))
+            elif key in self._pending:
+                dict.__setitem__(self, key, value)
+        # Fields added after loading go last
+        dict.update(self, current)
+        self._pending = set()
+
+    def __iter__(self) -> Iterator[str]:
+        self.materialize()
+        return dict.__iter__(self)
+
+    def keys(self):  # type: ignore[override]
+        self.materialize()
+        return dict.keys(self)
+
+    def values(self):  # type: ignore[override]
+        self.materialize()
+        return dict.values(self)
+
+    def items(self):  # type: ignore[override]
+        self.materialize()
+        return dict.items(self)
+
+    def popitem(self) -> Any:
+        self.materialize()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._pending = set()
+        self._raw = None
+
+    def copy(self) -> Dict[str, Any]:
+        self.materialize()
+        return dict.copy(self)
+
+    def __eq__(self, other: object) -> bool:
+        self.materialize()
+        if isinstance(other, LazyFieldDict):
+            other.materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __or__(self, other: Any) -> Any:
+        self.materialize()
+        return dict.copy(self) | other
+
+    def __reduce__(self) -> Any:
+        # Pickle/copy as a plain dict
+        self.materialize()
+        return (dict, (dict.copy(self),))
+
+    def __repr__(self) -> str:
+        self.materialize()
+        return dict.__repr__(self)
+
+
+__all__ = ["LazyFieldDict"]
@@ -143,20 +143,23 @@ class IterativeMigration(Migration):
     async def forward(self) -> None:
         """
         Apply migration by transforming all documents.
+
+        Pages through the collection by _id with keyset pagination, so each
+        batch costs the same regardless of how far into the collection it is.
         """
-        skip = 0
+        token = None
         while True:
             # Fetch a batch of documents
-            docs = await self.input_model.find().skip(skip).limit(self.batch_size).to_list()
-            if not docs:
-                break
+            page = await self.input_model.find().after(token).paginate(self.batch_size)
 
             # Transform each document
-            for doc in docs:
+            for doc in page.items:
                 transformed = await self.transform(doc)
                 await transformed.save()
 
-            skip += len(docs)
+            if not page.has_next:
+                break
+            token = page.next_token
 
 
 class FreeFallMigration(Migration):
@@ -217,19 +220,19 @@ def iterative_migration(
 
             async def forward(self) -> None:
                 """Apply migration by transforming all documents."""
-                skip = 0
+                token = None
                 while True:
-                    # Fetch a batch of documents
-                    docs = await input_model.find().skip(skip).limit(batch_size).to_list()
-                    if not docs:
-                        break
+                    # Fetch a batch of documents (keyset pagination by _id)
+                    page = await input_model.find().after(token).paginate(batch_size)
 
                     # Transform each document
-                    for doc in docs:
+                    for doc in page.items:
                         transformed = await self._transform(doc)
                         await transformed.save()
 
-                    skip += len(docs)
+                    if not page.has_next:
+                        break
+                    token = page.next_token
 
             async def _transform(self, document: Document) -> Document:
                 """Transform wrapper that calls the original method."""
@@ -35,6 +35,26 @@ def available_features() -> list[str]:
     """
     ...
 
+def decode_field(raw: bytes, key: str, embedded: Optional[tuple[Any, bool, dict[str, Any]]] = None) -> Any:
+    """
+    Decode a single top-level field from raw BSON document bytes.
+
+    With an embedded layout entry (loader, many, nested_layout), the value is
+    built as EmbeddedDocument instance(s).
+
+    Raises:
+        KeyError: If the field is not present
+    """
+    ...
+
+def decode_document(raw: bytes, layout: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+    """
+    Decode all top-level fields (except _id) from raw BSON document bytes.
+
+    Fields listed in the embedded layout are built as EmbeddedDocument instances.
+    """
+    ...
+
 class Document:
     """
     Low-level MongoDB Document class (Rust backend).
@@ -78,6 +98,19 @@ class Document:
         projection: Optional[dict[str, int]] = None,
     ) -> Awaitable[list["Document"]]: ...
 
+    @staticmethod
+    def find_as_documents(
+        collection_name: str,
+        document_class: type,
+        filter: Optional[dict[str, Any]] = None,
+        sort: Optional[dict[str, int]] = None,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+        projection: Optional[dict[str, int]] = None,
+        lazy_class: Optional[type] = None,
+        class_map: Optional[dict[str, type]] = None,
+    ) -> Awaitable[list[Any]]: ...
+
     @staticmethod
     def find_by_id(collection_name: str, id: str) -> Awaitable[Optional["Document"]]: ...
 
@@ -125,4 +158,49 @@ class Document:
         pipeline: list[dict[str, Any]]
     ) -> Awaitable[list["Document"]]: ...
 
+    @staticmethod
+    def open_cursor(
+        collection_name: str,
+        document_class: Optional[type] = None,
+        filter: Optional[dict[str, Any]] = None,
+        sort: Optional[dict[str, int]] = None,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        projection: Optional[dict[str, int]] = None,
+        lazy_class: Optional[type] = None,
+        class_map: Optional[dict[str, type]] = None,
+    ) -> Awaitable["Cursor"]: ...
+
+    @staticmethod
+    def find_columns(
+        collection_name: str,
+        fields: list[str],
+        filter: Optional[dict[str, Any]] = None,
+        sort: Optional[dict[str, int]] = None,
+        skip: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Awaitable[dict[str, tuple[str, Any, Optional[bytes]]]]: ...
+
+    @staticmethod
+    def aggregate_columns(
+        collection_name: str,
+        pipeline: list[dict[str, Any]],
+        fields: list[str],
+    ) -> Awaitable[dict[str, tuple[str, Any, Optional[bytes]]]]: ...
+
+class Cursor:
+    """
+    Server-side cursor returned by Document.open_cursor().
+
+    Each next_batch() call pulls at most one driver batch; an empty list
+    means the cursor is exhausted.
+    """
+
+    @property
+    def closed(self) -> bool: ...
+
+    def next_batch(self) -> Awaitable[list[Any]]: ...
+    def close(self) -> Awaitable[None]: ...
+
 __doc__: str
@@ -0,0 +1,184 @@
+"""
+Precompiled per-class model plans.
+
+DocumentMeta compiles one ModelPlan for every Document class when the
+class is created. The plan collects the class metadata that CRUD and
+conversion paths need on every call, so hot paths read precomputed
+tables instead of re-walking annotations and the MRO per document:
+
+- Link / BackLink fields (``_from_db``, ``save``, link fetching)
+- Field defaults and default factories (``__init__``)
+- Fields whose values are stored as-is (``to_dict``)
+- Indexed fields (``ensure_indexes``)
+- Event-hook handlers (``before_event`` / ``after_event`` dispatch)
+- Settings flags (state management, revisions)
+
+The embedded-document layout and the BSON schema depend on resolved type
+hints, which may reference classes defined after the model, so they are
+resolved on first use and then kept on the plan.
+
+Example:
+    >>> User._plan.link_fields
+    mappingproxy({'team': ('Link', <class 'Team'>)})
+    >>> User._plan.defaults
+    (('age', None, 0), ('tags', <class 'list'>, None))
+"""
+
+from __future__ import annotations
+
+import typing
+from datetime import date, datetime
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple, get_args, get_origin
+
+from .actions import ActionRegistry, collect_actions
+from .links import get_link_fields
+from .type_extraction import extract_embedded_layout, extract_schema, is_annotated_type, unwrap_annotated_type
+from .types import IndexModelField, get_index_fields
+
+# Annotations whose values to_dict() can store without inspecting them
+_SCALAR_TYPES = (str, int, float, bool, bytes, datetime, date, Decimal)
+
+# (field_name, default_factory or None, default value)
+DefaultSpec = Tuple[str, Optional[Callable[[], Any]], Any]
+
+
+def _is_scalar_annotation(annotation: Any) -> bool:
+    """Check for scalar (or Optional scalar) annotations."""
+    if is_annotated_type(annotation):
+        annotation, _ = unwrap_annotated_type(annotation)
+
+    if get_origin(annotation) is typing.Union:
+        args = get_args(annotation)
+        if len(args) == 2 and type(None) in args:
+            inner = args[0] if args[1] is type(None) else args[1]
+            return _is_scalar_annotation(inner)
+        return False
+
+    return annotation in _SCALAR_TYPES
+
+
+def _default_spec(field_name: str, default: Any) -> DefaultSpec:
+    """Resolve a captured class default the way Document.__init__ applies it."""
+    # FieldInfo with default_factory
+    if hasattr(default, "default_factory") and default.default_factory:
+        return field_name, default.default_factory, None
+    # FieldInfo with an explicit default
+    if hasattr(default, "default") and default.default is not ...:
+        return field_name, None, default.default
+    # Plain default value (like version: int = 1)
+    return field_name, None, default
+
+
+class ModelPlan:
+    """
+    Immutable metadata plan for one Document class.
+
+    Built by DocumentMeta once the class's fields and settings are set up,
+    and stored as ``cls._plan``.
+
+    Attributes:
+        model: The Document class
+        fields: Field name -> annotation
+        link_fields: Field name -> (link_type, target_type) for Link/BackLink fields
+        links: Names of Link fields (stored as references)
+        backlinks: Names of BackLink fields (never stored)
+        defaults: (field_name, default_factory, value) for fields with a default
+        passthrough_fields: Fields with scalar annotations, stored as-is by to_dict()
+        index_fields: Field name -> IndexModelField for Indexed(...) fields
+        actions: Event-hook handlers by event (see actions.collect_actions)
+        use_state_management: Settings.use_state_management
+        use_revision: Settings.use_revision
+    """
+
+    __slots__ = (
+        "model",
+        "fields",
+        "link_fields",
+        "links",
+        "backlinks",
+        "defaults",
+        "passthrough_fields",
+        "index_fields",
+        "actions",
+        "use_state_management",
+        "use_revision",
+        "_embedded_layout",
+        "_schema",
+    )
+
+    model: type
+    fields: Mapping[str, Any]
+    link_fields: Mapping[str, Tuple[str, Any]]
+    links: Tuple[str, ...]
+    backlinks: Tuple[str, ...]
+    defaults: Tuple[DefaultSpec, ...]
+    passthrough_fields: FrozenSet[str]
+    index_fields: Mapping[str, IndexModelField]
+    actions: ActionRegistry
+    use_state_management: bool
+    use_revision: bool
+
+    def __init__(self, model: type) -> None:
+        fields: Dict[str, Any] = dict(getattr(model, "_fields", {}))
+        field_defaults: Dict[str, Any] = getattr(model, "_field_defaults", {})
+        settings = getattr(model, "_settings", None)
+        link_fields = get_link_fields(model)
+
+        init = object.__setattr__
+        init(self, "model", model)
+        init(self, "fields", MappingProxyType(fields))
+        init(self, "link_fields", MappingProxyType(link_fields))
+        init(self, "links", tuple(
+            name for name, (link_type, _) in link_fields.items() if link_type == "Link"
+        ))
+        init(self, "backlinks", tuple(
+            name for name, (link_type, _) in link_fields.items() if link_type == "BackLink"
+        ))
+        init(self, "defaults", tuple(
+            _default_spec(name, field_defaults[name]) for name in fields if name in field_defaults
+        ))
+        init(self, "passthrough_fields", frozenset(
+            name for name, annotation in fields.items()
+            if name not in link_fields and _is_scalar_annotation(annotation)
+        ))
+        init(self, "index_fields", MappingProxyType(get_index_fields(model)))
+        init(self, "actions", collect_actions(model))
+        init(self, "use_state_management", bool(getattr(settings, "use_state_management", False)))
+        init(self, "use_revision", bool(getattr(settings, "use_revision", False)))
+        init(self, "_embedded_layout", None)
+        init(self, "_schema", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def embedded_layout(self) -> Dict[str, Tuple[Any, bool, Dict[str, Any]]]:
+        """EmbeddedDocument field layout (see type_extraction.extract_embedded_layout)."""
+        layout = self._embedded_layout
+        if layout is None:
+            layout = extract_embedded_layout(self.model)
+            object.__setattr__(self, "_embedded_layout", layout)
+        return layout
+
+    @property
+    def schema(self) -> Dict[str, Dict[str, Any]]:
+        """BSON type descriptors for Rust-side validation (see type_extraction.extract_schema)."""
+        schema = self._schema
+        if schema is None:
+            schema = extract_schema(self.model)
+            object.__setattr__(self, "_schema", schema)
+        return schema
+
+    def apply_defaults(self, data: Dict[str, Any]) -> None:
+        """Fill fields missing from data with their defaults (in place)."""
+        for field_name, factory, value in self.defaults:
+            if field_name not in data:
+                data[field_name] = factory() if factory is not None else value
+
+    def __repr__(self) -> str:
+        return f"ModelPlan({self.model.__name__}, fields={list(self.fields)})"
+
+
+__all__ = ["ModelPlan"]
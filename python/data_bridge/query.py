@@ -4,6 +4,11 @@ Query builder for chainable MongoDB queries.
 This module provides a Beanie-compatible query builder that supports:
 - Fluent/chainable API: .sort().skip().limit().to_list()
 - Async execution with Rust backend
+- Streaming iteration: async for / .batches(n)
+- Keyset pagination: .after(cursor) / .paginate(page_size)
+- Columnar results: .to_columns(*fields)
+- Prepared queries: .prepare() with Param placeholders
+- Multi-aggregate statistics: .stats(*fields, ops=..., group_by=...)
 - Type-safe query expressions
 
 Example:
@@ -16,17 +21,318 @@ Example:
 
 from __future__ import annotations
 
-from typing import Any, Generic, List, Optional, Type, TypeVar, TYPE_CHECKING, Union
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import (
+    Any, AsyncIterator, Callable, Dict, FrozenSet, Generic, Iterator, List, Mapping, Optional, Sequence, Type,
+    TypeVar, TYPE_CHECKING, Union,
+)
 
-from .fields import QueryExpr, merge_filters
+from .fields import Param, QueryExpr, merge_filters
+from .stats import DEFAULT_STATS_OPS, Stats, StatsPlan
+from .unit_of_work import current_unit_of_work
 
 if TYPE_CHECKING:
+    from .columns import Column
     from .document import Document
     from .fields import FieldProxy
 
 T = TypeVar("T", bound="Document")
 
 
+# ===================
+# Keyset Pagination
+# ===================
+
+
+def _encode_token_value(value: Any) -> Any:
+    """Encode a sort value as JSON-safe data for a continuation token."""
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    if isinstance(value, date):
+        return {"$day": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$decimal": str(value)}
+    if isinstance(value, bytes):
+        return {"$bytes": base64.b64encode(value).decode("ascii")}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    # ObjectId and friends round-trip through their string form
+    return str(value)
+
+
+def _decode_token_value(value: Any) -> Any:
+    """Inverse of _encode_token_value()."""
+    if isinstance(value, dict) and len(value) == 1:
+        tag, raw = next(iter(value.items()))
+        if tag == "$date":
+            return datetime.fromisoformat(raw)
+        if tag == "$day":
+            return date.fromisoformat(raw)
+        if tag == "$decimal":
+            return Decimal(raw)
+        if tag == "$bytes":
+            return base64.b64decode(raw)
+    return value
+
+
+def _encode_page_token(sort_spec: List[tuple], values: tuple) -> str:
+    """Build an opaque continuation token from a keyset sort and its values."""
+    payload = {
+        "s": [[field, direction] for field, direction in sort_spec],
+        "v": [_encode_token_value(v) for v in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_page_token(token: str) -> tuple:
+    """Decode a continuation token into (sort_spec, values)."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        sort_spec = [(field, direction) for field, direction in payload["s"]]
+        values = tuple(_decode_token_value(v) for v in payload["v"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid pagination token") from e
+    return sort_spec, values
+
+
+def _check_keyset_values(sort_spec: List[tuple], values: tuple) -> None:
+    """Reject null sort values: a range seek past null skips or repeats documents."""
+    nulls = [field for (field, _), value in zip(sort_spec, values) if value is None]
+    if nulls:
+        raise ValueError(
+            f"Cannot resume after a null value of sort fields {nulls}: keyset "
+            "pagination needs non-null sort values (check that project() keeps them)"
+        )
+
+
+def _get_path(data: dict, path: str) -> Any:
+    """Read a (possibly dotted) field path from a document dict."""
+    value: Any = data
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _column_field_names(fields: tuple) -> List[str]:
+    """Normalize to_columns() arguments (FieldProxy or str) to field paths."""
+    if not fields:
+        raise ValueError("to_columns() requires at least one field")
+    names = []
+    for field in fields:
+        name = field.name if hasattr(field, "name") else str(field)
+        names.append("_id" if name == "id" else name)
+    return names
+
+
+# ===================
+# Link Lookups
+# ===================
+
+FETCH_LINKS_STRATEGIES = ("batch", "lookup")
+
+# Joined documents are written next to the stored reference, so a Link whose
+# target no longer exists keeps its ref
+_LOOKUP_PREFIX = "__lookup_"
+
+
+def _lookup_fields(model: Type["Document"]) -> List[tuple]:
+    """
+    List the resolvable link fields of a model and of its subclasses.
+
+    Results of an inheritance hierarchy are built as their concrete class
+    (see Document._from_db), so the Link/BackLink fields only declared by
+    a subclass are listed too. A field name is taken from the first class
+    that declares it (the model, then its subclasses in registration order).
+
+    Returns:
+        [(field_name, target_cls, link_field), ...] where link_field is
+        None for Link fields and the referencing field for BackLinks
+    """
+    classes = [model] + [
+        cls for cls in model._child_classes.values() if cls is not model and issubclass(cls, model)
+    ]
+    fields = []
+    seen = set()
+    for cls in classes:
+        for field_name, (link_type, target_type) in cls._plan.link_fields.items():
+            if field_name in seen:
+                continue
+            seen.add(field_name)
+            target_cls = cls._resolve_document_class(target_type)
+            if target_cls is None:
+                continue
+            if link_type == "Link":
+                fields.append((field_name, target_cls, None))
+            elif link_type == "BackLink":
+                link_field = getattr(cls._field_defaults.get(field_name), "_link_field", None)
+                if link_field:
+                    fields.append((field_name, target_cls, link_field))
+    return fields
+
+
+def _lookup_stages(model: Type["Document"], depth: int) -> List[dict]:
+    """
+    Compile the Link/BackLink fields of a model into $lookup stages.
+
+    Nested levels become sub-pipelines of the enclosing $lookup, so the
+    whole link graph is resolved by a single aggregation.
+    """
+    if depth <= 0:
+        return []
+
+    stages = []
+    for field_name, target_cls, link_field in _lookup_fields(model):
+        pipeline = _lookup_stages(target_cls, depth - 1)
+        # Child classes share the root collection: keep only their documents
+        class_filter = target_cls.find()._build_filter()
+        if class_filter:
+            pipeline.insert(0, {"$match": class_filter})
+
+        lookup: Dict[str, Any] = {
+            "from": target_cls.__collection_name__(),
+            "localField": field_name if link_field is None else "_id",
+            "foreignField": "_id" if link_field is None else link_field,
+            "as": _LOOKUP_PREFIX + field_name,
+        }
+        if pipeline:
+            lookup["pipeline"] = pipeline
+        stages.append({"$lookup": lookup})
+    return stages
+
+
+def _hydrate_lookup(model: Type["Document"], row: dict, depth: int, uow: Any, partial: bool = False) -> Any:
+    """Build a document from an aggregation row and attach its joined links."""
+    from .links import Link, BackLink
+
+    fields = _lookup_fields(model) if depth > 0 else []
+    joined = {field_name: row.pop(_LOOKUP_PREFIX + field_name, None) for field_name, _, _ in fields}
+
+    doc = model._from_db(row, validate=False)
+    if partial:
+        doc._loaded_fields = frozenset(doc._data)
+    if uow is not None:
+        doc = uow.register(doc)
+
+    for field_name, target_cls, link_field in fields:
+        rows = joined[field_name]
+        # Fields of another class of the hierarchy were joined for nothing
+        if rows is None or field_name not in type(doc)._plan.link_fields:
+            continue
+        linked = [_hydrate_lookup(target_cls, linked_row, depth - 1, uow) for linked_row in rows]
+        if link_field is None:
+            if linked:
+                doc._data[field_name] = Link(linked[0], document_class=target_cls)
+        else:
+            backlink = BackLink(document_class=target_cls, link_field=link_field)
+            backlink._documents = linked
+            doc._data[field_name] = backlink
+    return doc
+
+
+# ===================
+# Prepared Queries
+# ===================
+
+# Builds one bound value from the parameters of an execution
+_Binder = Callable[[Mapping[str, Any]], Any]
+
+
+def _compile_binder(value: Any, names: set) -> Optional[_Binder]:
+    """
+    Compile a filter template into a binder.
+
+    Only the containers on the path to a Param are rebuilt when binding;
+    everything else is shared with the template. Param names are added
+    to names.
+
+    Returns:
+        Binder for the value, or None if it holds no Param
+    """
+    if isinstance(value, Param):
+        name = value.name
+        names.add(name)
+        return lambda params: params[name]
+
+    if isinstance(value, dict):
+        binders = []
+        for key, item in value.items():
+            binder = _compile_binder(item, names)
+            if binder is not None:
+                binders.append((key, binder))
+        if not binders:
+            return None
+
+        def bind_dict(params: Mapping[str, Any]) -> dict:
+            bound = dict(value)
+            for key, binder in binders:
+                bound[key] = binder(params)
+            return bound
+        return bind_dict
+
+    if isinstance(value, (list, tuple)):
+        binders = []
+        for index, item in enumerate(value):
+            binder = _compile_binder(item, names)
+            if binder is not None:
+                binders.append((index, binder))
+        if not binders:
+            return None
+
+        def bind_list(params: Mapping[str, Any]) -> list:
+            bound = list(value)
+            for index, binder in binders:
+                bound[index] = binder(params)
+            return bound
+        return bind_list
+
+    return None
+
+
+class Page(Generic[T]):
+    """
+    One page of results from QueryBuilder.paginate().
+
+    Attributes:
+        items: Documents on this page
+        next_token: Opaque token for the next page, or None on the last page
+
+    Example:
+        >>> page = await User.find().sort("-created_at").paginate(50)
+        >>> while True:
+        ...     handle(page.items)
+        ...     if not page.has_next:
+        ...         break
+        ...     page = await User.find().sort("-created_at").after(page.next_token).paginate(50)
+    """
+
+    __slots__ = ("items", "next_token")
+
+    def __init__(self, items: List[T], next_token: Optional[str]) -> None:
+        self.items = items
+        self.next_token = next_token
+
+    @property
+    def has_next(self) -> bool:
+        """True if there is a page after this one."""
+        return self.next_token is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        return f"Page(items={len(self.items)}, has_next={self.has_next})"
+
+
 class QueryBuilder(Generic[T]):
     """
     Chainable query builder for MongoDB operations.
@@ -60,6 +366,8 @@ class QueryBuilder(Generic[T]):
         _with_children: bool = True,
         _fetch_links: bool = False,
         _fetch_links_depth: int = 1,
+        _fetch_links_strategy: str = "batch",
+        _after: Optional[tuple] = None,
     ) -> None:
         """
         Initialize query builder.
@@ -74,6 +382,8 @@ class QueryBuilder(Generic[T]):
             _with_children: Include child class documents (for inheritance)
             _fetch_links: Whether to fetch linked documents
             _fetch_links_depth: How deep to fetch nested links
+            _fetch_links_strategy: How links are fetched ("batch" or "lookup")
+            _after: Keyset sort values to resume after (see after())
         """
         self._model = model
         self._filters = filters
@@ -84,6 +394,8 @@ class QueryBuilder(Generic[T]):
         self._with_children_val = _with_children
         self._fetch_links_val = _fetch_links
         self._fetch_links_depth_val = _fetch_links_depth
+        self._fetch_links_strategy = _fetch_links_strategy
+        self._after_val = _after
 
     def _clone(self, **kwargs: Any) -> "QueryBuilder[T]":
         """Create a copy of this builder with updated values."""
@@ -97,6 +409,8 @@ class QueryBuilder(Generic[T]):
             _with_children=kwargs.get("_with_children", self._with_children_val),
             _fetch_links=kwargs.get("_fetch_links", self._fetch_links_val),
             _fetch_links_depth=kwargs.get("_fetch_links_depth", self._fetch_links_depth_val),
+            _fetch_links_strategy=kwargs.get("_fetch_links_strategy", self._fetch_links_strategy),
+            _after=kwargs.get("_after", self._after_val),
         )
 
     def with_children(self, include: bool = True) -> "QueryBuilder[T]":
@@ -121,20 +435,40 @@ class QueryBuilder(Generic[T]):
         """
         return self._clone(_with_children=include)
 
-    def fetch_links(self, fetch: bool = True, depth: int = 1) -> "QueryBuilder[T]":
+    def fetch_links(self, fetch: bool = True, depth: int = 1, strategy: str = "batch") -> "QueryBuilder[T]":
         """
         Configure automatic fetching of linked documents.
 
         When fetch_links is enabled, Link[T] fields will be automatically
         resolved by fetching the referenced documents from the database.
 
+        Two strategies are available:
+
+        - ``"batch"`` (default): after the query, one ``$in`` query per
+          Link target type and one per BackLink field, sent concurrently;
+          each nesting level costs another round trip.
+        - ``"lookup"``: the query runs as one aggregation whose ``$lookup``
+          stages join every level server-side, so ``to_list()`` (and each
+          ``paginate()`` page) costs a single request whatever the depth.
+          Links must be stored as ObjectIds (the default conversion mode),
+          results skip the query cache, and ``batches()`` / ``async for``
+          still use the batch strategy. For inheritance hierarchies the
+          links declared by every subclass are joined. Nested levels and
+          child-class targets combine ``localField``/``foreignField``
+          with a ``pipeline`` in one ``$lookup``, which requires
+          MongoDB 5.0+.
+
         Args:
             fetch: If True, fetch linked documents after query
             depth: How many levels of nested links to fetch (default 1)
+            strategy: "batch" or "lookup"
 
         Returns:
             New QueryBuilder with fetch_links setting
 
+        Raises:
+            ValueError: If strategy is unknown
+
         Example:
             >>> class Post(Document):
             ...     title: str
@@ -150,8 +484,36 @@ class QueryBuilder(Generic[T]):
             >>>
             >>> # Or using the method:
             >>> post = await Post.find(Post.id == id).fetch_links().first()
+            >>>
+            >>> # Resolve two levels of links in one aggregation
+            >>> posts = await Post.find().fetch_links(depth=2, strategy="lookup").to_list()
+        """
+        if strategy not in FETCH_LINKS_STRATEGIES:
+            raise ValueError(
+                f"Unknown fetch_links strategy {strategy!r}, expected one of {FETCH_LINKS_STRATEGIES}"
+            )
+        return self._clone(_fetch_links=fetch, _fetch_links_depth=depth, _fetch_links_strategy=strategy)
+
+    def prepare(self) -> "PreparedQuery[T]":
+        """
+        Compile this query into a reusable template.
+
+        Filter, sort and options are built once; each execution only binds
+        the values of the Param placeholders in the filter, instead of
+        rebuilding QueryExpr objects, merging filters and adding the
+        inheritance and keyset clauses on every call.
+
+        Returns:
+            PreparedQuery bound to this query's model and options
+
+        Example:
+            >>> from data_bridge import Param
+            >>>
+            >>> by_email = User.find(User.email == Param("email")).prepare()
+            >>> for email in emails:
+            ...     user = await by_email.first(email=email)
         """
-        return self._clone(_fetch_links=fetch, _fetch_links_depth=depth)
+        return PreparedQuery(self)
 
     def sort(self, *fields: Union[tuple, str]) -> "QueryBuilder[T]":
         """
@@ -173,6 +535,10 @@ class QueryBuilder(Generic[T]):
             >>> # Using tuples
             >>> User.find().sort(("created_at", -1), ("name", 1))
         """
+        if self._after_val is not None:
+            # after() captured values for the sort spec at that point
+            raise ValueError("sort() must be called before after()")
+
         sort_spec = list(self._sort_spec)
 
         for field in fields:
@@ -235,6 +601,11 @@ class QueryBuilder(Generic[T]):
         Returns:
             New QueryBuilder with projection applied
 
+        Documents returned from a projected query are partially loaded:
+        their _loaded_fields attribute lists the fetched fields, save() only
+        updates those (plus any assigned afterwards) and replace() refuses
+        to run, so unloaded fields can't be overwritten.
+
         Example:
             >>> # Only return email and name fields
             >>> User.find().project(email=1, name=1).to_list()
@@ -244,12 +615,127 @@ class QueryBuilder(Generic[T]):
         """
         return self._clone(_projection=fields)
 
+    def _build_projection(self) -> Optional[dict]:
+        """Build the MongoDB projection document.
+
+        Inclusion projections always keep the fields the ORM relies on:
+        revision_id for optimistic locking and _class_id for polymorphic
+        loading.
+        """
+        if not self._projection:
+            return None
+
+        projection = dict(self._projection)
+        is_inclusion = any(value for field, value in projection.items() if field != "_id")
+        if is_inclusion:
+            if getattr(self._model._settings, "use_revision", False):
+                projection.setdefault("revision_id", 1)
+            if self._model._class_id is not None:
+                projection.setdefault("_class_id", 1)
+        return projection
+
+    def _keyset_sort(self) -> List[tuple]:
+        """Current sort spec with the _id tiebreaker appended (if missing)."""
+        sort_spec = list(self._sort_spec)
+        if not any(field == "_id" for field, _ in sort_spec):
+            sort_spec.append(("_id", 1))
+        return sort_spec
+
+    def after(self, cursor: Any) -> "QueryBuilder[T]":
+        """
+        Resume the query after a given position (keyset / seek pagination).
+
+        The current sort spec, plus an ``_id`` tiebreaker, is turned into a
+        range filter, so MongoDB seeks straight to the next page through the
+        index instead of walking past skipped documents. Page N costs the
+        same as page 1.
+
+        Args:
+            cursor: Where to resume from. One of:
+                - a continuation token from paginate()
+                - the last document of the previous page
+                - a dict of {field: value} for every sort field
+                - a tuple of values in sort order (``_id`` last)
+                - None (no-op, starts from the beginning)
+
+        Returns:
+            New QueryBuilder that only matches documents after the cursor
+
+        Example:
+            >>> last = page[-1]
+            >>> next_page = await User.find().sort("-created_at").after(last).limit(50).to_list()
+        """
+        if cursor is None:
+            return self._clone(_after=None)
+
+        sort_spec = self._keyset_sort()
+
+        if isinstance(cursor, str):
+            token_sort, values = _decode_page_token(cursor)
+            if token_sort != sort_spec:
+                raise ValueError(
+                    "Pagination token was created for a different sort order: "
+                    f"{token_sort} != {sort_spec}"
+                )
+        elif isinstance(cursor, dict):
+            missing = [field for field, _ in sort_spec if field not in cursor]
+            if missing:
+                raise ValueError(f"after() is missing values for sort fields: {missing}")
+            values = tuple(cursor[field] for field, _ in sort_spec)
+        elif isinstance(cursor, (tuple, list)):
+            if len(cursor) != len(sort_spec):
+                raise ValueError(
+                    f"after() expected {len(sort_spec)} values for sort "
+                    f"{sort_spec}, got {len(cursor)}"
+                )
+            values = tuple(cursor)
+        elif hasattr(cursor, "_data") and hasattr(cursor, "_id"):
+            if cursor._id is None:
+                raise ValueError("after() needs a document that has been saved")
+            values = tuple(
+                cursor._id if field == "_id" else _get_path(cursor._data, field)
+                for field, _ in sort_spec
+            )
+        else:
+            raise TypeError(
+                f"after() expects a token, document, dict or tuple, got {type(cursor).__name__}"
+            )
+
+        _check_keyset_values(sort_spec, values)
+        return self._clone(_sort=sort_spec, _after=values)
+
+    def _build_keyset_filter(self) -> Optional[dict]:
+        """Turn the keyset sort and _after values into a range filter.
+
+        For sort (a ASC, b DESC, _id ASC) after (x, y, z) this produces:
+            {"$or": [{"a": {"$gt": x}},
+                     {"a": x, "b": {"$lt": y}},
+                     {"a": x, "b": y, "_id": {"$gt": z}}]}
+        """
+        if self._after_val is None:
+            return None
+        if len(self._after_val) != len(self._sort_spec):
+            raise ValueError(
+                f"after() values {self._after_val} do not match sort {self._sort_spec}"
+            )
+
+        clauses = []
+        prefix: dict = {}
+        for (field, direction), value in zip(self._sort_spec, self._after_val):
+            op = "$gt" if direction == 1 else "$lt"
+            clauses.append({**prefix, field: {op: value}})
+            prefix[field] = value
+
+        return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
     def _build_filter(self) -> dict:
         """Build the MongoDB filter document.
 
         Handles inheritance filtering:
         - If with_children=False and the model has a _class_id, adds _class_id filter
         - If querying from a child class (not root), always filter by _class_id
+
+        Also adds the keyset range filter when after() was used.
         """
         base_filter = merge_filters(self._filters)
 
@@ -266,13 +752,15 @@ class QueryBuilder(Generic[T]):
                 # Child class: always filter by its own _class_id
                 class_id_filter = {"_class_id": self._model._class_id}
 
-        if class_id_filter:
-            if base_filter:
-                return {"$and": [base_filter, class_id_filter]}
-            else:
-                return class_id_filter
+        clauses = [
+            clause
+            for clause in (base_filter, class_id_filter, self._build_keyset_filter())
+            if clause
+        ]
 
-        return base_filter
+        if len(clauses) > 1:
+            return {"$and": clauses}
+        return clauses[0] if clauses else base_filter
 
     def _build_sort(self) -> Optional[dict]:
         """Build the MongoDB sort document."""
@@ -290,21 +778,53 @@ class QueryBuilder(Generic[T]):
         Example:
             >>> users = await User.find(User.active == True).to_list()
         """
+        return await self._find(
+            self._build_filter(),
+            self._build_sort(),
+            self._skip_val if self._skip_val > 0 else None,
+            self._limit_val if self._limit_val > 0 else None,
+            self._build_projection(),
+        )
+
+    async def _find(
+        self,
+        filter_doc: dict,
+        sort_doc: Optional[dict],
+        skip: Optional[int],
+        limit: Optional[int],
+        projection: Optional[dict],
+    ) -> List[T]:
+        """Run a find with already-built query documents (shared with PreparedQuery)."""
         from . import _engine
 
         collection_name = self._model.__collection_name__()
-        filter_doc = self._build_filter()
-        sort_doc = self._build_sort()
 
-        # Use optimized path: Rust creates Python objects directly
-        results = await _engine.find_as_documents(
-            collection_name,
-            self._model,
-            filter_doc,
-            sort=sort_doc,
-            skip=self._skip_val if self._skip_val > 0 else None,
-            limit=self._limit_val if self._limit_val > 0 else None,
-        )
+        if self._fetch_links_val and self._fetch_links_strategy == "lookup":
+            return await self._to_list_lookup(filter_doc, sort_doc, skip, limit, projection)
+
+        async def query() -> List[T]:
+            # Use optimized path: Rust creates Python objects directly
+            return await _engine.find_as_documents(
+                collection_name,
+                self._model,
+                filter_doc,
+                sort=sort_doc,
+                skip=skip,
+                limit=limit,
+                projection=projection,
+            )
+
+        cache = self._model._query_cache
+        if cache is not None:
+            key = cache.key("find", filter_doc, sort_doc, skip, limit, projection)
+            results = await cache.documents(key, query)
+        else:
+            results = await query()
+
+        # Inside unit_of_work(), return the scope's instance of each document
+        uow = current_unit_of_work()
+        if uow is not None:
+            results = uow.register_all(results)
 
         # Fetch linked documents if requested (Week 4-5 optimization: batched!)
         if self._fetch_links_val and results:
@@ -312,42 +832,78 @@ class QueryBuilder(Generic[T]):
 
         return results
 
+    async def _to_list_lookup(
+        self,
+        filter_doc: dict,
+        sort_doc: Optional[dict],
+        skip: Optional[int],
+        limit: Optional[int],
+        projection: Optional[dict],
+    ) -> List[T]:
+        """Run the query as one aggregation that joins linked documents with $lookup."""
+        from . import _engine
+
+        pipeline: List[dict] = [{"$match": filter_doc}]
+        if sort_doc:
+            pipeline.append({"$sort": sort_doc})
+        if skip:
+            pipeline.append({"$skip": skip})
+        if limit:
+            pipeline.append({"$limit": limit})
+        if projection:
+            pipeline.append({"$project": projection})
+        pipeline += _lookup_stages(self._model, self._fetch_links_depth_val)
+
+        rows = await _engine.aggregate(self._model.__collection_name__(), pipeline)
+
+        uow = current_unit_of_work()
+        return [
+            _hydrate_lookup(self._model, row, self._fetch_links_depth_val, uow, partial=bool(projection))
+            for row in rows
+        ]
+
     @staticmethod
     async def _batch_fetch_links_for_list(docs: List, depth: int = 1) -> None:
         """
         Batch fetch links for a list of documents (Week 4-5 optimization).
 
         This is a massive performance improvement over fetching links individually.
-        Instead of N queries for N documents, it makes 1 query per unique target type.
+        Instead of N queries for N documents, it makes 1 query per unique target
+        type and 1 query per BackLink field, and sends them all concurrently.
 
         Performance:
-            - Before: 100 docs × 3 links = 300 queries
-            - After: 100 docs × 3 links = 3 queries
-            - Improvement: 100x reduction in queries!
+            - Before: 200 posts with author + tags Links and a comments BackLink
+              = 600 sequential queries
+            - After: 3 concurrent queries (one round trip of latency)
 
         Args:
             docs: List of documents to fetch links for
             depth: How deep to fetch nested links
 
         Algorithm:
-            1. Collect all link refs from ALL documents, grouped by target type
-            2. Batch fetch: one $in query per target type
+            1. Collect all link refs from ALL documents, grouped by target type,
+               and all BackLink fields, grouped by (target type, link field)
+            2. Batch fetch concurrently: one $in query per target type and one
+               {link_field: {"$in": parent_ids}} query per BackLink field
             3. Distribute fetched docs back to each document's links
+            4. Fetch the next level for all fetched documents together
         """
         if not docs or depth <= 0:
             return
 
+        import asyncio
         from collections import defaultdict
-        from .links import Link, BackLink, get_link_fields
+        from .links import Link, BackLink
 
         # Phase 1: Collect ALL link references from ALL documents
         # Group by target class for efficient batching
         # Format: {target_cls: {ref_id: [(doc, field_name), ...]}}
         all_link_refs = defaultdict(lambda: defaultdict(list))
-        all_backlink_fields = []
+        # Format: {(target_cls, link_field): [(parent_doc, field_name), ...]}
+        all_backlink_refs = defaultdict(list)
 
         for doc in docs:
-            link_fields = get_link_fields(type(doc))
+            link_fields = type(doc)._plan.link_fields
 
             for field_name, (link_type, target_type) in link_fields.items():
                 if link_type == "Link":
@@ -375,24 +931,38 @@ class QueryBuilder(Generic[T]):
                         all_link_refs[target_cls][ref_id].append((doc, field_name))
 
                 elif link_type == "BackLink":
-                    # BackLinks handled separately (can't batch as easily)
-                    all_backlink_fields.append((doc, field_name, target_type))
+                    if doc._id is None:
+                        continue
 
-        # Phase 2: Batch fetch all links per target type
-        for target_cls, refs_map in all_link_refs.items():
-            if not refs_map:
-                continue
+                    # Get the BackLink configuration
+                    default = doc._field_defaults.get(field_name)
+                    link_field = getattr(default, "_link_field", None)
+                    if not link_field:
+                        continue
+
+                    target_cls = doc._resolve_document_class(target_type)
+                    if target_cls is None:
+                        continue
 
-            # Extract unique IDs for batch query
+                    all_backlink_refs[(target_cls, link_field)].append((doc, field_name))
+
+        async def fetch_links(target_cls: Type, refs_map: Dict[Any, List]) -> List:
             ref_ids = list(refs_map.keys())
 
+            # Documents already loaded in the unit_of_work() scope skip the query
+            linked_docs = []
+            uow = current_unit_of_work()
+            if uow is not None:
+                linked_docs, ref_ids = uow.split(target_cls, ref_ids)
+
             # Single batch query: fetch ALL documents for this type
-            linked_docs = await target_cls.find({"_id": {"$in": ref_ids}}).to_list()
+            if ref_ids:
+                linked_docs += await target_cls.find({"_id": {"$in": ref_ids}}).to_list()
 
             # Create ID -> document mapping for O(1) lookup
-            docs_by_id = {str(doc._id): doc for doc in linked_docs}
+            docs_by_id = {str(linked._id): linked for linked in linked_docs}
 
-            # Phase 3: Distribute fetched docs back to all documents that need them
+            # Distribute fetched docs back to all documents that need them
             for ref_id, doc_field_pairs in refs_map.items():
                 linked_doc = docs_by_id.get(str(ref_id))
                 if linked_doc is None:
@@ -400,16 +970,185 @@ class QueryBuilder(Generic[T]):
 
                 # Update ALL documents that have this link
                 for doc, field_name in doc_field_pairs:
-                    link = Link(linked_doc, document_class=target_cls)
-                    doc._data[field_name] = link
+                    doc._data[field_name] = Link(linked_doc, document_class=target_cls)
+
+            return linked_docs
+
+        async def fetch_backlinks(target_cls: Type, link_field: str, parents: List) -> List:
+            parent_ids = list({str(doc._id) for doc, _ in parents})
+
+            # Single batch query: all documents linking to any of the parents
+            linked_docs = await target_cls.find({link_field: {"$in": parent_ids}}).to_list()
+
+            # Group the linking documents by the parent they reference
+            docs_by_parent = defaultdict(list)
+            for linked in linked_docs:
+                ref = linked._data.get(link_field)
+                if isinstance(ref, Link):
+                    ref = ref._ref
+                docs_by_parent[str(ref)].append(linked)
+
+            for doc, field_name in parents:
+                backlink = BackLink(document_class=target_cls, link_field=link_field)
+                backlink._documents = docs_by_parent.get(str(doc._id), [])
+                doc._data[field_name] = backlink
+
+            return linked_docs
+
+        # Phase 2: Batch fetch all Links and BackLinks concurrently
+        fetched = await asyncio.gather(
+            *(fetch_links(target_cls, refs_map) for target_cls, refs_map in all_link_refs.items()),
+            *(
+                fetch_backlinks(target_cls, link_field, parents)
+                for (target_cls, link_field), parents in all_backlink_refs.items()
+            ),
+        )
+
+        # Recursively fetch nested links (depth - 1), batched across all targets
+        if depth > 1:
+            next_level = list({id(linked): linked for batch in fetched for linked in batch}.values())
+            await QueryBuilder._batch_fetch_links_for_list(next_level, depth=depth - 1)
+
+    async def batches(self, batch_size: int = 1000) -> AsyncIterator[List[T]]:
+        """
+        Stream matching documents in batches from a server-side cursor.
+
+        Unlike to_list(), only one batch is held in memory at a time, so this
+        is the way to walk large result sets. The next batch is fetched from
+        MongoDB while the current one is being processed.
+
+        Args:
+            batch_size: Maximum number of documents per batch
+
+        Yields:
+            Lists of document instances
+
+        Example:
+            >>> async for batch in User.find(User.active == True).batches(500):
+            ...     await export_rows(batch)
+        """
+        from . import _engine
 
-            # Recursively fetch nested links (depth - 1)
-            if depth > 1 and linked_docs:
-                await QueryBuilder._batch_fetch_links_for_list(linked_docs, depth=depth - 1)
+        collection_name = self._model.__collection_name__()
+        filter_doc = self._build_filter()
+        sort_doc = self._build_sort()
+
+        async for batch in _engine.iter_document_batches(
+            collection_name,
+            self._model,
+            filter_doc,
+            sort=sort_doc,
+            skip=self._skip_val if self._skip_val > 0 else None,
+            limit=self._limit_val if self._limit_val > 0 else None,
+            batch_size=batch_size,
+            projection=self._build_projection(),
+        ):
+            if self._fetch_links_val:
+                await self._batch_fetch_links_for_list(batch, depth=self._fetch_links_depth_val)
+            yield batch
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        """Yield documents one at a time from batches()."""
+        async for batch in self.batches():
+            for doc in batch:
+                yield doc
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        """
+        Iterate over matching documents without loading them all at once.
+
+        Example:
+            >>> async for user in User.find(User.active == True):
+            ...     print(user.name)
+        """
+        return self._iterate()
+
+    async def paginate(self, page_size: int) -> Page[T]:
+        """
+        Fetch one page of results using keyset pagination.
+
+        Combine with after() to continue from a previous page's token.
+        The sort spec gets an ``_id`` tiebreaker so pages never overlap or
+        skip documents, even when sort values repeat.
+
+        Sort fields missing from an inclusion projection are added to it,
+        since the token is built from the last document's sort values.
+
+        Args:
+            page_size: Maximum number of documents on the page
+
+        Returns:
+            Page with the documents and a continuation token (None on the
+            last page)
+
+        Raises:
+            ValueError: If the last document of the page has a null (or
+                projected away) sort value
+
+        Example:
+            >>> query = Order.find(Order.status == "open").sort("-created_at")
+            >>> page = await query.paginate(100)
+            >>> while page.has_next:
+            ...     page = await query.after(page.next_token).paginate(100)
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be greater than 0")
+        if self._skip_val:
+            raise ValueError("paginate() cannot be combined with skip()")
+
+        sort_spec = self._keyset_sort()
+        # Fetch one extra document to know whether another page exists
+        query = self._clone(_sort=sort_spec, _limit=page_size + 1)
+        projection = self._projection
+        if projection and any(value for field, value in projection.items() if field != "_id"):
+            query = query._clone(_projection={**{field: 1 for field, _ in sort_spec}, **projection})
+        docs = await query.to_list()
+
+        next_token = None
+        if len(docs) > page_size:
+            docs = docs[:page_size]
+            last = docs[-1]
+            values = tuple(
+                last._id if field == "_id" else _get_path(last._data, field)
+                for field, _ in sort_spec
+            )
+            _check_keyset_values(sort_spec, values)
+            next_token = _encode_page_token(sort_spec, values)
+
+        return Page(docs, next_token)
+
+    async def to_columns(self, *fields: Union["FieldProxy", str]) -> Dict[str, "Column"]:
+        """
+        Execute the query and return the given fields as typed columns.
+
+        Results are decoded by the Rust backend straight from BSON into one
+        buffer per field, skipping Document construction entirely. Columns
+        are NumPy arrays when NumPy is installed (array.array / list
+        otherwise), with a mask marking missing or null values.
+
+        Args:
+            *fields: Field names or FieldProxy objects (dotted paths allowed)
 
-        # Handle BackLinks (can't batch these, use original method)
-        for doc, field_name, target_type in all_backlink_fields:
-            await doc._fetch_backlink_field(field_name, target_type, depth)
+        Returns:
+            Dict of field name to Column(kind, values, mask)
+
+        Example:
+            >>> cols = await Trade.find(Trade.day == today).to_columns(Trade.price, Trade.qty)
+            >>> vwap = (cols["price"].values * cols["qty"].values).sum() / cols["qty"].values.sum()
+        """
+        from . import _engine
+        from .columns import build_columns
+
+        names = _column_field_names(fields)
+        raw = await _engine.find_columns(
+            self._model.__collection_name__(),
+            names,
+            filter=self._build_filter(),
+            sort=self._build_sort(),
+            skip=self._skip_val if self._skip_val > 0 else None,
+            limit=self._limit_val if self._limit_val > 0 else None,
+        )
+        return build_columns(raw)
 
     async def first(self) -> Optional[T]:
         """
@@ -428,27 +1167,63 @@ class QueryBuilder(Generic[T]):
         """Alias for first()."""
         return await self.first()
 
-    async def count(self) -> int:
+    async def count(
+        self,
+        limit: Optional[int] = None,
+        hint: Union[str, Dict[str, Any], None] = None,
+        max_time_ms: Optional[int] = None,
+    ) -> int:
         """
         Count matching documents.
 
+        Counting visits every matching index entry; pass limit when only
+        "at least N" matters, so the server stops early.
+
+        Args:
+            limit: Stop counting after this many matches
+            hint: Index to use (index name or key spec dict)
+            max_time_ms: Server-side time limit in milliseconds
+
         Returns:
-            Number of matching documents
+            Number of matching documents (at most limit)
 
         Example:
             >>> count = await User.find(User.active == True).count()
+            >>> many = await User.find(User.country == "US").count(limit=1000) == 1000
         """
+        return await self._count(self._build_filter(), limit=limit, hint=hint, max_time_ms=max_time_ms)
+
+    async def _count(
+        self,
+        filter_doc: dict,
+        limit: Optional[int] = None,
+        hint: Union[str, Dict[str, Any], None] = None,
+        max_time_ms: Optional[int] = None,
+    ) -> int:
+        """Count with an already-built filter (shared with PreparedQuery)."""
         from . import _engine
 
         collection_name = self._model.__collection_name__()
-        filter_doc = self._build_filter()
 
-        return await _engine.count(collection_name, filter_doc)
+        async def query() -> int:
+            return await _engine.count(
+                collection_name, filter_doc, limit=limit, hint=hint, max_time_ms=max_time_ms
+            )
+
+        cache = self._model._query_cache
+        if cache is not None:
+            key = cache.key("count", filter_doc, limit=limit)
+            return await cache.value(key, query)
+
+        return await query()
 
     async def exists(self) -> bool:
         """
         Check if any documents match the query.
 
+        Runs a find for a single _id (limit 1, _id-only projection), so the
+        server stops at the first match instead of counting all of them.
+
         Returns:
             True if at least one document matches
 
@@ -456,8 +1231,22 @@ class QueryBuilder(Generic[T]):
             >>> if await User.find(User.email == email).exists():
             ...     raise ValueError("Email already taken")
         """
-        count = await self.limit(1).count()
-        return count > 0
+        from . import _engine
+
+        collection_name = self._model.__collection_name__()
+        filter_doc = self._build_filter()
+
+        async def query() -> bool:
+            found = await _engine.find_with_options(
+                collection_name, filter_doc, limit=1, projection={"_id": 1}
+            )
+            return bool(found)
+
+        cache = self._model._query_cache
+        if cache is not None:
+            return await cache.value(cache.key("exists", filter_doc), query)
+
+        return await query()
 
     async def delete(self) -> int:
         """
@@ -742,6 +1531,64 @@ class QueryBuilder(Generic[T]):
         field_name = field.name if hasattr(field, "name") else str(field)
         return await self._aggregate_single("$min", field_name)
 
+    async def stats(
+        self,
+        *fields: Union["FieldProxy", str],
+        ops: Sequence[str] = DEFAULT_STATS_OPS,
+        group_by: Union["FieldProxy", str, None] = None,
+        percentile_sample: Optional[int] = None,
+    ) -> Union[Stats, List[Stats]]:
+        """
+        Compute several aggregates of several fields in one aggregation.
+
+        Unlike calling avg(), sum(), min() and max() one by one, everything
+        is compiled into a single $group stage: one round trip and one scan.
+
+        Args:
+            *fields: Field names or FieldProxy objects to aggregate
+            ops: Any of "count", "sum", "avg", "min", "max" and percentiles
+                such as "p50", "p95" or "p99.9"
+            group_by: Field to group by; returns one Stats per group
+            percentile_sample: On servers without $percentile (before
+                MongoDB 7.0), estimate percentiles from a random sample of
+                at most this many values per group
+
+        Returns:
+            Stats for all matching documents, or a list of Stats sorted by
+            group key when group_by is given
+
+        Raises:
+            ValueError: If an op is unknown
+            RuntimeError: If percentiles are requested from a server without
+                $percentile and percentile_sample is not given
+
+        Example:
+            >>> stats = await Order.find(Order.status == "paid").stats(Order.total)
+            >>> print(stats.count, stats["total"].avg, stats["total"].p95)
+            >>>
+            >>> per_region = await Order.find().stats(Order.total, ops=("count", "sum"), group_by=Order.region)
+            >>> totals = {s.group: s["total"].sum for s in per_region}
+        """
+        from . import _engine
+
+        names = [field.name if hasattr(field, "name") else str(field) for field in fields]
+        group_name = None
+        if group_by is not None:
+            group_name = group_by.name if hasattr(group_by, "name") else str(group_by)
+        plan = StatsPlan(names, ops, group_name, percentile_sample)
+
+        collection_name = self._model.__collection_name__()
+        filter_doc = self._build_filter()
+        match = [{"$match": filter_doc}] if filter_doc else []
+
+        async def aggregate(stages: List[dict]) -> List[dict]:
+            return await _engine.aggregate(collection_name, match + stages)
+
+        results = await plan.run(aggregate)
+        if group_name is not None:
+            return results
+        return results[0] if results else plan.empty()
+
     async def _aggregate_single(self, operator: str, field_name: str) -> Optional[Any]:
         """
         Internal helper for single-value aggregation operations.
@@ -775,32 +1622,200 @@ class QueryBuilder(Generic[T]):
         )
 
 
+class PreparedQuery(Generic[T]):
+    """
+    Query template compiled by QueryBuilder.prepare().
+
+    Executions bind keyword arguments to the Param placeholders of the
+    filter. Every placeholder must be bound, and unknown names are
+    rejected. Results go through the same path as QueryBuilder (query
+    cache, unit of work, fetch_links).
+
+    Attributes:
+        params: Names of the placeholders in the filter
+
+    Example:
+        >>> recent = (
+        ...     Order.find(Order.customer_id == Param("customer"), Order.total > Param("min_total"))
+        ...     .sort("-created_at")
+        ...     .limit(20)
+        ...     .prepare()
+        ... )
+        >>> orders = await recent.to_list(customer=cid, min_total=100)
+    """
+
+    def __init__(self, query: QueryBuilder[T]) -> None:
+        self._query = query
+        self._filter = query._build_filter()
+        self._sort = query._build_sort()
+        self._skip = query._skip_val if query._skip_val > 0 else None
+        self._limit = query._limit_val if query._limit_val > 0 else None
+        self._projection = query._build_projection()
+
+        names: set = set()
+        self._binder = _compile_binder(self._filter, names)
+        self.params: FrozenSet[str] = frozenset(names)
+
+    def bind(self, **params: Any) -> dict:
+        """
+        Build the filter document for one execution.
+
+        Raises:
+            ValueError: If a placeholder is not bound or an unknown name is given
+        """
+        if params.keys() != self.params:
+            missing = self.params - params.keys()
+            if missing:
+                raise ValueError(f"Missing query parameters: {sorted(missing)}")
+            raise ValueError(f"Unknown query parameters: {sorted(params.keys() - self.params)}")
+        if self._binder is None:
+            return self._filter
+        return self._binder(params)
+
+    async def to_list(self, **params: Any) -> List[T]:
+        """Execute with the given parameter values and return all matching documents."""
+        return await self._query._find(self.bind(**params), self._sort, self._skip, self._limit, self._projection)
+
+    async def first(self, **params: Any) -> Optional[T]:
+        """Execute with the given parameter values and return the first matching document."""
+        results = await self._query._find(self.bind(**params), self._sort, self._skip, 1, self._projection)
+        return results[0] if results else None
+
+    async def count(self, **params: Any) -> int:
+        """Count the documents matching the filter with the given parameter values."""
+        return await self._query._count(self.bind(**params))
+
+    def __repr__(self) -> str:
+        return f"PreparedQuery({self._query._model.__name__}, filter={self._filter}, params={sorted(self.params)})"
+
+
 class AggregationBuilder(Generic[T]):
     """
     Builder for MongoDB aggregation pipelines.
 
+    Results are plain dicts, or instances of projection_model (a Document
+    or EmbeddedDocument class). to_list() collects everything; batches()
+    and ``async for`` stream from a server-side cursor so only one batch
+    is held in memory at a time.
+
     Example:
         >>> results = await User.aggregate([
         ...     {"$match": {"active": True}},
         ...     {"$group": {"_id": "$department", "count": {"$sum": 1}}},
         ... ]).to_list()
+        >>>
+        >>> async for row in Order.aggregate([{"$unwind": "$items"}], allow_disk_use=True):
+        ...     handle(row)
     """
 
-    def __init__(self, model: Type[T], pipeline: List[dict]) -> None:
+    def __init__(
+        self,
+        model: Type[T],
+        pipeline: List[dict],
+        projection_model: Optional[type] = None,
+        batch_size: Optional[int] = None,
+        allow_disk_use: Optional[bool] = None,
+    ) -> None:
         self._model = model
         self._pipeline = pipeline
+        self._projection_model = projection_model
+        self._batch_size = batch_size
+        self._allow_disk_use = allow_disk_use
 
-    async def to_list(self) -> List[dict]:
+    async def to_list(self) -> List[Any]:
         """
         Execute aggregation and return results.
 
         Returns:
-            List of aggregation result documents
+            List of aggregation result documents (projection_model
+            instances if one was given)
+        """
+        from . import _engine
+
+        if self._projection_model is not None:
+            results: List[Any] = []
+            async for batch in self.batches():
+                results.extend(batch)
+            return results
+
+        collection_name = self._model.__collection_name__()
+        return await _engine.aggregate(
+            collection_name,
+            self._pipeline,
+            batch_size=self._batch_size,
+            allow_disk_use=self._allow_disk_use,
+        )
+
+    async def batches(self, batch_size: Optional[int] = None) -> AsyncIterator[List[Any]]:
+        """
+        Stream aggregation results in batches from a server-side cursor.
+
+        Args:
+            batch_size: Maximum results per batch (default: the builder's
+                batch_size, else 1000)
+
+        Yields:
+            Lists of result dicts (or projection_model instances)
+
+        Example:
+            >>> async for batch in Order.aggregate(pipeline).batches(500):
+            ...     await export_rows(batch)
+        """
+        from . import _engine
+        from .embedded import EmbeddedDocument
+
+        model = self._projection_model
+        embedded = isinstance(model, type) and issubclass(model, EmbeddedDocument)
+
+        async for batch in _engine.iter_aggregate_batches(
+            self._model.__collection_name__(),
+            self._pipeline,
+            document_class=None if embedded else model,
+            batch_size=batch_size or self._batch_size or 1000,
+            allow_disk_use=self._allow_disk_use,
+        ):
+            if embedded:
+                batch = [model.from_dict(row) for row in batch]
+            yield batch
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        """Yield results one at a time from batches()."""
+        async for batch in self.batches():
+            for row in batch:
+                yield row
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        """
+        Iterate over aggregation results without loading them all at once.
+
+        Example:
+            >>> async for row in User.aggregate(pipeline):
+            ...     print(row["_id"], row["count"])
+        """
+        return self._iterate()
+
+    async def to_columns(self, *fields: str) -> Dict[str, "Column"]:
+        """
+        Execute aggregation and return the given output fields as typed columns.
+
+        Args:
+            *fields: Output field names (dotted paths allowed)
+
+        Returns:
+            Dict of field name to Column(kind, values, mask)
+
+        Example:
+            >>> cols = await Order.aggregate([
+            ...     {"$group": {"_id": "$region", "total": {"$sum": "$amount"}}},
+            ... ]).to_columns("_id", "total")
         """
         from . import _engine
+        from .columns import build_columns
 
+        names = _column_field_names(fields)
         collection_name = self._model.__collection_name__()
-        return await _engine.aggregate(collection_name, self._pipeline)
+        raw = await _engine.aggregate_columns(collection_name, self._pipeline, names)
+        return build_columns(raw)
 
     def __repr__(self) -> str:
         return f"AggregationBuilder({self._model.__name__}, pipeline={self._pipeline})"
@@ -3,8 +3,11 @@ Copy-on-Write state tracker for efficient change tracking.
 
 Replaces expensive copy.deepcopy() with field-level change tracking.
 Expected performance: 10x faster than deepcopy, 50% memory reduction.
+
+In-place changes of nested values (see tracking.py) are recorded as
+path-level operations next to the field-level changes.
 """
-from typing import Any, Dict, Set, Optional
+from typing import Any, Dict, List, Set, Optional, Tuple
 
 
 class StateTracker:
@@ -28,7 +31,7 @@ class StateTracker:
         >>> tracker.get_changes()  # {"name": "Bob"}
     """
 
-    __slots__ = ('_data', '_original', '_changed_fields')
+    __slots__ = ('_data', '_original', '_changed_fields', '_paths')
 
     def __init__(self, data: Dict[str, Any]):
         """
@@ -40,6 +43,7 @@ class StateTracker:
         self._data = data
         self._original: Dict[str, Any] = {}  # Only stores changed fields' original values
         self._changed_fields: Set[str] = set()
+        self._paths: Dict[str, Tuple[str, Any]] = {}  # Nested path -> (kind, argument)
 
     def track_change(self, key: str, old_value: Any) -> None:
         """
@@ -63,6 +67,64 @@ class StateTracker:
             self._original[key] = old_value
             self._changed_fields.add(key)
 
+    def track_path(self, path: str, kind: str, arg: Any = None) -> None:
+        """
+        Record an in-place change of a nested value.
+
+        Operations on the same path are merged (pushes, pulls and increments
+        accumulate); combinations MongoDB cannot apply in one update turn
+        into a "set" of the path. Changes below a reassigned field or a
+        set/unset ancestor path are already covered and are dropped.
+
+        Args:
+            path: Dotted path, starting with the field name
+            kind: "set", "unset", "push", "pull", "pop" or "inc"
+            arg: Items for push/pull, direction for pop, delta for inc
+
+        Example:
+            >>> tracker = StateTracker({"tags": ["a"]})
+            >>> tracker.track_path("tags", "push", ["b"])
+            >>> tracker.track_path("tags", "push", ["c"])
+            >>> tracker.get_path_ops()  # {"tags": ("push", ["b", "c"])}
+        """
+        if path.partition(".")[0] in self._changed_fields:
+            return
+        paths = self._paths
+        parent = path
+        while "." in parent:
+            parent = parent.rpartition(".")[0]
+            if parent in paths and paths[parent][0] in ("set", "unset"):
+                return
+
+        current = paths.get(path)
+        if current is None or kind in ("set", "unset"):
+            if kind in ("set", "unset"):
+                prefix = path + "."
+                for other in [other for other in paths if other.startswith(prefix)]:
+                    del paths[other]
+            paths[path] = (kind, arg)
+        elif current[0] == "set":
+            pass  # The whole value is written anyway
+        elif current[0] == kind and kind in ("push", "pull"):
+            paths[path] = (kind, current[1] + arg)
+        elif current[0] == kind == "inc":
+            paths[path] = (kind, current[1] + arg)
+        else:
+            paths[path] = ("set", None)
+
+    def get_path_ops(self) -> Dict[str, Tuple[str, Any]]:
+        """
+        Get the recorded nested changes of fields that were not reassigned.
+
+        Returns:
+            Dict mapping dotted paths to (kind, argument)
+        """
+        changed = self._changed_fields
+        return {
+            path: op for path, op in self._paths.items()
+            if path.partition(".")[0] not in changed
+        }
+
     def is_modified(self) -> bool:
         """
         Check if any field has been modified.
@@ -76,7 +138,7 @@ class StateTracker:
             >>> tracker.track_change("name", "Alice")
             >>> tracker.is_modified()  # True
         """
-        return len(self._changed_fields) > 0
+        return len(self._changed_fields) > 0 or len(self._paths) > 0
 
     def has_changed(self, field: str) -> bool:
         """
@@ -94,12 +156,16 @@ class StateTracker:
             >>> tracker.has_changed("name")  # True
             >>> tracker.has_changed("age")   # False
         """
-        return field in self._changed_fields
+        if field in self._changed_fields:
+            return True
+        return any(path.partition(".")[0] == field for path in self._paths)
 
     def get_changes(self) -> Dict[str, Any]:
         """
         Get all changed fields with their new values.
 
+        Includes fields whose nested values were changed in place.
+
         Returns:
             Dict mapping field names to their current (new) values
 
@@ -109,8 +175,36 @@ class StateTracker:
             >>> tracker._data["name"] = "Bob"
             >>> tracker.get_changes()  # {"name": "Bob"}
         """
+        fields = self._changed_fields.union(path.partition(".")[0] for path in self._paths)
+        return {key: self._data[key] for key in fields if key in self._data}
+
+    def get_assigned(self) -> Dict[str, Any]:
+        """
+        Get the fields that were reassigned, with their new values.
+
+        Unlike get_changes(), fields only changed in place are left out.
+
+        Returns:
+            Dict mapping field names to their current (new) values
+        """
         return {key: self._data[key] for key in self._changed_fields if key in self._data}
 
+    def get_removed(self) -> List[str]:
+        """
+        Get changed fields that are no longer present in the data.
+
+        Returns:
+            Names of fields removed since tracking started
+
+        Example:
+            >>> data = {"name": "Alice", "nickname": "Al"}
+            >>> tracker = StateTracker(data)
+            >>> tracker.track_change("nickname", "Al")
+            >>> del data["nickname"]
+            >>> tracker.get_removed()  # ["nickname"]
+        """
+        return [key for key in self._changed_fields if key not in self._data]
+
     def get_original_value(self, field: str) -> Any:
         """
         Get the original value of a changed field.
@@ -154,7 +248,8 @@ class StateTracker:
         """
         Rollback all changes to original values.
 
-        Restores all changed fields to their original values.
+        Restores all changed fields to their original values. In-place
+        changes of nested values cannot be restored; they are forgotten.
 
         Example:
             >>> data = {"name": "Alice"}
@@ -169,6 +264,7 @@ class StateTracker:
                 self._data[key] = self._original[key]
         self._changed_fields.clear()
         self._original.clear()
+        self._paths.clear()
 
     def reset(self) -> None:
         """
@@ -185,6 +281,7 @@ class StateTracker:
         """
         self._changed_fields.clear()
         self._original.clear()
+        self._paths.clear()
 
     def get_all_original_data(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,252 @@
+"""
+Multi-aggregate statistics in a single round trip.
+
+``QueryBuilder.stats()`` compiles a count plus any number of per-field
+aggregates into one ``$group`` stage, so a dashboard needing the count,
+sum, average, extremes and percentiles of several fields costs one
+aggregation instead of one pipeline per value.
+
+Supported ops:
+    - count: number of matching documents (per group)
+    - sum, avg, min, max: per-field accumulators
+    - pNN: percentiles such as p50, p95 or p99.9
+
+Percentiles use the ``$percentile`` accumulator (MongoDB 7.0+, approximate
+method). Servers without it raise an error unless ``percentile_sample=N``
+is given: percentiles are then computed client-side (nearest rank) from a
+random sample of at most N values per group (``$topN`` on ``$rand``,
+MongoDB 5.2+), so memory stays bounded on large collections. Whether the
+server has ``$percentile`` is remembered for the rest of the process.
+
+Example:
+    >>> stats = await Order.find(Order.status == "paid").stats(Order.total)
+    >>> stats.count, stats["total"].avg, stats["total"].p95
+    >>>
+    >>> by_region = await Order.find().stats("total", ops=("count", "sum"), group_by="region")
+    >>> {s.group: s["total"].sum for s in by_region}
+    >>>
+    >>> # MongoDB < 7.0: estimate percentiles from 10,000 sampled values
+    >>> stats = await Order.find().stats(Order.total, ops=("p50", "p99"), percentile_sample=10_000)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_STATS_OPS = ("count", "sum", "avg", "min", "max", "p50", "p95")
+
+_ACCUMULATORS = {"sum": "$sum", "avg": "$avg", "min": "$min", "max": "$max"}
+
+_PERCENTILE_OP = re.compile(r"p(\d+(?:\.\d+)?)")
+
+# Whether the server accepts $percentile (None = not tried yet)
+_native_percentile: Optional[bool] = None
+
+# Random sort key added to each document for sampled percentiles
+_SAMPLE_KEY = "_stats_rand"
+
+_NO_PERCENTILE = (
+    "The server does not support $percentile (MongoDB 7.0+); pass "
+    "percentile_sample=N to estimate percentiles from N sampled values per group"
+)
+
+
+@dataclass
+class FieldStats:
+    """
+    Aggregates of one field.
+
+    Percentiles are available as attributes named after their op
+    (``stats.p95``) and in the percentiles dict.
+
+    Attributes:
+        sum: Sum of the values
+        avg: Average of the values
+        min: Smallest value
+        max: Largest value
+        percentiles: Percentile op name -> value
+    """
+
+    sum: Any = None
+    avg: Optional[float] = None
+    min: Any = None
+    max: Any = None
+    percentiles: Dict[str, Optional[float]] = field(default_factory=dict)
+
+    def __getattr__(self, name: str) -> Any:
+        percentiles = self.__dict__.get("percentiles", {})
+        if name in percentiles:
+            return percentiles[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+
+@dataclass
+class Stats:
+    """
+    Result of QueryBuilder.stats() for all matching documents or one group.
+
+    Attributes:
+        count: Number of documents (None unless "count" was requested)
+        fields: Field name -> FieldStats
+        group: Value of the group_by field (None without group_by)
+    """
+
+    count: Optional[int] = None
+    fields: Dict[str, FieldStats] = field(default_factory=dict)
+    group: Any = None
+
+    def __getitem__(self, field_name: str) -> FieldStats:
+        return self.fields[field_name]
+
+
+def _parse_ops(ops: Sequence[str]) -> Tuple[bool, List[str], List[Tuple[str, float]]]:
+    """Split ops into (count requested, accumulator ops, [(percentile op, fraction)])."""
+    count = False
+    accumulators: List[str] = []
+    percentiles: List[Tuple[str, float]] = []
+    for op in ops:
+        if op == "count":
+            count = True
+        elif op in _ACCUMULATORS:
+            accumulators.append(op)
+        else:
+            match = _PERCENTILE_OP.fullmatch(op)
+            rank = float(match.group(1)) if match else 0.0
+            if not 0 < rank <= 100:
+                raise ValueError(
+                    f"Unknown stats op {op!r}: expected count, sum, avg, min, max or a percentile like p95"
+                )
+            percentiles.append((op, rank / 100))
+    return count, accumulators, percentiles
+
+
+def _nearest_rank(values: List[Any], fraction: float) -> Optional[float]:
+    """Percentile of already-sorted values (nearest-rank method)."""
+    if not values:
+        return None
+    return values[max(math.ceil(fraction * len(values)) - 1, 0)]
+
+
+class StatsPlan:
+    """
+    One stats() request compiled into a $group stage.
+
+    Args:
+        fields: Field paths to aggregate
+        ops: Ops to compute (see module docstring)
+        group_by: Field path to group by, or None for one overall result
+        percentile_sample: Values sampled per group for client-side
+            percentiles when the server has no $percentile (None = fail)
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        ops: Sequence[str],
+        group_by: Optional[str] = None,
+        percentile_sample: Optional[int] = None,
+    ) -> None:
+        if percentile_sample is not None and percentile_sample < 1:
+            raise ValueError("percentile_sample must be at least 1")
+        self.fields = list(fields)
+        self.group_by = group_by
+        self.percentile_sample = percentile_sample
+        self.count, self.accumulators, self.percentiles = _parse_ops(ops)
+
+    def pipeline(self, native_percentile: bool) -> List[dict]:
+        """Build the $group (and $sort by group key) stages."""
+        sampled = bool(self.percentiles) and not native_percentile
+        if sampled and self.percentile_sample is None:
+            raise RuntimeError(_NO_PERCENTILE)
+
+        group: Dict[str, Any] = {"_id": f"${self.group_by}" if self.group_by else None}
+        if self.count:
+            group["count"] = {"$sum": 1}
+        for index, name in enumerate(self.fields):
+            for op in self.accumulators:
+                group[f"f{index}_{op}"] = {_ACCUMULATORS[op]: f"${name}"}
+            if self.percentiles and native_percentile:
+                group[f"f{index}_pct"] = {
+                    "$percentile": {
+                        "input": f"${name}",
+                        "p": [fraction for _, fraction in self.percentiles],
+                        "method": "approximate",
+                    }
+                }
+            elif sampled:
+                group[f"f{index}_sample"] = {
+                    "$topN": {
+                        "n": self.percentile_sample,
+                        "sortBy": {_SAMPLE_KEY: 1},
+                        "output": f"${name}",
+                    }
+                }
+
+        stages: List[dict] = [{"$group": group}]
+        if sampled:
+            stages.insert(0, {"$set": {_SAMPLE_KEY: {"$rand": {}}}})
+        if self.group_by:
+            stages.append({"$sort": {"_id": 1}})
+        return stages
+
+    def parse(self, row: Dict[str, Any], native_percentile: bool) -> Stats:
+        """Turn one $group output row into a Stats result."""
+        result = Stats(count=row.get("count", 0) if self.count else None, group=row.get("_id"))
+        for index, name in enumerate(self.fields):
+            stats = FieldStats()
+            for op in self.accumulators:
+                setattr(stats, op, row.get(f"f{index}_{op}"))
+
+            if self.percentiles and native_percentile:
+                values = row.get(f"f{index}_pct") or [None] * len(self.percentiles)
+                stats.percentiles = {op: value for (op, _), value in zip(self.percentiles, values)}
+            elif self.percentiles:
+                numbers = sorted(
+                    value for value in row.get(f"f{index}_sample", [])
+                    if isinstance(value, (int, float)) and not isinstance(value, bool)
+                )
+                stats.percentiles = {
+                    op: _nearest_rank(numbers, fraction) for op, fraction in self.percentiles
+                }
+
+            result.fields[name] = stats
+        return result
+
+    def empty(self) -> Stats:
+        """Result for a query without matches (no $group row)."""
+        return self.parse({}, native_percentile=False)
+
+    async def run(self, aggregate: Callable[[List[dict]], Awaitable[List[Dict[str, Any]]]]) -> List[Stats]:
+        """
+        Run the plan with aggregate(stages), which prepends the query's $match.
+
+        Falls back to sampled client-side percentiles if the server rejects
+        $percentile and percentile_sample is set.
+
+        Raises:
+            RuntimeError: If the server has no $percentile and
+                percentile_sample is not set
+        """
+        global _native_percentile
+
+        native = bool(self.percentiles) and _native_percentile is not False
+        try:
+            rows = await aggregate(self.pipeline(native))
+        except Exception as exc:
+            if not native or "percentile" not in str(exc).lower():
+                raise
+            _native_percentile = native = False
+            if self.percentile_sample is None:
+                raise RuntimeError(_NO_PERCENTILE) from exc
+            rows = await aggregate(self.pipeline(native))
+        else:
+            if native:
+                _native_percentile = True
+
+        return [self.parse(row, native) for row in rows]
+
+
+__all__ = ["Stats", "FieldStats", "StatsPlan", "DEFAULT_STATS_OPS"]
@@ -0,0 +1,352 @@
+"""
+In-place change tracking for nested values of state-managed documents.
+
+With ``Settings.use_state_management = True``, list, dict and
+EmbeddedDocument field values are wrapped on first access so that
+in-place mutations are recorded as path-level operations on the
+document's StateTracker. ``save()`` then sends them instead of
+rewriting the whole field:
+
+    - ``doc.tags.append(x)`` / ``extend``       -> $push with $each
+    - ``doc.tags.remove(x)`` (last occurrence)  -> $pull
+    - ``doc.tags.pop()`` / ``pop(0)``           -> $pop
+    - ``doc.meta["k"] = v``                     -> $set "meta.k"
+    - ``del doc.meta["k"]``                     -> $unset "meta.k"
+    - ``doc.address.city = "Paris"``            -> $set "address.city"
+    - ``doc.stats.views += 1`` (ints)           -> $inc "stats.views"
+
+Any other list mutation (insert, sort, item assignment, ...) and
+conflicting operations on the same path fall back to a $set of the whole
+list. Values nested inside lists are tracked too, but a change to them
+rewrites the enclosing list (array positions are not stable across
+pushes and pulls).
+
+Copies (``copy.copy``, ``copy.deepcopy``, pickling, ``list(...)``) of
+tracked containers are plain lists and dicts.
+
+Example:
+    >>> post = await Post.get(post_id)
+    >>> post.tags.append("python")
+    >>> post.meta["views"] += 1
+    >>> await post.save()
+    >>> # {"$push": {"tags": {"$each": ["python"]}}, "$inc": {"meta.views": 1}}
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .embedded import EmbeddedDocument
+
+# One recorded operation: (kind, argument) - kinds are set, unset, push, pull, pop and inc
+PathOp = Tuple[str, Any]
+
+_SCALARS = (str, int, float, bool, type(None))
+
+_MISSING = object()
+
+
+def _child_path(path: str, key: Any, whole: bool) -> Tuple[str, bool]:
+    """Path and whole flag of a value stored under key in a container at path."""
+    if whole:
+        return path, True
+    if not isinstance(key, str) or "." in key or key.startswith("$"):
+        # Not addressable with dot notation: changes rewrite the container
+        return path, True
+    return f"{path}.{key}", False
+
+
+def _int_delta(old: Any, new: Any) -> Optional[int]:
+    """new - old if both are plain ints (bool excluded), else None."""
+    if type(old) is int and type(new) is int:
+        return new - old
+    return None
+
+
+def track(value: Any, owner: Any, path: str, whole: bool = False) -> Any:
+    """
+    Return value prepared for in-place change tracking under path.
+
+    Plain lists and dicts are copied once into TrackedList / TrackedDict;
+    EmbeddedDocuments are tracked in place. Other values are returned
+    unchanged.
+
+    Args:
+        value: Field value (or a value nested inside one)
+        owner: Document that records the changes
+        path: Dotted path of the value in the stored document
+        whole: Changes rewrite path as a whole (value sits inside a list)
+    """
+    cls = type(value)
+    if cls is list:
+        return TrackedList(value, owner, path, whole)
+    if cls is dict:
+        return TrackedDict(value, owner, path, whole)
+    if cls is TrackedList or cls is TrackedDict:
+        if value._owner is owner and value._path == path and value._whole == whole:
+            return value
+        # Moved from another document or path: track a copy
+        return cls(value, owner, path, whole)
+    if isinstance(value, EmbeddedDocument):
+        attrs = value.__dict__
+        tracking = attrs.get("_tracking")
+        if tracking is None or tracking[0] is not owner or tracking[1] != path or tracking[2] != whole:
+            attrs["_tracking"] = (owner, path, whole)
+            for name in value._fields:
+                if name in attrs:
+                    attrs[name] = track(attrs[name], owner, *_child_path(path, name, whole))
+    return value
+
+
+def track_attribute(embedded: EmbeddedDocument, name: str, value: Any, delete: bool = False) -> Any:
+    """
+    Record an assignment to (or deletion of) an attribute of a tracked EmbeddedDocument.
+
+    Returns:
+        The value to store (tracked if it is a container)
+    """
+    owner, path, whole = embedded.__dict__["_tracking"]
+    child, child_whole = _child_path(path, name, whole)
+    if child_whole:
+        owner._track_path(path, "set")
+        return None if delete else track(value, owner, child, True)
+    if delete:
+        owner._track_path(child, "unset")
+        return None
+    delta = _int_delta(embedded.__dict__.get(name, _MISSING), value)
+    if delta is not None:
+        owner._track_path(child, "inc", delta)
+    else:
+        owner._track_path(child, "set")
+    return track(value, owner, child)
+
+
+class TrackedList(list):
+    """
+    List field value that records in-place mutations on its document.
+
+    Built by track(); behaves like a plain list otherwise.
+    """
+
+    __slots__ = ("_owner", "_path", "_whole")
+
+    def __init__(self, items: Iterable[Any], owner: Any, path: str, whole: bool = False) -> None:
+        self._owner = owner
+        self._path = path
+        self._whole = whole
+        super().__init__(track(item, owner, path, True) for item in items)
+
+    def _note(self, kind: str, arg: Any = None) -> None:
+        if self._whole:
+            kind, arg = "set", None
+        self._owner._track_path(self._path, kind, arg)
+
+    def _rewritten(self) -> None:
+        self._owner._track_path(self._path, "set")
+
+    def append(self, item: Any) -> None:
+        item = track(item, self._owner, self._path, True)
+        super().append(item)
+        self._note("push", [item])
+
+    def extend(self, items: Iterable[Any]) -> None:
+        items = [track(item, self._owner, self._path, True) for item in items]
+        if items:
+            super().extend(items)
+            self._note("push", items)
+
+    def __iadd__(self, items: Iterable[Any]) -> "TrackedList":
+        self.extend(items)
+        return self
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        if isinstance(item, _SCALARS) and item not in self:
+            # $pull removes every equal element: only exact when none is left
+            self._note("pull", [item])
+        else:
+            self._rewritten()
+
+    def pop(self, index: int = -1) -> Any:
+        size = len(self)
+        item = super().pop(index)
+        if index in (-1, size - 1):
+            self._note("pop", 1)
+        elif index in (0, -size):
+            self._note("pop", -1)
+        else:
+            self._rewritten()
+        return item
+
+    def insert(self, index: int, item: Any) -> None:
+        super().insert(index, track(item, self._owner, self._path, True))
+        self._rewritten()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            value = [track(item, self._owner, self._path, True) for item in value]
+        else:
+            value = track(value, self._owner, self._path, True)
+        super().__setitem__(index, value)
+        self._rewritten()
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._rewritten()
+
+    def __imul__(self, count: int) -> "TrackedList":
+        super().__imul__(count)
+        self._rewritten()
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._rewritten()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._rewritten()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._rewritten()
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Copies and pickles are plain, detached lists
+        return list, (list(self),)
+
+    def __copy__(self) -> list:
+        return list(self)
+
+
+class TrackedDict(dict):
+    """
+    Dict field value that records in-place mutations on its document.
+
+    Built by track(); behaves like a plain dict otherwise.
+    """
+
+    __slots__ = ("_owner", "_path", "_whole")
+
+    def __init__(self, items: Dict[Any, Any], owner: Any, path: str, whole: bool = False) -> None:
+        self._owner = owner
+        self._path = path
+        self._whole = whole
+        super().__init__(
+            (key, track(value, owner, *_child_path(path, key, whole))) for key, value in items.items()
+        )
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        path, whole = _child_path(self._path, key, self._whole)
+        old = self.get(key, _MISSING)
+        super().__setitem__(key, track(value, self._owner, path, whole))
+        if whole:
+            self._owner._track_path(self._path, "set")
+            return
+        delta = _int_delta(old, value)
+        if delta is not None:
+            self._owner._track_path(path, "inc", delta)
+        else:
+            self._owner._track_path(path, "set")
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._removed(key)
+
+    def _removed(self, key: Any) -> None:
+        path, whole = _child_path(self._path, key, self._whole)
+        if whole:
+            self._owner._track_path(self._path, "set")
+        else:
+            self._owner._track_path(path, "unset")
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        value = super().pop(key)
+        self._removed(key)
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        key, value = super().popitem()
+        self._removed(key)
+        return key, value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Any) -> "TrackedDict":
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._owner._track_path(self._path, "set")
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Copies and pickles are plain, detached dicts
+        return dict, (dict(self),)
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+
+def _resolve(data: Dict[str, Any], path: str) -> Any:
+    """Current value at a dotted path of document data (_MISSING if absent)."""
+    value: Any = data
+    for key in path.split("."):
+        if isinstance(value, dict):
+            value = value.get(key, _MISSING)
+        elif isinstance(value, EmbeddedDocument):
+            value = value.__dict__.get(key, _MISSING)
+        else:
+            return _MISSING
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+
+def build_path_update(
+    ops: Dict[str, PathOp],
+    data: Dict[str, Any],
+    dump: Callable[[Any], Any],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compile recorded path operations into MongoDB update operators.
+
+    Args:
+        ops: Path -> (kind, argument) as recorded by StateTracker.track_path()
+        data: Document data the paths point into
+        dump: Converts a value to its stored form
+
+    Returns:
+        Update operator -> {path: value}
+    """
+    update: Dict[str, Dict[str, Any]] = {}
+    for path, (kind, arg) in ops.items():
+        if kind == "set":
+            value = _resolve(data, path)
+            if value is _MISSING:
+                update.setdefault("$unset", {})[path] = ""
+            else:
+                update.setdefault("$set", {})[path] = dump(value)
+        elif kind == "unset":
+            update.setdefault("$unset", {})[path] = ""
+        elif kind == "push":
+            update.setdefault("$push", {})[path] = {"$each": [dump(item) for item in arg]}
+        elif kind == "pull":
+            update.setdefault("$pull", {})[path] = {"$in": arg}
+        elif kind == "pop":
+            update.setdefault("$pop", {})[path] = arg
+        elif kind == "inc":
+            update.setdefault("$inc", {})[path] = arg
+    return update
+
+
+__all__ = ["TrackedList", "TrackedDict", "track", "track_attribute", "build_path_update"]
@@ -7,6 +7,7 @@ for efficient type validation.
 
 import inspect
 import typing
+import weakref
 from typing import Any, Dict, List, Optional, Type, Tuple, get_type_hints, get_origin, get_args, Annotated
 from datetime import datetime, date
 from decimal import Decimal
@@ -318,3 +319,138 @@ def extract_schema(cls: Type) -> Dict[str, Dict[str, Any]]:
     _schema_cache[class_id] = schema
 
     return schema
+
+
+# Embedded layout cache (see extract_embedded_layout). Keyed by the class itself:
+# an id() could be reused by a new class once the old one is collected.
+_embedded_layout_cache: "weakref.WeakKeyDictionary[Type, Dict[str, Tuple[Any, bool, Dict[str, Any]]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _embedded_field_spec(field_type: Type) -> Optional[Tuple[Type, bool]]:
+    """Return (EmbeddedDocument class, many) for an embedded field type, else None.
+
+    Recognizes EmbeddedDocument, Optional[EmbeddedDocument], List[EmbeddedDocument]
+    and Optional[List[EmbeddedDocument]].
+    """
+    if is_annotated_type(field_type):
+        field_type, _ = unwrap_annotated_type(field_type)
+
+    origin = get_origin(field_type)
+    args = get_args(field_type)
+
+    if origin is typing.Union and len(args) == 2 and type(None) in args:
+        inner_type = args[0] if args[1] is type(None) else args[1]
+        return _embedded_field_spec(inner_type)
+
+    if origin is list or origin is List:
+        if args and is_embedded_document_type(args[0]):
+            return args[0], True
+        return None
+
+    if is_embedded_document_type(field_type):
+        return field_type, False
+
+    return None
+
+
+def extract_embedded_layout(cls: Type) -> Dict[str, Tuple[Any, bool, Dict[str, Any]]]:
+    """Extract the embedded-document layout of a Document or EmbeddedDocument class.
+
+    The layout is handed to the Rust backend so EmbeddedDocument instances
+    are built while BSON is decoded, instead of walking type hints for every
+    loaded document. Layouts are cached per-class.
+
+    Args:
+        cls: Document or EmbeddedDocument subclass
+
+    Returns:
+        {field_name: (loader, many, nested_layout), ...} where loader builds
+        the EmbeddedDocument from a dict, many is True for List[...] fields
+        and nested_layout is the layout of the embedded class itself.
+
+    Example:
+        class Address(EmbeddedDocument):
+            city: str
+
+        class User(Document):
+            address: Address
+            previous: List[Address] = []
+
+        extract_embedded_layout(User) == {
+            'address': (Address._loader, False, {}),
+            'previous': (Address._loader, True, {}),
+        }
+    """
+    return _extract_embedded_layout(cls, ())
+
+
+def _extract_embedded_layout(cls: Type, parents: Tuple[Type, ...]) -> Dict[str, Tuple[Any, bool, Dict[str, Any]]]:
+    cached = _embedded_layout_cache.get(cls)
+    if cached is not None:
+        return cached
+
+    if not EMBEDDED_DOCUMENT_AVAILABLE:
+        return {}
+
+    try:
+        hints = get_type_hints(cls, include_extras=True)
+    except Exception:
+        # Fallback to collected annotations if get_type_hints fails
+        hints = dict(getattr(cls, '_fields', None) or getattr(cls, '__annotations__', {}))
+
+    layout = {}
+    for field_name, field_type in hints.items():
+        # Skip private fields
+        if field_name.startswith('_'):
+            continue
+
+        spec = _embedded_field_spec(field_type)
+        if spec is None:
+            continue
+
+        embedded_cls, many = spec
+        if embedded_cls in parents or embedded_cls is cls:
+            # Self-referencing embedded documents: from_dict resolves the rest
+            layout[field_name] = (embedded_cls.from_dict, many, {})
+        else:
+            nested = _extract_embedded_layout(embedded_cls, parents + (cls,))
+            layout[field_name] = (embedded_cls._loader, many, nested)
+
+    # Layouts computed inside a cycle depend on the path taken; only cache top-level results
+    if not parents:
+        _embedded_layout_cache[cls] = layout
+
+    return layout
+
+
+def apply_embedded_layout(data: Dict[str, Any], layout: Dict[str, Tuple[Any, bool, Dict[str, Any]]]) -> Dict[str, Any]:
+    """Replace embedded-document dicts in decoded data with instances (in place).
+
+    Python counterpart of the Rust-side decoding, used when documents are
+    decoded without the Rust backend.
+
+    Args:
+        data: Decoded document dict
+        layout: Layout from extract_embedded_layout()
+
+    Returns:
+        The same dict
+    """
+    for field_name, (loader, many, nested) in layout.items():
+        value = data.get(field_name)
+        if many:
+            if isinstance(value, list):
+                data[field_name] = [_load_embedded(item, loader, nested) for item in value]
+        elif isinstance(value, dict):
+            data[field_name] = _load_embedded(value, loader, nested)
+    return data
+
+
+def _load_embedded(value: Any, loader: Any, nested: Dict[str, Any]) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if nested:
+        apply_embedded_layout(value, nested)
+    return loader(value)
@@ -0,0 +1,277 @@
+"""
+Unit-of-work scope with an identity map.
+
+Inside ``async with unit_of_work():`` every document loaded from MongoDB
+is registered in a per-scope identity map keyed by (collection, _id):
+
+- Loading a document that is already in the map returns the existing
+  instance. ``Document.get``, ``find_one({"_id": ...})``, ``Link.fetch``
+  and ``fetch_all_links`` look in the map first and skip the query.
+- Other queries still run, but documents already in the map are returned
+  as the in-scope instance instead of a second copy.
+- Assigning a field of a mapped document marks it dirty. When the scope
+  exits without an exception, dirty documents are saved with one
+  ``bulk_write`` per collection (see ``UnitOfWork.flush``).
+
+Documents loaded through a projection are never registered, and
+``batches()`` / ``async for`` streams are not mapped (keeping every
+streamed document alive would defeat streaming).
+
+The scope follows ``contextvars``, so tasks started inside it (e.g. with
+``asyncio.gather``) share the same identity map.
+
+Example:
+    >>> from data_bridge import unit_of_work
+    >>>
+    >>> async with unit_of_work():
+    ...     post = await Post.get(post_id)
+    ...     author = await post.author.fetch()        # query
+    ...     same = await User.get(author.id)          # no query
+    ...     assert same is author
+    ...     author.post_count += 1                    # marked dirty
+    ... # author is saved here
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from .actions import EventType, run_after_event, run_before_event, run_validate_on_save
+from .fields import id_from_filter
+
+if TYPE_CHECKING:
+    from .document import Document
+
+T = TypeVar("T", bound="Document")
+
+IdentityKey = Tuple[str, str]
+
+_current: ContextVar[Optional["UnitOfWork"]] = ContextVar("data_bridge_unit_of_work", default=None)
+
+
+def current_unit_of_work() -> Optional["UnitOfWork"]:
+    """Return the active unit of work, or None outside of a scope."""
+    return _current.get()
+
+
+def _identity(doc: "Document") -> IdentityKey:
+    return doc.__collection_name__(), str(doc._id)
+
+
+class UnitOfWork:
+    """
+    Identity map and dirty-document tracker for one ``unit_of_work()`` scope.
+
+    Attributes:
+        flush_on_exit: Save dirty documents when the scope exits cleanly
+    """
+
+    def __init__(self, flush_on_exit: bool = True) -> None:
+        self.flush_on_exit = flush_on_exit
+        self._identity_map: Dict[IdentityKey, "Document"] = {}
+        self._dirty: Dict[IdentityKey, "Document"] = {}
+        self._token: Any = None
+
+    # ----- identity map -----
+
+    def get(self, document_class: Type[T], doc_id: Any) -> Optional[T]:
+        """Return the mapped instance of document_class with doc_id, if loaded in this scope."""
+        doc = self._identity_map.get((document_class.__collection_name__(), str(doc_id)))
+        if doc is not None and isinstance(doc, document_class):
+            return doc
+        return None
+
+    def lookup(self, document_class: Type[T], filter_doc: Any) -> Optional[T]:
+        """Return the mapped instance for a plain {"_id": value} filter, if any."""
+        doc_id = id_from_filter(filter_doc)
+        if doc_id is None:
+            return None
+        return self.get(document_class, doc_id)
+
+    def split(self, document_class: Type[T], doc_ids: Iterable[Any]) -> Tuple[List[T], List[Any]]:
+        """
+        Split ids into mapped instances and ids that still need a query.
+
+        Returns:
+            (mapped documents, missing ids)
+        """
+        found: List[T] = []
+        missing: List[Any] = []
+        for doc_id in doc_ids:
+            doc = self.get(document_class, doc_id)
+            if doc is not None:
+                found.append(doc)
+            else:
+                missing.append(doc_id)
+        return found, missing
+
+    def register(self, doc: T) -> T:
+        """
+        Register a loaded document and return the scope's instance for it.
+
+        If the same document was already loaded in this scope, the existing
+        instance is returned (and keeps its in-scope changes).
+        """
+        if doc._id is None:
+            return doc
+        key = _identity(doc)
+        existing = self._identity_map.get(key)
+        if existing is not None:
+            return existing  # type: ignore[return-value]
+        if doc._loaded_fields is not None:
+            # Partially loaded: never the canonical instance
+            return doc
+        self._identity_map[key] = doc
+        doc._unit_of_work = self
+        return doc
+
+    def register_all(self, docs: List[T]) -> List[T]:
+        """Register query results, replacing documents already in the map."""
+        return [self.register(doc) for doc in docs]
+
+    def discard(self, doc: "Document") -> None:
+        """Forget a document (e.g. after it was deleted)."""
+        if doc._id is None:
+            return
+        key = _identity(doc)
+        if self._identity_map.get(key) is doc:
+            del self._identity_map[key]
+            doc._unit_of_work = None
+        self._dirty.pop(key, None)
+
+    # ----- dirty tracking -----
+
+    def mark_dirty(self, doc: "Document") -> None:
+        """Mark a mapped document as changed (called by Document.__setattr__)."""
+        self._dirty[_identity(doc)] = doc
+
+    def mark_clean(self, doc: "Document") -> None:
+        """Forget pending changes of a document that was saved directly."""
+        self._dirty.pop(_identity(doc), None)
+
+    @property
+    def dirty(self) -> List["Document"]:
+        """Mapped documents with unsaved field assignments."""
+        return [doc for doc in self._dirty.values() if _has_changes(doc)]
+
+    async def flush(self) -> int:
+        """
+        Save all dirty documents, with one bulk write per collection.
+
+        Validation and Save event hooks run for each document, as they do
+        for ``save()``. Every collection is written even if another one
+        fails; documents that could not be written stay dirty and keep
+        their revision.
+
+        Returns:
+            Number of documents written
+
+        Raises:
+            RevisionConflictError: If documents were modified by another
+                process (Settings.use_revision)
+            BulkSaveError: If other writes failed (conflicting documents
+                are reported here too)
+        """
+        from .document import _raise_save_failures, _write_updates
+
+        by_collection: Dict[str, List["Document"]] = {}
+        for doc in self.dirty:
+            by_collection.setdefault(doc.__collection_name__(), []).append(doc)
+        # Assignments that changed nothing have nothing to flush
+        self._dirty = {_identity(doc): doc for docs in by_collection.values() for doc in docs}
+
+        written = 0
+        failed: List[Tuple["Document", str]] = []
+        scopes: List[str] = []
+        for collection, docs in by_collection.items():
+            updates = []
+            for doc in docs:
+                await run_validate_on_save(doc)
+                await run_before_event(doc, EventType.SAVE)
+                update, filter_doc = doc._prepare_save()
+                if update:
+                    updates.append((doc, filter_doc, update))
+
+            try:
+                failures = await _write_updates(collection, updates, ordered=False)
+            except Exception as exc:
+                # Nothing in this collection is confirmed; go on with the others
+                failures = dict.fromkeys(range(len(updates)), str(exc))
+            if failures:
+                failed.extend((updates[index][0], message) for index, message in sorted(failures.items()))
+                scopes.append(f"'{collection}'")
+
+            rejected = {id(updates[index][0]) for index in failures}
+            for doc in docs:
+                if id(doc) in rejected:
+                    continue
+                if doc._use_state_management:
+                    doc._save_state()
+                self.mark_clean(doc)
+                await run_after_event(doc, EventType.SAVE)
+                written += 1
+
+        _raise_save_failures(", ".join(scopes), failed)
+        return written
+
+    # ----- scope -----
+
+    def close(self) -> None:
+        """Detach all mapped documents from this scope."""
+        for doc in self._identity_map.values():
+            doc._unit_of_work = None
+        self._identity_map.clear()
+        self._dirty.clear()
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._token = _current.set(self)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        _current.reset(self._token)
+        try:
+            if exc_type is None and self.flush_on_exit:
+                await self.flush()
+        finally:
+            self.close()
+
+    def __len__(self) -> int:
+        return len(self._identity_map)
+
+    def __contains__(self, doc: object) -> bool:
+        doc_id = getattr(doc, "_id", None)
+        return doc_id is not None and self._identity_map.get(_identity(doc)) is doc  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return f"UnitOfWork(documents={len(self._identity_map)}, dirty={len(self._dirty)})"
+
+
+def _has_changes(doc: "Document") -> bool:
+    # State-managed documents know whether an assignment changed anything
+    if doc._use_state_management:
+        return doc.is_changed
+    return True
+
+
+def unit_of_work(flush_on_exit: bool = True) -> UnitOfWork:
+    """
+    Open a unit-of-work scope.
+
+    Args:
+        flush_on_exit: Save dirty documents when the scope exits without
+            an exception (default True). Call ``flush()`` to save earlier.
+
+    Returns:
+        Async context manager yielding the UnitOfWork
+
+    Example:
+        >>> async with unit_of_work() as uow:
+        ...     user = await User.get(user_id)
+        ...     user.name = "Alice"
+        ...     await uow.flush()
+    """
+    return UnitOfWork(flush_on_exit)
+
+
+__all__ = ["UnitOfWork", "unit_of_work", "current_unit_of_work"]
@@ -0,0 +1,142 @@
+"""
+Profile per-document class-metadata overhead: ModelPlan vs. per-call discovery.
+
+Before ModelPlan, every _from_db / to_dict / save / link-batch call re-walked
+the class MRO for Link fields, to_dict() type-checked every value and
+__init__ re-inspected _field_defaults for default factories. This script
+times those per-document steps both ways. No database is needed.
+
+Usage:
+    python -m tests.mongo.benchmarks.profile_model_plan
+"""
+
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from data_bridge import Document, EmbeddedDocument, Field, Link
+from data_bridge.links import get_link_fields
+
+ITERATIONS = 20_000
+
+
+class PlanTeam(Document):
+    name: str
+
+    class Settings:
+        name = "profile_plan_teams"
+
+
+class PlanAddress(EmbeddedDocument):
+    city: str
+    zip: str
+
+
+class PlanUser(Document):
+    name: str
+    email: str
+    age: int = 0
+    score: float = 0.0
+    active: bool = True
+    created_at: Optional[datetime] = None
+    nickname: Optional[str] = None
+    tags: List[str] = Field(default_factory=list)
+    address: Optional[PlanAddress] = None
+    team: Link[PlanTeam] = None
+
+    class Settings:
+        name = "profile_plan_users"
+
+
+def time_sync(fn: Callable[[], Any], iterations: int = ITERATIONS) -> float:
+    """Time a sync function, returning microseconds per call."""
+    for _ in range(100):
+        fn()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    return (elapsed / iterations) * 1_000_000
+
+
+# ---------------------------------------------------------------------------
+# Per-call metadata discovery (the code paths ModelPlan replaced)
+# ---------------------------------------------------------------------------
+
+def discover_link_fields(doc: Document) -> Dict[str, Any]:
+    return get_link_fields(type(doc))
+
+
+def discover_defaults(cls: type, data: Dict[str, Any]) -> None:
+    for field_name in cls._fields:
+        if field_name not in data and field_name in cls._field_defaults:
+            default = cls._field_defaults[field_name]
+            if hasattr(default, "default_factory") and default.default_factory:
+                data[field_name] = default.default_factory()
+            elif hasattr(default, "default") and default.default is not ...:
+                data[field_name] = default.default
+            else:
+                data[field_name] = default
+
+
+def discover_to_dict(doc: Document) -> Dict[str, Any]:
+    result = {}
+    for key, value in doc._data.items():
+        if isinstance(value, Link):
+            result[key] = value.to_ref()
+        elif isinstance(value, EmbeddedDocument):
+            result[key] = value.to_dict()
+        elif isinstance(value, list):
+            result[key] = [
+                item.to_dict() if isinstance(item, EmbeddedDocument) else item
+                for item in value
+            ]
+        else:
+            result[key] = value
+    return result
+
+
+def main() -> None:
+    user = PlanUser(
+        name="Alice",
+        email="alice@example.com",
+        age=30,
+        created_at=datetime(2024, 1, 1),
+        address=PlanAddress(city="NYC", zip="10001"),
+    )
+    plan = PlanUser._plan
+    kwargs = {"name": "Bob", "email": "bob@example.com"}
+
+    rows = [
+        (
+            "link field lookup",
+            lambda: discover_link_fields(user),
+            lambda: type(user)._plan.link_fields,
+        ),
+        (
+            "apply field defaults",
+            lambda: discover_defaults(PlanUser, dict(kwargs)),
+            lambda: plan.apply_defaults(dict(kwargs)),
+        ),
+        (
+            "to_dict()",
+            lambda: discover_to_dict(user),
+            user.to_dict,
+        ),
+    ]
+
+    print("\n" + "=" * 70)
+    print("PER-DOCUMENT CLASS METADATA OVERHEAD (µs per call)")
+    print("=" * 70)
+    print(f"{'Step':<24} {'Per-call discovery':>20} {'ModelPlan':>12} {'Speedup':>10}")
+    print("-" * 70)
+    for label, before, after in rows:
+        before_us = time_sync(before)
+        after_us = time_sync(after)
+        print(f"{label:<24} {before_us:>20.2f} {after_us:>12.2f} {before_us / after_us:>9.1f}x")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
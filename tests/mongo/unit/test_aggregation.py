@@ -1,6 +1,6 @@
-"""Tests for QueryBuilder aggregation helpers (avg, sum, max, min)."""
+"""Tests for QueryBuilder aggregation helpers (avg, sum, max, min) and AggregationBuilder."""
 
-from data_bridge import Document
+from data_bridge import Document, EmbeddedDocument
 from data_bridge.test import test, expect
 from tests.base import MongoTestSuite
 
@@ -16,6 +16,12 @@ class AggProduct(Document):
         name = "test_aggregation_products"
 
 
+class CategoryTotal(EmbeddedDocument):
+    """Projection model for grouped aggregation output."""
+    category: str = ""
+    total: int = 0
+
+
 class TestAggregationHelpers(MongoTestSuite):
     """Test aggregation helper methods on QueryBuilder."""
 
@@ -128,6 +134,73 @@ class TestAggregationHelpers(MongoTestSuite):
         # Average: (1.50 + 2.00 + 3.50 + 5.00) / 4 = 3.00
         expect(abs(avg_price - 3.00) < 0.01).to_be_true()
 
+    @test(tags=["mongo", "aggregation"])
+    async def test_aggregate_to_columns(self):
+        """Test AggregationBuilder.to_columns() on grouped output."""
+        cols = await AggProduct.aggregate([
+            {"$group": {"_id": "$category", "total": {"$sum": "$quantity"}}},
+            {"$sort": {"_id": 1}},
+        ]).to_columns("_id", "total")
+
+        expect(list(cols["_id"].values)).to_equal(["dairy", "fruit"])
+        expect(cols["total"].kind).to_equal("int64")
+        expect([int(v) for v in cols["total"].values]).to_equal([80, 330])
+
+    @test(tags=["mongo", "aggregation"])
+    async def test_aggregate_streams_batches(self):
+        """Test batches() and async for stream aggregation results."""
+        pipeline = [{"$sort": {"price": 1}}, {"$project": {"_id": 0, "name": 1}}]
+
+        batches = [batch async for batch in AggProduct.aggregate(pipeline).batches(2)]
+        expect([len(batch) for batch in batches]).to_equal([2, 2, 1])
+
+        names = [row["name"] async for row in AggProduct.aggregate(pipeline, allow_disk_use=True)]
+        expect(names).to_equal(["Banana", "Apple", "Orange", "Milk", "Cheese"])
+
+    @test(tags=["mongo", "aggregation"])
+    async def test_aggregate_value_types(self):
+        """Test aggregation results keep UTC datetimes and Decimal values."""
+        from datetime import datetime, timezone
+        from decimal import Decimal
+
+        pipeline = [
+            {"$sort": {"price": 1}},
+            {"$limit": 1},
+            {"$project": {
+                "_id": 0,
+                "at": {"$toDate": 1714566600000},
+                "price": {"$toDecimal": "$price"},
+            }},
+        ]
+        expected_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+        rows = await AggProduct.aggregate(pipeline).to_list()
+        expect(rows[0]["at"]).to_equal(expected_at)
+        expect(isinstance(rows[0]["price"], Decimal)).to_be_true()
+        expect(rows[0]["price"]).to_equal(Decimal("0.75"))
+
+        streamed = [row async for row in AggProduct.aggregate(pipeline)]
+        expect(streamed[0]["at"]).to_equal(expected_at)
+        expect(isinstance(streamed[0]["price"], Decimal)).to_be_true()
+
+    @test(tags=["mongo", "aggregation"])
+    async def test_aggregate_projection_model(self):
+        """Test results are hydrated into a Document or EmbeddedDocument model."""
+        products = await AggProduct.aggregate(
+            [{"$match": {"category": "dairy"}}, {"$sort": {"price": 1}}],
+            projection_model=AggProduct,
+        ).to_list()
+        expect([type(p) for p in products]).to_equal([AggProduct, AggProduct])
+        expect(products[0].name).to_equal("Milk")
+        expect(products[0].id).not_.to_be_none()
+
+        totals = await AggProduct.aggregate([
+            {"$group": {"_id": "$category", "total": {"$sum": "$quantity"}}},
+            {"$project": {"_id": 0, "category": "$_id", "total": 1}},
+            {"$sort": {"category": 1}},
+        ], projection_model=CategoryTotal).to_list()
+        expect([(t.category, t.total) for t in totals]).to_equal([("dairy", 80), ("fruit", 330)])
+
 
 class TestAggregationHelpersUnit(MongoTestSuite):
     """Unit tests for aggregation helpers."""
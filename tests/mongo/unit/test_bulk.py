@@ -6,6 +6,8 @@ Tests that:
 2. validate parameter controls validation
 3. return_type parameter controls return format
 4. Mixed lists (dicts + Documents) work correctly
+5. chunk_size sends chunks with bounded in-flight batches
+6. insert_stream() batches async sources and dead-letters failed batches
 
 Migrated from pytest to data_bridge.test framework.
 """
@@ -267,6 +269,102 @@ class TestBulkCorrectness(MongoTestSuite):
         count = await BulkTestUser.find().count()
         expect(count).to_equal(100)
 
+    @test(tags=["mongo", "bulk", "chunked"])
+    async def test_chunked_insert_from_generator(self):
+        """CHUNKED: insert_many(chunk_size=...) should consume an iterable chunk by chunk."""
+        chunks = []
+
+        def rows():
+            for i in range(25):
+                yield {"name": f"User{i}", "email": f"user{i}@example.com", "age": 20 + i}
+
+        ids = await BulkTestUser.insert_many(
+            rows(), chunk_size=10, max_in_flight=2, on_chunk=chunks.append
+        )
+
+        expect(len(ids)).to_equal(25)
+        expect(len(set(ids))).to_equal(25)
+        chunks.sort(key=lambda chunk: chunk.index)
+        expect([(c.offset, c.count) for c in chunks]).to_equal([(0, 10), (10, 10), (20, 5)])
+        expect(all(c.ok for c in chunks)).to_be_true()
+        expect([doc_id for c in chunks for doc_id in c.inserted_ids]).to_equal(ids)
+
+        count = await BulkTestUser.find().count()
+        expect(count).to_equal(25)
+
+    @test(tags=["mongo", "bulk", "chunked"])
+    async def test_chunked_insert_reports_failed_chunk(self):
+        """CHUNKED: A failing chunk should raise BulkInsertError listing the inserted ids."""
+        from data_bridge import BulkInsertError
+
+        ids = await BulkTestUser.insert_many(
+            [BulkTestUser(name="Alice", email="alice@example.com", age=30)]
+        )
+        dicts = [
+            {"name": "Bob", "email": "bob@example.com", "age": 25},
+            {"_id": ids[0], "name": "Dup", "email": "dup@example.com", "age": 1},
+            {"name": "Carol", "email": "carol@example.com", "age": 40},
+        ]
+
+        error_caught = None
+        try:
+            await BulkTestUser.insert_many(dicts, chunk_size=1, max_in_flight=1, ordered=False)
+        except BulkInsertError as e:
+            error_caught = e
+
+        expect(error_caught).not_.to_be_none()
+        expect([c.index for c in error_caught.failed]).to_equal([1])
+        expect(len(error_caught.inserted_ids)).to_equal(2)
+
+        count = await BulkTestUser.find().count()
+        expect(count).to_equal(3)
+
+    @test(tags=["mongo", "bulk", "stream"])
+    async def test_insert_stream_batches(self):
+        """STREAM: insert_stream() should flush on batch size and on the end of the source."""
+        batches = []
+
+        async def events():
+            for i in range(25):
+                yield {"name": f"User{i}", "email": f"user{i}@example.com", "age": 20 + i}
+
+        count = await BulkTestUser.insert_stream(
+            events(), batch_size=10, max_pending=2, on_batch=batches.append
+        )
+
+        expect(count).to_equal(25)
+        expect(sorted(c.count for c in batches)).to_equal([5, 10, 10])
+
+        total = await BulkTestUser.find().count()
+        expect(total).to_equal(25)
+
+    @test(tags=["mongo", "bulk", "stream"])
+    async def test_insert_stream_dead_letters(self):
+        """STREAM: A failed batch should go to on_error and the stream should continue."""
+        ids = await BulkTestUser.insert_many(
+            [{"name": "Alice", "email": "alice@example.com", "age": 30}]
+        )
+        dead_letters = []
+
+        async def events():
+            yield BulkTestUser(name="Bob", email="bob@example.com", age=25)
+            yield {"_id": ids[0], "name": "Dup", "email": "dup@example.com", "age": 1}
+            yield {"name": "Carol", "email": "carol@example.com", "age": 40}
+
+        count = await BulkTestUser.insert_stream(
+            events(),
+            batch_size=1,
+            on_error=lambda chunk, docs: dead_letters.append((chunk.offset, docs)),
+        )
+
+        expect(count).to_equal(2)
+        expect(len(dead_letters)).to_equal(1)
+        expect(dead_letters[0][0]).to_equal(1)
+        expect(dead_letters[0][1][0]["name"]).to_equal("Dup")
+
+        total = await BulkTestUser.find().count()
+        expect(total).to_equal(3)
+
 
 # Run tests when executed directly
 if __name__ == "__main__":
@@ -7,9 +7,17 @@ Tests for:
 - Distinct queries
 - Find-one-and-modify operations
 - Basic save/delete/update
+- Batched saves (save_all)
+- Batched get() lookups (Settings.use_batch_loading)
+- Single-flight coalescing of identical reads
 
 Migrated from test_comprehensive.py and split for maintainability.
 """
+import asyncio
+import types
+from contextlib import contextmanager
+from typing import List, Optional
+
 from data_bridge import Document
 from data_bridge.test import test, expect
 from tests.base import MongoTestSuite
@@ -30,6 +38,17 @@ class CrudTestUser(Document):
         name = "test_crud_users"
 
 
+class TrackedUser(Document):
+    """User with revision tracking and state management."""
+    name: str
+    age: int = 0
+
+    class Settings:
+        name = "test_crud_tracked_users"
+        use_revision = True
+        use_state_management = True
+
+
 class Counter(Document):
     """Counter document for upsert tests."""
     name: str
@@ -59,6 +78,51 @@ class Employee(Document):
         name = "test_employees_crud"
 
 
+class BatchedUser(Document):
+    """User whose concurrent get() calls are batched."""
+    name: str
+    tags: list = []
+
+    class Settings:
+        name = "test_crud_batched_users"
+        use_batch_loading = True
+
+
+@contextmanager
+def count_rust_calls(name: str, gate: Optional[asyncio.Event] = None):
+    """
+    Count the calls of _rust.Document.<name> made by the engine.
+
+    With a gate, every call waits for it before querying, which keeps
+    the read in flight.
+
+    Yields:
+        List receiving the positional arguments of each call
+    """
+    from data_bridge import _engine
+
+    rust = _engine._rust
+    method = getattr(rust.Document, name)
+    calls: List[tuple] = []
+
+    async def counted(*args, **kwargs):
+        calls.append(args)
+        if gate is not None:
+            await gate.wait()
+        return await method(*args, **kwargs)
+
+    # Same class API, constructor included, with one method replaced
+    attrs = {attr: getattr(rust.Document, attr) for attr in dir(rust.Document) if not attr.startswith("__")}
+    attrs[name] = counted
+    attrs["__new__"] = lambda cls, *args, **kwargs: rust.Document(*args, **kwargs)
+    document = type("Document", (), attrs)
+    _engine._rust = types.SimpleNamespace(**{**vars(rust), "Document": document})
+    try:
+        yield calls
+    finally:
+        _engine._rust = rust
+
+
 # =====================
 # Basic CRUD Tests
 # =====================
@@ -155,6 +219,166 @@ class TestBasicCRUD(MongoTestSuite):
         total = await CrudTestUser.find().count()
         expect(total).to_equal(1)
 
+    @test(tags=["mongo", "crud"])
+    async def test_loaded_document_skips_defaults(self):
+        """Test loaded documents only hold stored fields (no __init__ defaults)."""
+        await CrudTestUser(name="Stored", age=7).save()
+        await CrudTestUser.find(CrudTestUser.name == "Stored").unset("status")
+
+        users = await CrudTestUser.find(CrudTestUser.name == "Stored").to_list()
+        expect(len(users)).to_equal(1)
+        expect(users[0].age).to_equal(7)
+        expect("status" in users[0]._data).to_be_false()
+        expect(users[0]._previous_changes).to_be_none()
+
+    @test(tags=["mongo", "crud"])
+    async def test_loaded_document_revision_and_state(self):
+        """Test loaded documents get _revision_id and change tracking."""
+        await TrackedUser.find().delete()
+        user = TrackedUser(name="Rev", age=1)
+        await user.save()
+
+        loaded = (await TrackedUser.find(TrackedUser.name == "Rev").to_list())[0]
+        expect(loaded._revision_id).to_equal(user._revision_id)
+        expect("revision_id" in loaded._data).to_be_false()
+        expect(loaded.is_changed).to_be_false()
+
+        loaded.age = 2
+        expect(loaded.is_changed).to_be_true()
+        expect(loaded.get_changes()).to_equal({"age": 2})
+
+        await TrackedUser.find().delete()
+
+    @test(tags=["mongo", "crud"])
+    async def test_save_all(self):
+        """Test save_all() inserts new documents, updates changed ones and reports conflicts."""
+        from data_bridge import RevisionConflictError
+
+        await TrackedUser.find().delete()
+        users = [TrackedUser(name=f"Batch{i}", age=i) for i in range(3)]
+        ids = await TrackedUser.save_all(users)
+        expect(ids).to_equal([user.id for user in users])
+        expect(await TrackedUser.count()).to_equal(3)
+
+        for user in users:
+            user.age += 10
+        users.append(TrackedUser(name="Batch3", age=3))
+        await TrackedUser.save_all(users)
+        expect(users[3].id).not_.to_be_none()
+        expect(users[0].is_changed).to_be_false()
+
+        found = await TrackedUser.get(users[0].id)
+        expect(found.age).to_equal(10)
+        expect(found._revision_id).to_equal(2)
+
+        # A copy saved in between makes users[1] stale
+        found = await TrackedUser.get(users[1].id)
+        found.name = "Changed"
+        await found.save()
+
+        for user in users:
+            user.age += 1
+        error_caught = False
+        try:
+            await TrackedUser.save_all(users)
+        except RevisionConflictError as e:
+            error_caught = True
+            expect(e.documents).to_equal([users[1]])
+        expect(error_caught).to_be_true()
+
+        # The other updates were applied
+        found = await TrackedUser.get(users[2].id)
+        expect(found.age).to_equal(13)
+
+        await TrackedUser.find().delete()
+
+    @test(tags=["mongo", "crud"])
+    async def test_save_all_reports_failed_updates(self):
+        """Test save_all() reports failed updates per document and keeps them unsaved."""
+        from data_bridge import BulkSaveError, _engine
+
+        class TaggedUser(Document):
+            name: str
+            tags: list = []
+
+            class Settings:
+                name = "test_crud_tagged_users"
+                use_revision = True
+                use_state_management = True
+
+        await TaggedUser.find().delete()
+        users = [TaggedUser(name="Ok", tags=["a"]), TaggedUser(name="Broken", tags=["a"])]
+        await TaggedUser.save_all(users)
+
+        # $push fails on a field that is no longer an array
+        await _engine.update_one("test_crud_tagged_users", {"_id": users[1].id}, {"$set": {"tags": "a"}})
+        for user in users:
+            user.tags.append("b")
+
+        error_caught = False
+        try:
+            await TaggedUser.save_all(users)
+        except BulkSaveError as e:
+            error_caught = True
+            expect(e.documents).to_equal([users[1]])
+            expect(len(e.errors)).to_equal(1)
+        expect(error_caught).to_be_true()
+
+        expect(users[0].is_changed).to_be_false()
+        expect(users[1].is_changed).to_be_true()
+        expect(users[1]._revision_id).to_equal(1)
+        found = await TaggedUser.get(users[0].id)
+        expect(found.tags).to_equal(["a", "b"])
+
+        # ordered=True raises at the first failure; nothing is marked saved
+        # and a retry expects the stored revisions
+        await TaggedUser.find().delete()
+        users = [TaggedUser(name="Broken", tags=["a"]), TaggedUser(name="Ok", tags=["a"])]
+        await TaggedUser.save_all(users)
+        await _engine.update_one("test_crud_tagged_users", {"_id": users[0].id}, {"$set": {"tags": "a"}})
+        for user in users:
+            user.tags.append("b")
+
+        error_caught = False
+        try:
+            await TaggedUser.save_all(users, ordered=True)
+        except Exception:
+            error_caught = True
+        expect(error_caught).to_be_true()
+        expect([user._revision_id for user in users]).to_equal([1, 1])
+        expect(users[1].is_changed).to_be_true()
+
+        await _engine.update_one("test_crud_tagged_users", {"_id": users[0].id}, {"$set": {"tags": ["a"]}})
+        await TaggedUser.save_all(users)
+        for user in users:
+            found = await TaggedUser.get(user.id)
+            expect(found.tags).to_equal(["a", "b"])
+            expect(found._revision_id).to_equal(2)
+
+        await TaggedUser.find().delete()
+
+    @test(tags=["unit", "crud"])
+    async def test_model_plan(self):
+        """Test the per-class model plan compiled by DocumentMeta."""
+        plan = CrudTestUser._plan
+
+        expect(list(plan.fields)).to_equal(["name", "email", "age", "status"])
+        expect(plan.defaults).to_equal((
+            ("email", None, ""),
+            ("age", None, 0),
+            ("status", None, "active"),
+        ))
+        expect("name" in plan.passthrough_fields).to_be_true()
+        expect(plan.links).to_equal(())
+        expect(TrackedUser._plan.use_revision).to_be_true()
+
+        error_caught = False
+        try:
+            plan.links = ("name",)
+        except AttributeError:
+            error_caught = True
+        expect(error_caught).to_be_true()
+
 
 # =====================
 # Upsert Tests
@@ -428,6 +652,192 @@ class TestFindAndModify(MongoTestSuite):
         expect(result.value).to_equal(100)
 
 
+class TestBatchLoading(MongoTestSuite):
+    """Tests for batching of concurrent get() calls."""
+
+    async def setup(self):
+        """Clean up test data."""
+        await BatchedUser.find().delete()
+
+    async def teardown(self):
+        """Clean up test data."""
+        await BatchedUser.find().delete()
+
+    @test(tags=["mongo", "crud", "batching"])
+    async def test_concurrent_gets_resolve_own_documents(self):
+        """Test each concurrent get() resolves to its own document or None."""
+        users = [BatchedUser(name=f"user{i}") for i in range(5)]
+        for user in users:
+            await user.save()
+
+        missing_id = "ffffffffffffffffffffffff"
+        results = await asyncio.gather(
+            *(BatchedUser.get(user.id) for user in users),
+            BatchedUser.get(missing_id),
+        )
+
+        expect([doc.name for doc in results[:5]]).to_equal([f"user{i}" for i in range(5)])
+        expect(results[5]).to_be_none()
+
+    @test(tags=["mongo", "crud", "batching"])
+    async def test_concurrent_gets_send_one_query(self):
+        """Test N concurrent get() calls are loaded with a single query."""
+        from data_bridge import _engine
+
+        users = [BatchedUser(name=f"user{i}") for i in range(5)]
+        for user in users:
+            await user.save()
+
+        queries = []
+        find_as_documents = _engine.find_as_documents
+
+        async def counting_find(collection, document_class, filter=None, *args, **kwargs):
+            queries.append(filter)
+            return await find_as_documents(collection, document_class, filter, *args, **kwargs)
+
+        _engine.find_as_documents = counting_find
+        try:
+            results = await asyncio.gather(*(BatchedUser.get(user.id) for user in users))
+        finally:
+            _engine.find_as_documents = find_as_documents
+
+        expect(len(queries)).to_equal(1)
+        expect(sorted(queries[0]["_id"]["$in"])).to_equal(sorted(user.id for user in users))
+        expect([doc.name for doc in results]).to_equal([f"user{i}" for i in range(5)])
+
+    @test(tags=["mongo", "crud", "batching"])
+    async def test_non_objectid_ids(self):
+        """Test batched lookups of int and non-hex string _ids are queried as given."""
+        from data_bridge import _engine
+
+        await _engine.insert_one("test_crud_batched_users", {"_id": 42, "name": "Int"})
+        await _engine.insert_one("test_crud_batched_users", {"_id": "alice", "name": "Str"})
+
+        by_int, by_str = await asyncio.gather(BatchedUser.get(42), BatchedUser.get("alice"))
+
+        expect(by_int).not_.to_be_none()
+        expect(by_int.name).to_equal("Int")
+        expect(by_int.id).to_equal("42")
+        expect(by_str).not_.to_be_none()
+        expect(by_str.name).to_equal("Str")
+
+    @test(tags=["mongo", "crud", "batching"])
+    async def test_duplicate_ids_get_separate_instances(self):
+        """Test callers asking for the same id do not share an instance."""
+        user = BatchedUser(name="Shared", tags=["a"])
+        await user.save()
+
+        first, second = await asyncio.gather(
+            BatchedUser.get(user.id),
+            BatchedUser.find_one({"_id": user.id}),
+        )
+
+        expect(first.id).to_equal(second.id)
+        expect(first is second).to_be_false()
+        first.tags.append("b")
+        expect(second.tags).to_equal(["a"])
+
+    @test(tags=["mongo", "crud", "batching"])
+    async def test_single_get_still_works(self):
+        """Test a lone get() is sent as a batch of one."""
+        user = BatchedUser(name="Solo")
+        await user.save()
+
+        found = await BatchedUser.get(user.id)
+        expect(found.name).to_equal("Solo")
+
+
+class TestSingleFlight(MongoTestSuite):
+    """Tests for single-flight coalescing of identical in-flight reads."""
+
+    async def setup(self):
+        """Clean up test data and enable single-flight reads."""
+        from data_bridge import _engine
+        await CrudTestUser.find().delete()
+        _engine.set_single_flight(True)
+
+    async def teardown(self):
+        """Disable single-flight reads and clean up test data."""
+        from data_bridge import _engine
+        _engine.set_single_flight(False)
+        await CrudTestUser.find().delete()
+
+    @test(tags=["mongo", "crud", "single_flight"])
+    async def test_identical_reads_get_own_copies(self):
+        """Test concurrent identical find_one calls send one query and return independent documents."""
+        await CrudTestUser(name="Hot", email="hot@example.com").save()
+
+        with count_rust_calls("find_as_documents") as calls:
+            docs = await asyncio.gather(
+                *(CrudTestUser.find_one(CrudTestUser.name == "Hot") for _ in range(5))
+            )
+
+        expect(len(calls)).to_equal(1)
+        expect(all(doc.email == "hot@example.com" for doc in docs)).to_be_true()
+        expect(len({id(doc) for doc in docs})).to_equal(5)
+
+        docs[0].email = "changed@example.com"
+        expect(docs[1].email).to_equal("hot@example.com")
+
+    @test(tags=["mongo", "crud", "single_flight"])
+    async def test_counts_match(self):
+        """Test concurrent identical and different counts return their own results."""
+        await CrudTestUser(name="A", status="active").save()
+        await CrudTestUser(name="B", status="inactive").save()
+
+        results = await asyncio.gather(
+            CrudTestUser.count(CrudTestUser.status == "active"),
+            CrudTestUser.count(CrudTestUser.status == "active"),
+            CrudTestUser.count(),
+        )
+
+        expect(results).to_equal([1, 1, 2])
+
+    @test(tags=["mongo", "crud", "single_flight"])
+    async def test_counts_join_only_same_options(self):
+        """Test a count only joins in-flight counts with the same hint and time limit."""
+        from data_bridge import _engine
+
+        await CrudTestUser(name="A").save()
+
+        tasks = [
+            asyncio.ensure_future(query)
+            for query in (
+                CrudTestUser.find().count(),
+                CrudTestUser.find().count(),
+                CrudTestUser.find().count(max_time_ms=5000),
+                CrudTestUser.find().count(hint="_id_"),
+            )
+        ]
+        await asyncio.sleep(0)  # Let every count start its flight
+        flights = len(_engine._in_flight.get(CrudTestUser.__collection_name__(), {}))
+        results = await asyncio.gather(*tasks)
+
+        expect(flights).to_equal(3)
+        expect(results).to_equal([1, 1, 1, 1])
+
+    @test(tags=["mongo", "crud", "single_flight"])
+    async def test_reads_after_write_see_write(self):
+        """Test a read issued after a write does not join a flight started before it."""
+        await CrudTestUser(name="First").save()
+
+        gate = asyncio.Event()
+        with count_rust_calls("count", gate) as calls:
+            before = asyncio.ensure_future(CrudTestUser.count())
+            while not calls:  # Wait until the first count is in flight
+                await asyncio.sleep(0)
+
+            await CrudTestUser(name="Second").save()
+            after = asyncio.ensure_future(CrudTestUser.count())
+            while len(calls) < 2 and not after.done():
+                await asyncio.sleep(0)
+            gate.set()
+            await asyncio.gather(before, after)
+
+        expect(len(calls)).to_equal(2)
+        expect(after.result()).to_equal(2)
+
+
 # Run tests when executed directly
 if __name__ == "__main__":
     from data_bridge.test import run_suites
@@ -438,4 +848,6 @@ if __name__ == "__main__":
         TestReplaceOperations,
         TestDistinctOperations,
         TestFindAndModify,
+        TestBatchLoading,
+        TestSingleFlight,
     ], verbose=True)
@@ -240,6 +240,44 @@ class TestEmbeddedSerialization(MongoTestSuite):
         expect(isinstance(user.tags[0], Tag)).to_be_true()
         expect(user.tags[0].label).to_equal("backend")
 
+    @test(tags=["mongo", "embedded", "serialization"])
+    async def test_embedded_layout(self):
+        """Test the embedded-field layout handed to the Rust decoder."""
+        from data_bridge.type_extraction import extract_embedded_layout
+
+        layout = extract_embedded_layout(EmbedUser)
+
+        expect(sorted(layout.keys())).to_equal(["address", "location", "tags"])
+        expect(layout["address"][1]).to_be_false()
+        expect(layout["tags"][1]).to_be_true()
+        expect(sorted(layout["location"][2].keys())).to_equal(["coords"])
+
+        address = layout["address"][0]({"city": "Austin", "zip": "78701"})
+        expect(isinstance(address, Address)).to_be_true()
+        expect(address.street).to_be_none()
+
+    @test(tags=["mongo", "embedded", "serialization"])
+    async def test_find_builds_embedded_documents(self):
+        """Test that both find() decode paths return EmbeddedDocument instances."""
+        await EmbedUser(
+            name="Frank",
+            email="frank@example.com",
+            address=Address(city="Denver", zip="80201"),
+            tags=[Tag(label="ops")],
+            location=Location(name="HQ", coords=Coordinates(lat=39.7, lng=-104.9)),
+        ).save()
+
+        # Unsorted queries decode raw BSON; sorted ones go through dicts
+        for users in (
+            await EmbedUser.find().to_list(),
+            await EmbedUser.find().sort("name").skip(0).to_list(),
+        ):
+            expect(len(users)).to_equal(1)
+            expect(isinstance(users[0].address, Address)).to_be_true()
+            expect(isinstance(users[0].tags[0], Tag)).to_be_true()
+            expect(users[0].tags[0].color).to_be_none()
+            expect(isinstance(users[0].location.coords, Coordinates)).to_be_true()
+
 
 class TestEmbeddedRoundTrip(MongoTestSuite):
     """Round-trip tests for embedded documents."""
@@ -6,14 +6,14 @@ Tests for:
 - Insert, Delete, Replace hooks
 - Async hooks
 - Revision tracking (optimistic locking)
-- State management (change tracking, rollback)
+- State management (change tracking, rollback, in-place nested changes)
 
 Migrated from test_comprehensive.py and split for maintainability.
 """
 from datetime import datetime, timezone
 from typing import Optional
 
-from data_bridge import Document, before_event, after_event, Insert, Delete, Replace
+from data_bridge import Document, EmbeddedDocument, before_event, after_event, Insert, Delete, Replace
 from data_bridge.test import test, expect
 from tests.base import MongoTestSuite
 
@@ -189,6 +189,49 @@ class TestMultipleHooks(MongoTestSuite):
         expect("before_delete:Widget" in events_log).to_be_true()
         expect("after_delete:Widget" in events_log).to_be_true()
 
+    @test(tags=["mongo", "hooks", "lifecycle"])
+    async def test_hooks_collected_at_class_creation(self):
+        """Test hook tables are built per class, including inherited hooks."""
+        from data_bridge.actions import get_registry
+
+        events_log = []
+
+        class BaseItem(Document):
+            name: str
+
+            class Settings:
+                name = "test_tracked_items"
+
+            @before_event(Insert)
+            def log_insert(self):
+                events_log.append(f"insert:{self.name}")
+
+            @before_event(Delete)
+            def log_delete(self):
+                events_log.append(f"delete:{self.name}")
+
+        class QuietItem(BaseItem):
+            def log_delete(self):
+                # Overridden without the decorator: no longer a hook
+                pass
+
+        class PlainItem(Document):
+            name: str
+
+            class Settings:
+                name = "test_tracked_items"
+
+        registry = get_registry(QuietItem)
+        expect(len(registry.get_before_handlers(Insert))).to_equal(1)
+        expect(len(registry.get_before_handlers(Delete))).to_equal(0)
+        expect(get_registry(PlainItem).has_before).to_be_false()
+
+        item = QuietItem(name="Gadget")
+        await item.save()
+        await item.delete()
+
+        expect(events_log).to_equal(["insert:Gadget"])
+
 
 class TestAsyncHook(MongoTestSuite):
     """Tests for async hook functions."""
@@ -555,6 +598,172 @@ class TestStateManagement(MongoTestSuite):
         expect(loaded.get_changes()).to_equal({"name": "Modified"})
         await doc.delete()
 
+    @test(tags=["mongo", "hooks", "state"])
+    async def test_save_writes_only_changes(self):
+        """Test save() $sets changed fields, $unsets deleted ones and skips no-op saves."""
+        class TrackedDoc(Document):
+            name: str
+            value: int = 0
+            note: str = ""
+
+            class Settings:
+                name = "test_tracked"
+                use_state_management = True
+                use_revision = True
+
+        class SharedDoc(Document):
+            name: str
+            value: int = 0
+            note: str = ""
+
+            class Settings:
+                name = "test_tracked"
+                use_state_management = True
+
+        doc = TrackedDoc(name="Test", value=10, note="draft")
+        await doc.save()
+
+        # Two copies loaded together and editing different fields do not
+        # overwrite each other
+        first = await SharedDoc.get(doc.id)
+        second = await SharedDoc.get(doc.id)
+        first.value = 20
+        second.name = "Renamed"
+        del second.note
+        await first.save()
+        await second.save()
+
+        from data_bridge import _engine
+        stored = await _engine.find_one("test_tracked", {"_id": doc.id})
+        expect(stored["name"]).to_equal("Renamed")
+        expect(stored["value"]).to_equal(20)
+        expect("note" in stored).to_be_false()
+
+        doc = await TrackedDoc.get(doc.id)
+
+        # Nothing changed: no write, revision unchanged
+        revision = doc.revision_id
+        await doc.save()
+        expect(doc.revision_id).to_equal(revision)
+        expect(doc.get_previous_changes()).to_equal({})
+        await doc.delete()
+
+    @test(tags=["mongo", "hooks", "state"])
+    async def test_save_after_refresh(self):
+        """Test refresh() resets change tracking and the revision before the next save."""
+        class TrackedDoc(Document):
+            name: str
+            value: int = 0
+
+            class Settings:
+                name = "test_tracked"
+                use_state_management = True
+                use_revision = True
+
+        doc = TrackedDoc(name="Test", value=10)
+        await doc.save()
+        doc.value = 99
+
+        # Changed elsewhere, revision included
+        from data_bridge import _engine
+        await _engine.update_one(
+            "test_tracked", {"_id": doc.id}, {"$set": {"name": "FromDB", "revision_id": 2}}
+        )
+
+        await doc.refresh()
+        expect(doc.name).to_equal("FromDB")
+        expect(doc.value).to_equal(10)
+        expect(doc.revision_id).to_equal(2)
+        expect(doc.is_changed).to_be_false()
+        expect("revision_id" in doc.to_dict()).to_be_false()
+
+        doc.name = "New"
+        await doc.save()
+        expect(doc.get_previous_changes()).to_equal({"name": "New"})
+
+        stored = await _engine.find_one("test_tracked", {"_id": doc.id})
+        expect(stored["name"]).to_equal("New")
+        expect(stored["value"]).to_equal(10)
+        expect(stored["revision_id"]).to_equal(3)
+        await doc.delete()
+
+    @test(tags=["mongo", "hooks", "state"])
+    async def test_save_with_explicit_id_writes_all_fields(self):
+        """Test a document built with an existing id writes every field on its first save."""
+        class TrackedDoc(Document):
+            name: str
+            value: int = 0
+
+            class Settings:
+                name = "test_tracked"
+                use_state_management = True
+
+        doc = TrackedDoc(name="Test", value=10)
+        await doc.save()
+
+        replacement = TrackedDoc(id=doc.id, name="Replaced", value=20)
+        await replacement.save()
+
+        loaded = await TrackedDoc.get(doc.id)
+        expect(loaded.name).to_equal("Replaced")
+        expect(loaded.value).to_equal(20)
+
+        # Later saves of the same instance only write changes
+        replacement.value = 30
+        await replacement.save()
+        expect(replacement.get_previous_changes()).to_equal({"value": 30})
+        await doc.delete()
+
+    @test(tags=["mongo", "hooks", "state"])
+    async def test_in_place_changes_saved_as_paths(self):
+        """Test in-place changes of lists, dicts and embedded documents are saved."""
+        class Address(EmbeddedDocument):
+            city: str = ""
+            visits: int = 0
+
+        class TrackedDoc(Document):
+            name: str
+            tags: list = []
+            meta: dict = {}
+            address: Optional[Address] = None
+
+            class Settings:
+                name = "test_tracked"
+                use_state_management = True
+
+        doc = TrackedDoc(name="Test", tags=["a"], meta={"views": 1}, address=Address(city="NYC"))
+        await doc.save()
+
+        # Another copy appends concurrently; $push keeps both items
+        other = await TrackedDoc.get(doc.id)
+        other.tags.append("b")
+        await other.save()
+
+        doc.tags.append("c")
+        doc.meta["views"] += 1
+        doc.meta["source"] = "api"
+        doc.address.city = "Paris"
+        doc.address.visits += 2
+        expect(doc.is_changed).to_be_true()
+        expect(doc.has_changed("meta")).to_be_true()
+        await doc.save()
+        expect(doc.is_changed).to_be_false()
+
+        loaded = await TrackedDoc.get(doc.id)
+        expect(loaded.tags).to_equal(["a", "b", "c"])
+        expect(loaded.meta).to_equal({"views": 2, "source": "api"})
+        expect(loaded.address.city).to_equal("Paris")
+        expect(loaded.address.visits).to_equal(2)
+
+        loaded.tags.remove("a")
+        del loaded.meta["source"]
+        await loaded.save()
+
+        reloaded = await TrackedDoc.get(doc.id)
+        expect(reloaded.tags).to_equal(["b", "c"])
+        expect(reloaded.meta).to_equal({"views": 2})
+        await doc.delete()
+
 
 # Run tests when executed directly
 if __name__ == "__main__":
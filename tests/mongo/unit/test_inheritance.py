@@ -243,6 +243,31 @@ class TestInheritanceCRUD(MongoTestSuite):
         expect(len(remaining)).to_equal(2)
         expect(all(isinstance(v, Car) for v in remaining)).to_be_true()
 
+    @test(tags=["mongo", "inheritance", "crud"])
+    async def test_polymorphic_loading_sorted_and_paged(self):
+        """Test polymorphic loading with sort/skip keeps concrete subclasses."""
+        await Car(name="P1", wheels=4, doors=2).save()
+        await Motorcycle(name="P2", wheels=2, has_sidecar=True).save()
+        await Vehicle(name="P3", wheels=3).save()
+
+        results = await Vehicle.find().sort("name").skip(1).to_list()
+        expect([type(v).__name__ for v in results]).to_equal(["Motorcycle", "Vehicle"])
+        expect(results[0].has_sidecar).to_be_true()
+        expect("_class_id" in results[0]._data).to_be_false()
+
+    @test(tags=["mongo", "inheritance", "crud"])
+    async def test_polymorphic_loading_batches(self):
+        """Test streaming batches build concrete subclasses."""
+        await Car(name="B1", wheels=4).save()
+        await Motorcycle(name="B2", wheels=2).save()
+        await Vehicle(name="B3", wheels=3).save()
+
+        names = []
+        async for batch in Vehicle.find().sort("name").batches(2):
+            names.extend(type(v).__name__ for v in batch)
+
+        expect(names).to_equal(["Car", "Motorcycle", "Vehicle"])
+
 
 class TestInheritanceFields(MongoTestSuite):
     """Tests for field handling in inheritance."""
@@ -5,14 +5,20 @@ Tests for:
 - Filter expressions (AND, OR, mixed)
 - Sorting (ascending, descending, multiple fields)
 - Pagination (skip, limit)
+- Columnar results (to_columns)
+- Lazy per-field decoding (Settings.lazy_decode)
+- Query result cache (Settings.use_cache)
+- Multi-aggregate statistics (stats)
+- Prepared queries (prepare() / Param)
 - Query execution with MongoDB
 
 Migrated from test_comprehensive.py and split for maintainability.
 """
-from typing import Optional
+from typing import List, Optional
 
-from data_bridge import Document
-from data_bridge.query import QueryBuilder
+from data_bridge import Document, Param
+from data_bridge.lazy import LazyFieldDict
+from data_bridge.query import QueryBuilder, Page
 from data_bridge.test import test, expect
 from tests.base import MongoTestSuite, CommonTestSuite
 
@@ -46,6 +52,30 @@ class QueryTestUser(Document):
         name = "test_query_users"
 
 
+class LazyQueryUser(Document):
+    """Test user with lazy per-field decoding."""
+    name: str
+    age: int = 0
+    bio: str = ""
+    tags: List[str] = []
+
+    class Settings:
+        name = "test_query_lazy_users"
+        lazy_decode = True
+
+
+class CachedQueryUser(Document):
+    """Test user with the query result cache enabled."""
+    name: str
+    age: int = 0
+    tags: List[str] = []
+
+    class Settings:
+        name = "test_query_cached_users"
+        use_cache = True
+        cache_capacity = 2
+
+
 # =====================
 # Unit Tests (no MongoDB)
 # =====================
@@ -183,6 +213,168 @@ class TestQueryBuilderPagination(CommonTestSuite):
         builder = QueryBuilder(MockDoc, ()).limit(0)
         expect(builder._limit_val).to_equal(0)
 
+    @test(tags=["unit", "queries"])
+    async def test_build_projection(self):
+        """Test projection is passed through unchanged for plain models."""
+        expect(F.find().project(name=1)._build_projection()).to_equal({"name": 1})
+        expect(F.find().project(email=0)._build_projection()).to_equal({"email": 0})
+        expect(F.find()._build_projection()).to_be_none()
+
+
+class TestStatsPlan(CommonTestSuite):
+    """Test stats() percentile fallback for servers without $percentile."""
+
+    async def setup(self):
+        """Pretend the server has been found to lack $percentile."""
+        from data_bridge import stats
+
+        self._native = stats._native_percentile
+        stats._native_percentile = False
+
+    async def teardown(self):
+        """Restore the detected server capability."""
+        from data_bridge import stats
+
+        stats._native_percentile = self._native
+
+    @test(tags=["unit", "queries", "stats"])
+    async def test_fallback_requires_sample(self):
+        """Test percentiles without $percentile fail unless percentile_sample is given."""
+        from data_bridge.stats import StatsPlan
+
+        async def aggregate(stages):
+            return []
+
+        error_caught = False
+        try:
+            await StatsPlan(["age"], ("count", "p50")).run(aggregate)
+        except RuntimeError:
+            error_caught = True
+        expect(error_caught).to_be_true()
+
+    @test(tags=["unit", "queries", "stats"])
+    async def test_sampled_percentiles(self):
+        """Test the fallback samples a bounded number of values and ranks them client-side."""
+        from data_bridge.stats import StatsPlan
+
+        sent = []
+
+        async def aggregate(stages):
+            sent.append(stages)
+            return [{"_id": None, "count": 10, "f0_sample": [100, 30, None, 10, 90, 20, 80, 40, 60, 50, 70]}]
+
+        stats = (await StatsPlan(["age"], ("count", "p50", "p95"), percentile_sample=500).run(aggregate))[0]
+
+        stages = sent[0]
+        expect("$set" in stages[0]).to_be_true()
+        expect(stages[1]["$group"]["f0_sample"]["$topN"]["n"]).to_equal(500)
+        expect(stats.count).to_equal(10)
+        expect(stats["age"].p50).to_equal(50)
+        expect(stats["age"].p95).to_equal(100)
+
+
+class TestQueryBuilderKeyset(CommonTestSuite):
+    """Test keyset pagination filter building."""
+
+    @test(tags=["unit", "queries"])
+    async def test_after_appends_id_tiebreaker(self):
+        """Test after() adds _id to the sort spec."""
+        builder = F.find().sort("age").after((30, "65a000000000000000000001"))
+        expect(builder._sort_spec).to_equal([("age", 1), ("_id", 1)])
+
+    @test(tags=["unit", "queries"])
+    async def test_after_builds_range_filter(self):
+        """Test after() turns sort values into a seek filter."""
+        builder = F.find().sort(("age", 1), ("name", -1)).after((30, "Bob", "abc"))
+        expect(builder._build_filter()).to_equal({
+            "$or": [
+                {"age": {"$gt": 30}},
+                {"age": 30, "name": {"$lt": "Bob"}},
+                {"age": 30, "name": "Bob", "_id": {"$gt": "abc"}},
+            ]
+        })
+
+    @test(tags=["unit", "queries"])
+    async def test_after_id_only(self):
+        """Test after() without a sort seeks on _id alone."""
+        builder = F.find(F.active == True).after({"_id": "abc"})
+        expect(builder._build_filter()).to_equal({
+            "$and": [{"active": True}, {"_id": {"$gt": "abc"}}]
+        })
+
+    @test(tags=["unit", "queries"])
+    async def test_after_none_is_noop(self):
+        """Test after(None) leaves the query unchanged."""
+        builder = F.find(F.age > 5).after(None)
+        expect(builder._build_filter()).to_equal({"age": {"$gt": 5}})
+
+    @test(tags=["unit", "queries"])
+    async def test_after_wrong_value_count(self):
+        """Test after() rejects tuples that don't match the sort spec."""
+        error_caught = False
+        try:
+            F.find().sort("age").after((30,))
+        except ValueError:
+            error_caught = True
+        expect(error_caught).to_be_true()
+
+    @test(tags=["unit", "queries"])
+    async def test_sort_after_after_rejected(self):
+        """Test sort() can't change the sort once after() captured its values."""
+        error_caught = False
+        try:
+            F.find().sort("age").after((30, "abc")).sort("name")
+        except ValueError:
+            error_caught = True
+        expect(error_caught).to_be_true()
+
+    @test(tags=["unit", "queries"])
+    async def test_after_null_value_rejected(self):
+        """Test after() refuses to seek past a null sort value."""
+        error_caught = False
+        try:
+            F.find().sort("age").after({"age": None, "_id": "abc"})
+        except ValueError:
+            error_caught = True
+        expect(error_caught).to_be_true()
+
+    @test(tags=["unit", "queries"])
+    async def test_token_sort_mismatch(self):
+        """Test a token can't be reused with a different sort order."""
+        from data_bridge.query import _encode_page_token
+
+        token = _encode_page_token([("age", 1), ("_id", 1)], (30, "abc"))
+        error_caught = False
+        try:
+            F.find().sort("-age").after(token)
+        except ValueError:
+            error_caught = True
+        expect(error_caught).to_be_true()
+
+    @test(tags=["unit", "queries"])
+    async def test_token_roundtrip(self):
+        """Test continuation tokens round-trip typed sort values."""
+        from datetime import datetime
+        from data_bridge.query import _encode_page_token, _decode_page_token
+
+        created = datetime(2024, 5, 1, 12, 30)
+        sort_spec = [("created_at", -1), ("_id", 1)]
+        token = _encode_page_token(sort_spec, (created, "abc"))
+
+        decoded_sort, values = _decode_page_token(token)
+        expect(decoded_sort).to_equal(sort_spec)
+        expect(values).to_equal((created, "abc"))
+
+    @test(tags=["unit", "queries"])
+    async def test_invalid_token(self):
+        """Test garbage tokens raise ValueError."""
+        error_caught = False
+        try:
+            F.find().after("not-a-token")
+        except ValueError:
+            error_caught = True
+        expect(error_caught).to_be_true()
+
 
 # =====================
 # Integration Tests (MongoDB)
@@ -308,6 +500,43 @@ class TestQueryExecution(MongoTestSuite):
         active = await QueryTestUser.find(QueryTestUser.status == "active").count()
         expect(active).to_equal(2)
 
+    @test(tags=["mongo", "queries"])
+    async def test_count_with_limit_and_estimate(self):
+        """Test count(limit=) stops early and estimated_count() sees the whole collection."""
+        for i in range(4):
+            await QueryTestUser(name=f"U{i}", age=i).save()
+
+        expect(await QueryTestUser.find().count(limit=2)).to_equal(2)
+        expect(await QueryTestUser.find(QueryTestUser.age > 2).count(limit=2)).to_equal(1)
+        expect(await QueryTestUser.find().count(max_time_ms=5000)).to_equal(4)
+        expect(await QueryTestUser.find(QueryTestUser.age >= 1).count(hint="_id_")).to_equal(3)
+        expect(await QueryTestUser.find().count(hint={"_id": 1}, limit=3)).to_equal(3)
+        expect(await QueryTestUser.estimated_count()).to_equal(4)
+
+    @test(tags=["mongo", "queries", "stats"])
+    async def test_stats_single_round_trip(self):
+        """Test stats() computes count, accumulators and percentiles, overall and per group."""
+        for i in range(1, 11):
+            await QueryTestUser(name=f"S{i}", age=i * 10, role="admin" if i <= 2 else "user").save()
+
+        stats = await QueryTestUser.find().stats(QueryTestUser.age)
+        expect(stats.count).to_equal(10)
+        expect(stats["age"].sum).to_equal(550)
+        expect(stats["age"].avg).to_equal(55.0)
+        expect(stats["age"].min).to_equal(10)
+        expect(stats["age"].max).to_equal(100)
+        expect(stats["age"].p50).to_equal(50)
+        expect(stats["age"].p95).to_equal(100)
+
+        per_role = await QueryTestUser.find().stats("age", ops=("count", "max"), group_by=QueryTestUser.role)
+        expect([(s.group, s.count, s["age"].max) for s in per_role]).to_equal(
+            [("admin", 2, 20), ("user", 8, 100)]
+        )
+
+        empty = await QueryTestUser.find(QueryTestUser.age > 1000).stats("age", ops=("count", "avg"))
+        expect(empty.count).to_equal(0)
+        expect(empty["age"].avg).to_be_none()
+
     @test(tags=["mongo", "queries"])
     async def test_first_and_first_or_none(self):
         """Test first() and first_or_none() methods."""
@@ -332,6 +561,409 @@ class TestQueryExecution(MongoTestSuite):
         not_exists = await QueryTestUser.find(QueryTestUser.name == "NotExists").exists()
         expect(not_exists).to_be_false()
 
+    @test(tags=["mongo", "queries"])
+    async def test_project_returns_partial_documents(self):
+        """Test project() only loads the requested fields."""
+        await QueryTestUser(name="Partial", age=41, status="vip").save()
+
+        results = await QueryTestUser.find(QueryTestUser.name == "Partial").project(name=1).to_list()
+
+        expect(len(results)).to_equal(1)
+        doc = results[0]
+        expect(doc.name).to_equal("Partial")
+        expect(doc.id).not_.to_be_none()
+        expect("age" in doc._data).to_be_false()
+        expect(doc._loaded_fields).to_equal(frozenset({"name"}))
+
+    @test(tags=["mongo", "queries"])
+    async def test_save_partial_document_keeps_unloaded_fields(self):
+        """Test saving a projected document doesn't clobber unloaded fields."""
+        await QueryTestUser(name="Keep", age=33, status="vip").save()
+
+        doc = await QueryTestUser.find(QueryTestUser.name == "Keep").project(name=1).first()
+        doc.name = "Kept"
+        await doc.save()
+
+        full = await QueryTestUser.find_one(QueryTestUser.name == "Kept")
+        expect(full.age).to_equal(33)
+        expect(full.status).to_equal("vip")
+        expect(full._loaded_fields).to_be_none()
+
+    @test(tags=["mongo", "queries"])
+    async def test_partial_document_guards(self):
+        """Test replace() and id-less saves are refused for partial documents."""
+        await QueryTestUser(name="Guard", age=20).save()
+
+        doc = await QueryTestUser.find(QueryTestUser.name == "Guard").project(name=1).first()
+        error_caught = False
+        try:
+            await doc.replace()
+        except ValueError:
+            error_caught = True
+        expect(error_caught).to_be_true()
+
+        no_id = await QueryTestUser.find(QueryTestUser.name == "Guard").project(_id=0, name=1).first()
+        expect(no_id.id).to_be_none()
+        error_caught = False
+        try:
+            await no_id.save()
+        except ValueError:
+            error_caught = True
+        expect(error_caught).to_be_true()
+        expect(await QueryTestUser.find().count()).to_equal(1)
+
+    @test(tags=["mongo", "queries"])
+    async def test_paginate_walks_all_pages(self):
+        """Test paginate() visits every document exactly once."""
+        for i in range(10):
+            # Duplicate ages exercise the _id tiebreaker
+            await QueryTestUser(name=f"Page{i}", age=i // 3).save()
+
+        query = QueryTestUser.find().sort("age")
+        page = await query.paginate(4)
+        sizes = [len(page)]
+        names = [u.name for u in page]
+        while page.has_next:
+            page = await query.after(page.next_token).paginate(4)
+            sizes.append(len(page))
+            names.extend(u.name for u in page)
+
+        expect(sizes).to_equal([4, 4, 2])
+        expect(sorted(names)).to_equal(sorted(f"Page{i}" for i in range(10)))
+        expect(len(set(names))).to_equal(10)
+
+    @test(tags=["mongo", "queries"])
+    async def test_paginate_last_page_has_no_token(self):
+        """Test an exactly-full last page reports no next page."""
+        for i in range(3):
+            await QueryTestUser(name=f"Full{i}", age=i).save()
+
+        page = await QueryTestUser.find().paginate(3)
+        expect(isinstance(page, Page)).to_be_true()
+        expect(len(page)).to_equal(3)
+        expect(page.has_next).to_be_false()
+        expect(page.next_token).to_be_none()
+
+    @test(tags=["mongo", "queries"])
+    async def test_paginate_keeps_projected_sort_fields(self):
+        """Test paginate() builds tokens when the projection omits a sort field."""
+        for i in range(5):
+            await QueryTestUser(name=f"Proj{i}", age=i).save()
+
+        query = QueryTestUser.find().sort("age").project(name=1)
+        page = await query.paginate(2)
+        names = [u.name for u in page]
+        while page.has_next:
+            page = await query.after(page.next_token).paginate(2)
+            names.extend(u.name for u in page)
+
+        expect(names).to_equal([f"Proj{i}" for i in range(5)])
+
+    @test(tags=["mongo", "queries"])
+    async def test_after_document(self):
+        """Test after() with the last document of a page."""
+        for i in range(5):
+            await QueryTestUser(name=f"Seek{i}", age=i).save()
+
+        first_page = await QueryTestUser.find().sort(("age", -1)).limit(2).to_list()
+        rest = await QueryTestUser.find().sort(("age", -1)).after(first_page[-1]).to_list()
+
+        expect([u.age for u in first_page]).to_equal([4, 3])
+        expect([u.age for u in rest]).to_equal([2, 1, 0])
+
+    @test(tags=["mongo", "queries"])
+    async def test_async_iteration(self):
+        """Test iterating a query with async for."""
+        for i in range(5):
+            await QueryTestUser(name=f"Iter{i}", age=i).save()
+
+        names = []
+        async for user in QueryTestUser.find().sort("age"):
+            names.append(user.name)
+
+        expect(names).to_equal([f"Iter{i}" for i in range(5)])
+
+    @test(tags=["mongo", "queries"])
+    async def test_batches(self):
+        """Test streaming results in fixed-size batches."""
+        for i in range(7):
+            await QueryTestUser(name=f"Batch{i}", age=i).save()
+
+        sizes = []
+        seen = []
+        async for batch in QueryTestUser.find().sort("age").batches(3):
+            sizes.append(len(batch))
+            seen.extend(user.age for user in batch)
+
+        expect(sizes).to_equal([3, 3, 1])
+        expect(seen).to_equal(list(range(7)))
+        expect(isinstance(batch[0], QueryTestUser)).to_be_true()
+
+    @test(tags=["mongo", "queries"])
+    async def test_batches_respects_filter_and_limit(self):
+        """Test batches() applies filter, sort and limit."""
+        for i in range(10):
+            await QueryTestUser(name=f"Lim{i}", age=i, status="active" if i % 2 else "inactive").save()
+
+        ages = []
+        query = QueryTestUser.find(QueryTestUser.status == "active").sort(("age", -1)).limit(3)
+        async for batch in query.batches(2):
+            ages.extend(user.age for user in batch)
+
+        expect(ages).to_equal([9, 7, 5])
+
+    @test(tags=["mongo", "queries"])
+    async def test_async_iteration_early_break(self):
+        """Test breaking out of async for closes the cursor cleanly."""
+        for i in range(5):
+            await QueryTestUser(name=f"Break{i}", age=i).save()
+
+        first = None
+        async for user in QueryTestUser.find().sort("age"):
+            first = user
+            break
+
+        expect(first.age).to_equal(0)
+
+        # Collection is still usable afterwards
+        count = await QueryTestUser.find().count()
+        expect(count).to_equal(5)
+
+    @test(tags=["mongo", "queries"])
+    async def test_batches_invalid_size(self):
+        """Test batches() rejects a non-positive batch size."""
+        error_caught = False
+        try:
+            async for _ in QueryTestUser.find().batches(0):
+                pass
+        except ValueError:
+            error_caught = True
+
+        expect(error_caught).to_be_true()
+
+    @test(tags=["mongo", "queries"])
+    async def test_to_columns_typed(self):
+        """Test to_columns() returns one typed column per field."""
+        for i in range(5):
+            await QueryTestUser(name=f"Col{i}", age=i, score=i * 1.5).save()
+
+        cols = await QueryTestUser.find().sort("age").to_columns(
+            QueryTestUser.age, QueryTestUser.score, "name"
+        )
+
+        expect(sorted(cols.keys())).to_equal(["age", "name", "score"])
+        expect(cols["age"].kind).to_equal("int64")
+        expect(cols["score"].kind).to_equal("float64")
+        expect(cols["name"].kind).to_equal("object")
+        expect([int(v) for v in cols["age"].values]).to_equal([0, 1, 2, 3, 4])
+        expect([float(v) for v in cols["score"].values]).to_equal([0.0, 1.5, 3.0, 4.5, 6.0])
+        expect(list(cols["name"].values)).to_equal([f"Col{i}" for i in range(5)])
+        expect(cols["age"].mask).to_be_none()
+
+    @test(tags=["mongo", "queries"])
+    async def test_to_columns_missing_values_masked(self):
+        """Test to_columns() masks documents missing a field."""
+        await QueryTestUser(name="A", age=1).save()
+        await QueryTestUser(name="B", age=2).save()
+        await QueryTestUser.find(QueryTestUser.name == "B").unset("age")
+
+        cols = await QueryTestUser.find().sort("name").to_columns("age")
+
+        expect(len(cols["age"])).to_equal(2)
+        expect([bool(m) for m in cols["age"].mask]).to_equal([False, True])
+
+    @test(tags=["mongo", "queries"])
+    async def test_to_columns_nested_paths(self):
+        """Test to_columns() accepts a field together with a path inside it."""
+        from data_bridge import _engine
+
+        await _engine.insert_one("test_query_users", {"name": "Meta", "meta": {"x": 7}})
+
+        cols = await QueryTestUser.find(QueryTestUser.name == "Meta").to_columns("meta", "meta.x")
+
+        expect(list(cols["meta"].values)).to_equal([{"x": 7}])
+        expect([int(v) for v in cols["meta.x"].values]).to_equal([7])
+
+    @test(tags=["mongo", "queries"])
+    async def test_to_columns_requires_fields(self):
+        """Test to_columns() rejects an empty field list."""
+        error_caught = False
+        try:
+            await QueryTestUser.find().to_columns()
+        except ValueError:
+            error_caught = True
+
+        expect(error_caught).to_be_true()
+
+    @test(tags=["mongo", "queries"])
+    async def test_lazy_decode_reads_fields_on_access(self):
+        """Test lazy_decode models decode fields on first access."""
+        await LazyQueryUser.find().delete()
+        await LazyQueryUser(name="Lazy", age=41, bio="x" * 1000, tags=["a", "b"]).save()
+
+        users = await LazyQueryUser.find().to_list()
+        user = users[0]
+
+        expect(isinstance(user._data, LazyFieldDict)).to_be_true()
+        expect(user._data.is_materialized).to_be_false()
+        expect(user.name).to_equal("Lazy")
+        expect(user.age).to_equal(41)
+        expect(user._data.is_materialized).to_be_false()
+        expect("tags" in user._data).to_be_true()
+        expect(len(user._data)).to_equal(4)
+
+        await LazyQueryUser.find().delete()
+
+    @test(tags=["mongo", "queries"])
+    async def test_lazy_decode_save_roundtrip(self):
+        """Test saving a lazily decoded document keeps untouched fields."""
+        await LazyQueryUser.find().delete()
+        await LazyQueryUser(name="Lazy", age=1, bio="keep me", tags=["t"]).save()
+
+        user = (await LazyQueryUser.find().to_list())[0]
+        user.age = 2
+        await user.save()
+
+        reloaded = await LazyQueryUser.get(user.id)
+        expect(reloaded.age).to_equal(2)
+        expect(reloaded.bio).to_equal("keep me")
+        expect(reloaded.tags).to_equal(["t"])
+        expect(reloaded.to_dict()["name"]).to_equal("Lazy")
+
+        await LazyQueryUser.find().delete()
+
+
+class TestQueryCache(MongoTestSuite):
+    """Integration tests for the query result cache (Settings.use_cache)."""
+
+    async def setup(self):
+        """Clean up test data and reset the cache counters."""
+        await CachedQueryUser.find().delete()
+        CachedQueryUser.clear_cache()
+
+    async def teardown(self):
+        """Clean up test data."""
+        await CachedQueryUser.find().delete()
+
+    @test(tags=["mongo", "queries", "cache"])
+    async def test_repeated_queries_hit_cache(self):
+        """Test find, find_one and count results are served from the cache."""
+        await CachedQueryUser(name="Alice", age=30, tags=["a"]).save()
+
+        first = await CachedQueryUser.find(CachedQueryUser.age > 20).to_list()
+        second = await CachedQueryUser.find(CachedQueryUser.age > 20).to_list()
+        await CachedQueryUser.find_one(CachedQueryUser.name == "Alice")
+        await CachedQueryUser.find_one(CachedQueryUser.name == "Alice")
+        await CachedQueryUser.count()
+        count = await CachedQueryUser.count()
+
+        stats = CachedQueryUser.cache_stats()
+        expect(stats.misses).to_equal(3)
+        expect(stats.hits).to_equal(3)
+        expect(count).to_equal(1)
+        expect(second[0].name).to_equal("Alice")
+        expect(second[0].id).to_equal(first[0].id)
+
+        # Hits are fresh instances: mutating one does not change the cache
+        expect(second[0] is first[0]).to_be_false()
+        second[0].tags.append("b")
+        third = await CachedQueryUser.find(CachedQueryUser.age > 20).to_list()
+        expect(third[0].tags).to_equal(["a"])
+
+    @test(tags=["mongo", "queries", "cache"])
+    async def test_writes_invalidate_cache(self):
+        """Test save, update_many and delete drop the collection's entries."""
+        user = CachedQueryUser(name="Bob", age=25)
+        await user.save()
+        expect(await CachedQueryUser.count()).to_equal(1)
+
+        await CachedQueryUser(name="Carol", age=35).save()
+        expect(await CachedQueryUser.count()).to_equal(2)
+
+        await CachedQueryUser.find(CachedQueryUser.name == "Bob").update({"$set": {"age": 26}})
+        found = await CachedQueryUser.find_one(CachedQueryUser.name == "Bob")
+        expect(found.age).to_equal(26)
+
+        await user.delete()
+        expect(await CachedQueryUser.count()).to_equal(1)
+        expect(CachedQueryUser.cache_stats().invalidations > 0).to_be_true()
+
+    @test(tags=["mongo", "queries", "cache"])
+    async def test_cache_capacity_evicts_lru(self):
+        """Test the least recently used query shape is evicted when full."""
+        await CachedQueryUser(name="Dan", age=40).save()
+
+        await CachedQueryUser.find(CachedQueryUser.age > 1).to_list()
+        await CachedQueryUser.find(CachedQueryUser.age > 2).to_list()
+        await CachedQueryUser.find(CachedQueryUser.age > 1).to_list()
+        await CachedQueryUser.find(CachedQueryUser.age > 3).to_list()
+
+        stats = CachedQueryUser.cache_stats()
+        expect(stats.evictions).to_equal(1)
+        expect(stats.size).to_equal(2)
+
+        # age > 1 was used most recently, so age > 2 was evicted
+        await CachedQueryUser.find(CachedQueryUser.age > 1).to_list()
+        expect(CachedQueryUser.cache_stats().hits).to_equal(2)
+
+    @test(tags=["mongo", "queries", "cache"])
+    async def test_cache_disabled_by_default(self):
+        """Test models without Settings.use_cache have no cache."""
+        expect(QueryTestUser.cache_stats()).to_be_none()
+
+
+class TestPreparedQuery(MongoTestSuite):
+    """Tests for prepared query templates."""
+
+    async def setup(self):
+        """Clean up test data."""
+        await QueryTestUser.find().delete()
+
+    async def teardown(self):
+        """Clean up test data."""
+        await QueryTestUser.find().delete()
+
+    @test(tags=["unit", "queries", "prepared"])
+    async def test_bind_fills_placeholders(self):
+        """Test bind() substitutes values without touching the template."""
+        prepared = F.find(F.age > Param("min_age"), F.role.in_(Param("roles"))).prepare()
+
+        expect(prepared.params).to_equal(frozenset({"min_age", "roles"}))
+        expect(prepared.bind(min_age=30, roles=["admin"])).to_equal(
+            {"age": {"$gt": 30}, "role": {"$in": ["admin"]}}
+        )
+        expect(prepared.bind(min_age=40, roles=[])).to_equal(
+            {"age": {"$gt": 40}, "role": {"$in": []}}
+        )
+
+    @test(tags=["unit", "queries", "prepared"])
+    async def test_bind_rejects_missing_and_unknown(self):
+        """Test every placeholder must be bound and unknown names are rejected."""
+        prepared = F.find(F.name == Param("name")).prepare()
+
+        for params in ({}, {"name": "Alice", "age": 3}):
+            error_caught = False
+            try:
+                prepared.bind(**params)
+            except ValueError:
+                error_caught = True
+            expect(error_caught).to_be_true()
+
+    @test(tags=["mongo", "queries", "prepared"])
+    async def test_prepared_query_executes(self):
+        """Test one template runs with different bound values."""
+        await QueryTestUser(name="Alice", age=30).save()
+        await QueryTestUser(name="Bob", age=25).save()
+        await QueryTestUser(name="Carol", age=40).save()
+
+        by_name = QueryTestUser.find(QueryTestUser.name == Param("name")).prepare()
+        older = QueryTestUser.find(QueryTestUser.age > Param("age")).sort("age").prepare()
+
+        expect((await by_name.first(name="Bob")).age).to_equal(25)
+        expect(await by_name.first(name="Nobody")).to_be_none()
+        expect([u.name for u in await older.to_list(age=26)]).to_equal(["Alice", "Carol"])
+        expect(await older.count(age=35)).to_equal(1)
+
 
 # Run tests when executed directly
 if __name__ == "__main__":
@@ -341,5 +973,9 @@ if __name__ == "__main__":
         TestQueryBuilderFilters,
         TestQueryBuilderSorting,
         TestQueryBuilderPagination,
+        TestStatsPlan,
+        TestQueryBuilderKeyset,
         TestQueryExecution,
+        TestQueryCache,
+        TestPreparedQuery,
     ], verbose=True)
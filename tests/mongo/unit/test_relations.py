@@ -4,7 +4,7 @@ Tests for full relations support.
 Tests for:
 - WriteRules (cascade save)
 - DeleteRules (cascade delete)
-- fetch_links parameter on queries
+- fetch_links parameter on queries (batch and $lookup strategies)
 - fetch_all_links() method
 - Link and BackLink classes
 
@@ -77,6 +77,20 @@ class BlogPost(Document):
         name = "test_blog_posts_relations"
 
 
+class Listing(Document):
+    """Root of a hierarchy whose subclass declares its own link."""
+    title: str
+
+    class Settings:
+        name = "test_listings_relations"
+        is_root = True
+
+
+class SponsoredListing(Listing):
+    """Listing subclass with a Link only it declares."""
+    sponsor: Link[Author] = None
+
+
 # =====================
 # WriteRules Tests
 # =====================
@@ -230,6 +244,7 @@ class TestFetchLinks(MongoTestSuite):
         await _engine.delete_many("test_categories_relations", {})
         await _engine.delete_many("test_blog_posts_relations", {})
         await _engine.delete_many("test_articles_optional_relations", {})
+        await _engine.delete_many("test_listings_relations", {})
 
     async def teardown(self):
         """Clean up test collections."""
@@ -239,6 +254,7 @@ class TestFetchLinks(MongoTestSuite):
         await _engine.delete_many("test_categories_relations", {})
         await _engine.delete_many("test_blog_posts_relations", {})
         await _engine.delete_many("test_articles_optional_relations", {})
+        await _engine.delete_many("test_listings_relations", {})
 
     @test(tags=["mongo", "relations", "fetch-links"])
     async def test_find_one_without_fetch_links(self):
@@ -323,6 +339,73 @@ class TestFetchLinks(MongoTestSuite):
         expect(found.author._document).not_.to_be_none()
         expect(found.category._document).not_.to_be_none()
 
+    @test(tags=["mongo", "relations", "fetch-links"])
+    async def test_fetch_links_batches_backlinks(self):
+        """Test BackLinks of a whole result list are grouped back to their parents."""
+        mia = Author(name="Mia", bio="Essayist")
+        ned = Author(name="Ned", bio="Critic")
+        quiet = Author(name="Olga", bio="No posts")
+        await mia.save()
+        await ned.save()
+        await quiet.save()
+
+        await Article(title="Essay 1", author=Link(mia)).save()
+        await Article(title="Essay 2", author=Link(mia)).save()
+        await Article(title="Review", author=Link(ned)).save()
+
+        authors = await Author.find().sort("name").fetch_links().to_list()
+
+        expect([author.name for author in authors]).to_equal(["Mia", "Ned", "Olga"])
+        expect(sorted(post.title for post in authors[0].posts)).to_equal(["Essay 1", "Essay 2"])
+        expect([post.title for post in authors[1].posts]).to_equal(["Review"])
+        expect(len(authors[2].posts)).to_equal(0)
+
+    @test(tags=["mongo", "relations", "fetch-links"])
+    async def test_fetch_links_lookup_strategy(self):
+        """Test strategy="lookup" resolves Links and nested BackLinks in one aggregation."""
+        pia = Author(name="Pia", bio="Poet")
+        await pia.save()
+        await Article(title="Poem 1", author=Link(pia)).save()
+        await Article(title="Poem 2", author=Link(pia)).save()
+
+        articles = await Article.find().sort("title").fetch_links(depth=2, strategy="lookup").to_list()
+
+        expect([article.title for article in articles]).to_equal(["Poem 1", "Poem 2"])
+        author = articles[0].author._document
+        expect(author).not_.to_be_none()
+        expect(author.name).to_equal("Pia")
+        expect(sorted(post.title for post in author.posts)).to_equal(["Poem 1", "Poem 2"])
+
+        authors = await Author.find(Author.name == "Pia").fetch_links(strategy="lookup").to_list()
+        expect(len(authors[0].posts)).to_equal(2)
+
+    @test(tags=["mongo", "relations", "fetch-links"])
+    async def test_fetch_links_lookup_subclass_links(self):
+        """Test strategy="lookup" joins the links declared by subclasses of the queried class."""
+        sam = Author(name="Sam", bio="Sponsor")
+        await sam.save()
+        await Listing(title="Plain").save()
+        await SponsoredListing(title="Paid", sponsor=Link(sam)).save()
+
+        listings = await Listing.find().sort("title").fetch_links(strategy="lookup").to_list()
+
+        expect([type(listing).__name__ for listing in listings]).to_equal(["SponsoredListing", "Listing"])
+        sponsor = listings[0].sponsor._document
+        expect(sponsor).not_.to_be_none()
+        expect(sponsor.name).to_equal("Sam")
+        expect("sponsor" in listings[1]._data).to_be_false()
+
+    @test(tags=["mongo", "relations", "fetch-links"])
+    async def test_fetch_links_unknown_strategy(self):
+        """Test fetch_links rejects an unknown strategy."""
+        error_caught = False
+        try:
+            Article.find().fetch_links(strategy="join")
+        except ValueError:
+            error_caught = True
+
+        expect(error_caught).to_be_true()
+
     @test(tags=["mongo", "relations", "fetch-links"])
     async def test_fetch_links_no_link_field(self):
         """Test that fetch_links handles documents without link fields gracefully."""
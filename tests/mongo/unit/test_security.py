@@ -121,6 +121,35 @@ class TestNoSQLInjectionPrevention(MongoTestSuite):
 
         expect(error_caught).to_be_true()
 
+    @test(tags=["security", "nosql-injection"])
+    async def test_where_operator_blocked_through_document_api(self):
+        """CRITICAL: Block $where on every Document read path, not only _engine.find_one."""
+        user = SecureUser(email="test@example.com", password_hash="hashed")
+        await user.save()
+
+        where = {"$where": "this.email == 'test@example.com'"}
+
+        async def first_batch():
+            async for batch in SecureUser.find(where).batches(10):
+                return batch
+
+        attempts = [
+            lambda: SecureUser.find_one(where),
+            lambda: SecureUser.find(where).to_list(),
+            first_batch,
+            lambda: SecureUser.find(where).to_columns("email"),
+        ]
+        for attempt in attempts:
+            error_caught = False
+            try:
+                await attempt()
+            except Exception as e:
+                error_caught = True
+                error_msg = str(e).lower()
+                has_expected_error = "$where" in error_msg or "validation" in error_msg or "dangerous" in error_msg
+                expect(has_expected_error).to_be_true()
+            expect(error_caught).to_be_true()
+
     @test(tags=["security", "nosql-injection"])
     async def test_function_operator_blocked(self):
         """CRITICAL: Block $function operator (MongoDB 4.4+) code execution."""
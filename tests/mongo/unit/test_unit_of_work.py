@@ -0,0 +1,214 @@
+"""
+Tests for unit_of_work() scopes.
+
+Tests for:
+- Identity map (get, find_one, find, Link.fetch, fetch_all_links)
+- Dirty tracking and flush on exit
+- Per-document revision conflicts in flush
+- Discarding changes when the scope raises
+"""
+from data_bridge import Document, Link, unit_of_work
+from data_bridge.test import test, expect
+from tests.base import MongoTestSuite
+
+
+# =====================
+# Test Document Classes
+# =====================
+
+class UowAuthor(Document):
+    """Author document for unit-of-work tests."""
+    name: str
+    posts: int = 0
+
+    class Settings:
+        name = "test_uow_authors"
+
+
+class UowArticle(Document):
+    """Article document linking to an author."""
+    title: str
+    author: Link[UowAuthor] = None
+
+    class Settings:
+        name = "test_uow_articles"
+
+
+class UowVersioned(Document):
+    """Document with revision tracking and state management."""
+    name: str
+
+    class Settings:
+        name = "test_uow_versioned"
+        use_revision = True
+        use_state_management = True
+
+
+class TestUnitOfWork(MongoTestSuite):
+    """Tests for the unit-of-work identity map and flush."""
+
+    async def setup(self):
+        """Clean up test collections."""
+        from data_bridge import _engine
+        await _engine.delete_many("test_uow_authors", {})
+        await _engine.delete_many("test_uow_articles", {})
+        await _engine.delete_many("test_uow_versioned", {})
+
+    async def teardown(self):
+        """Clean up test collections."""
+        from data_bridge import _engine
+        await _engine.delete_many("test_uow_authors", {})
+        await _engine.delete_many("test_uow_articles", {})
+        await _engine.delete_many("test_uow_versioned", {})
+
+    @test(tags=["mongo", "unit_of_work"])
+    async def test_loads_return_same_instance(self):
+        """Test repeated loads in one scope return the same instance."""
+        author = UowAuthor(name="Alice")
+        await author.save()
+
+        async with unit_of_work() as uow:
+            first = await UowAuthor.get(author.id)
+            second = await UowAuthor.find_one({"_id": author.id})
+            listed = await UowAuthor.find().to_list()
+            fetched = await Link(author.id, document_class=UowAuthor).fetch()
+
+            expect(first is second).to_be_true()
+            expect(listed[0] is first).to_be_true()
+            expect(fetched is first).to_be_true()
+            expect(len(uow)).to_equal(1)
+
+        # Outside the scope every load builds a new instance
+        expect(await UowAuthor.get(author.id) is first).to_be_false()
+
+    @test(tags=["mongo", "unit_of_work"])
+    async def test_fetch_all_links_uses_identity_map(self):
+        """Test fetch_all_links resolves links to instances already in the scope."""
+        author = UowAuthor(name="Bob")
+        await author.save()
+        article = UowArticle(title="Hello", author=Link(author, document_class=UowAuthor))
+        await article.save()
+
+        async with unit_of_work():
+            loaded_author = await UowAuthor.get(author.id)
+            loaded_article = await UowArticle.get(article.id)
+            await loaded_article.fetch_all_links()
+
+            expect(loaded_article.author._document is loaded_author).to_be_true()
+
+    @test(tags=["mongo", "unit_of_work"])
+    async def test_dirty_documents_flushed_on_exit(self):
+        """Test assigned fields are saved when the scope exits."""
+        alice = UowAuthor(name="Alice")
+        await alice.save()
+        bob = UowAuthor(name="Bob")
+        await bob.save()
+
+        async with unit_of_work() as uow:
+            for author in await UowAuthor.find().to_list():
+                author.posts = 3
+            expect(len(uow.dirty)).to_equal(2)
+
+        for author in await UowAuthor.find().to_list():
+            expect(author.posts).to_equal(3)
+
+    @test(tags=["mongo", "unit_of_work"])
+    async def test_flush_advances_revision(self):
+        """Test flush uses the same revision check as save()."""
+        doc = UowVersioned(name="v1")
+        await doc.save()
+
+        async with unit_of_work() as uow:
+            loaded = await UowVersioned.get(doc.id)
+            loaded.name = "v2"
+            written = await uow.flush()
+            expect(written).to_equal(1)
+            expect(loaded.revision_id).to_equal(2)
+            expect(loaded.is_changed).to_be_false()
+
+        reloaded = await UowVersioned.get(doc.id)
+        expect(reloaded.name).to_equal("v2")
+
+    @test(tags=["mongo", "unit_of_work"])
+    async def test_flush_conflict_keeps_other_writes(self):
+        """Test a conflicting document stays dirty while the other documents are written."""
+        from data_bridge import RevisionConflictError, _engine
+
+        stale = UowVersioned(name="a1")
+        await stale.save()
+        fresh = UowVersioned(name="b1")
+        await fresh.save()
+        author = UowAuthor(name="Erin")
+        await author.save()
+
+        async with unit_of_work(flush_on_exit=False) as uow:
+            loaded_stale = await UowVersioned.get(stale.id)
+            loaded_fresh = await UowVersioned.get(fresh.id)
+            loaded_author = await UowAuthor.get(author.id)
+
+            # Changed by another process
+            await _engine.update_one("test_uow_versioned", {"_id": stale.id}, {"$set": {"revision_id": 2}})
+
+            loaded_stale.name = "a2"
+            loaded_fresh.name = "b2"
+            loaded_author.posts = 5
+
+            error_caught = False
+            try:
+                await uow.flush()
+            except RevisionConflictError as e:
+                error_caught = True
+                expect(e.documents).to_equal([loaded_stale])
+            expect(error_caught).to_be_true()
+
+            expect(uow.dirty).to_equal([loaded_stale])
+            expect(loaded_stale.revision_id).to_equal(1)
+            expect(loaded_fresh.revision_id).to_equal(2)
+            expect(loaded_fresh.is_changed).to_be_false()
+
+        expect((await UowVersioned.get(fresh.id)).name).to_equal("b2")
+        expect((await UowVersioned.get(stale.id)).name).to_equal("a1")
+        expect((await UowAuthor.get(author.id)).posts).to_equal(5)
+
+    @test(tags=["mongo", "unit_of_work"])
+    async def test_exception_discards_changes(self):
+        """Test nothing is flushed when the scope raises."""
+        author = UowAuthor(name="Carol")
+        await author.save()
+
+        error_caught = False
+        try:
+            async with unit_of_work():
+                loaded = await UowAuthor.get(author.id)
+                loaded.posts = 10
+                raise RuntimeError("abort")
+        except RuntimeError:
+            error_caught = True
+
+        expect(error_caught).to_be_true()
+        reloaded = await UowAuthor.get(author.id)
+        expect(reloaded.posts).to_equal(0)
+
+    @test(tags=["mongo", "unit_of_work"])
+    async def test_deleted_document_leaves_identity_map(self):
+        """Test delete() removes the document from the scope."""
+        author = UowAuthor(name="Dan")
+        await author.save()
+
+        async with unit_of_work() as uow:
+            loaded = await UowAuthor.get(author.id)
+            loaded.posts = 1
+            await loaded.delete()
+
+            expect(len(uow)).to_equal(0)
+            expect(uow.dirty).to_equal([])
+            expect(await UowAuthor.get(author.id)).to_be_none()
+
+
+# Run tests when executed directly
+if __name__ == "__main__":
+    from data_bridge.test import run_suites
+
+    run_suites([
+        TestUnitOfWork,
+    ], verbose=True)